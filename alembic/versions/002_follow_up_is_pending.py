@@ -0,0 +1,47 @@
+"""Add generated is_pending column to follow_ups
+
+Revision ID: 002_follow_up_is_pending
+Revises: 001_initial_schema
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_follow_up_is_pending'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Materialize the pending predicate (not sent, not cancelled)
+    op.add_column(
+        'follow_ups',
+        sa.Column(
+            'is_pending',
+            sa.Boolean(),
+            sa.Computed('sent_at IS NULL AND NOT cancelled', persisted=True),
+        ),
+    )
+
+    # Partial indexes over pending rows only
+    op.create_index(
+        'ix_follow_ups_pending',
+        'follow_ups',
+        ['lead_id', 'scheduled_at'],
+        postgresql_where=sa.text('is_pending'),
+    )
+    op.create_index(
+        'ix_follow_ups_due',
+        'follow_ups',
+        ['scheduled_at'],
+        postgresql_where=sa.text('is_pending'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_follow_ups_due', table_name='follow_ups')
+    op.drop_index('ix_follow_ups_pending', table_name='follow_ups')
+    op.drop_column('follow_ups', 'is_pending')
@@ -0,0 +1,27 @@
+"""Use LZ4 TOAST compression for metadata columns
+
+Revision ID: 003_metadata_lz4_compression
+Revises: 002_follow_up_is_pending
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_metadata_lz4_compression'
+down_revision = '002_follow_up_is_pending'
+branch_labels = None
+depends_on = None
+
+# Tables with a JSONB "metadata" column (requires PostgreSQL 14+ built with lz4)
+METADATA_TABLES = ['leads', 'conversations', 'messages', 'state_transitions']
+
+
+def upgrade() -> None:
+    for table in METADATA_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN metadata SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table in METADATA_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN metadata SET COMPRESSION pglz")
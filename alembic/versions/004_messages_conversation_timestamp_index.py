@@ -0,0 +1,29 @@
+"""Add composite (conversation_id, timestamp) index on messages
+
+Revision ID: 004_messages_conversation_timestamp_index
+Revises: 003_metadata_lz4_compression
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004_messages_conversation_timestamp_index'
+down_revision = '003_metadata_lz4_compression'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_conversation_id_timestamp',
+        'messages',
+        ['conversation_id', 'timestamp'],
+    )
+    # Superseded by the composite index for conversation history reads
+    op.drop_index('ix_messages_timestamp', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index('ix_messages_timestamp', 'messages', ['timestamp'])
+    op.drop_index('ix_messages_conversation_id_timestamp', table_name='messages')
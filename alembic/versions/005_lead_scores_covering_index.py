@@ -0,0 +1,31 @@
+"""Add covering (lead_id, calculated_at DESC) index on lead_scores
+
+Revision ID: 005_lead_scores_covering_index
+Revises: 004_messages_conversation_timestamp_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_lead_scores_covering_index'
+down_revision = '004_messages_conversation_timestamp_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_lead_scores_lead_id_calculated_at',
+        'lead_scores',
+        ['lead_id', sa.text('calculated_at DESC')],
+        postgresql_include=['score_category', 'total_score', 'triggered_handover'],
+    )
+    # Leading column of the composite index serves lead_id lookups
+    op.drop_index('ix_lead_scores_lead_id', table_name='lead_scores')
+
+
+def downgrade() -> None:
+    op.create_index('ix_lead_scores_lead_id', 'lead_scores', ['lead_id'])
+    op.drop_index('ix_lead_scores_lead_id_calculated_at', table_name='lead_scores')
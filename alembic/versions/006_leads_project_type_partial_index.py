@@ -0,0 +1,28 @@
+"""Add partial index on leads.project_type
+
+Revision ID: 006_leads_project_type_partial_index
+Revises: 005_lead_scores_covering_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_leads_project_type_partial_index'
+down_revision = '005_lead_scores_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_leads_project_type',
+        'leads',
+        ['project_type'],
+        postgresql_where=sa.text('project_type IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leads_project_type', table_name='leads')
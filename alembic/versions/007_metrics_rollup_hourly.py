@@ -0,0 +1,72 @@
+"""Add hourly metrics rollup
+
+Revision ID: 007_metrics_rollup_hourly
+Revises: 006_leads_project_type_partial_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_metrics_rollup_hourly'
+down_revision = '006_leads_project_type_partial_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'metrics_rollup_hourly',
+        sa.Column('hour_bucket', sa.DateTime(), primary_key=True),
+        sa.Column('messages_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('new_leads', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('new_conversations', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('response_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('avg_response_ms', sa.Float(), nullable=True),
+    )
+
+    # Backfill from existing rows; the metrics worker keeps recent hours
+    # current from here on
+    op.execute("""
+        WITH replies AS (
+            SELECT
+                date_trunc('hour', timestamp) AS hour_bucket,
+                CASE
+                    WHEN sender <> 'LEAD' AND prev_sender = 'LEAD'
+                    THEN extract(epoch FROM timestamp - prev_ts) * 1000
+                END AS response_ms
+            FROM (
+                SELECT
+                    sender,
+                    timestamp,
+                    lag(sender) OVER w AS prev_sender,
+                    lag(timestamp) OVER w AS prev_ts
+                FROM messages
+                WINDOW w AS (PARTITION BY conversation_id ORDER BY timestamp)
+            ) m
+        ),
+        activity AS (
+            SELECT hour_bucket, count(*) AS messages_count, 0 AS new_leads,
+                   0 AS new_conversations, count(response_ms) AS response_count,
+                   avg(response_ms) AS avg_response_ms
+            FROM replies GROUP BY hour_bucket
+            UNION ALL
+            SELECT date_trunc('hour', created_at), 0, count(*), 0, 0, NULL
+            FROM leads GROUP BY 1
+            UNION ALL
+            SELECT date_trunc('hour', started_at), 0, 0, count(*), 0, NULL
+            FROM conversations GROUP BY 1
+        )
+        INSERT INTO metrics_rollup_hourly
+            (hour_bucket, messages_count, new_leads, new_conversations,
+             response_count, avg_response_ms)
+        SELECT hour_bucket, sum(messages_count), sum(new_leads), sum(new_conversations),
+               sum(response_count), max(avg_response_ms)
+        FROM activity
+        GROUP BY hour_bucket
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('metrics_rollup_hourly')
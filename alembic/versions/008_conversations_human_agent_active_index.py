@@ -0,0 +1,28 @@
+"""Add partial index for per-agent active conversation counts
+
+Revision ID: 008_conversations_human_agent_active_index
+Revises: 007_metrics_rollup_hourly
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_conversations_human_agent_active_index'
+down_revision = '007_metrics_rollup_hourly'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_conversations_human_agent_active',
+        'conversations',
+        ['human_agent_id'],
+        postgresql_where=sa.text('NOT is_bot_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversations_human_agent_active', table_name='conversations')
@@ -0,0 +1,47 @@
+"""Allow at most one open conversation per lead
+
+Revision ID: 009_conversations_lead_active_unique
+Revises: 008_conversations_human_agent_active_index
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_conversations_lead_active_unique'
+down_revision = '008_conversations_human_agent_active_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Close all but the most recent open conversation per lead so the
+    # unique index can be built
+    op.execute(
+        """
+        UPDATE conversations c
+        SET ended_at = now() AT TIME ZONE 'UTC'
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY lead_id ORDER BY started_at DESC
+                   ) AS rn
+            FROM conversations
+            WHERE ended_at IS NULL
+        ) ranked
+        WHERE c.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    op.create_index(
+        'uq_conversations_lead_active',
+        'conversations',
+        ['lead_id'],
+        unique=True,
+        postgresql_where=sa.text('ended_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_conversations_lead_active', table_name='conversations')
@@ -0,0 +1,35 @@
+"""Add partial indexes for the data retention cleanup
+
+Revision ID: 010_retention_cleanup_partial_indexes
+Revises: 009_conversations_lead_active_unique
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_retention_cleanup_partial_indexes'
+down_revision = '009_conversations_lead_active_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_leads_cleanup',
+        'leads',
+        ['updated_at'],
+        postgresql_where=sa.text("current_state IN ('EXIT', 'PARK')"),
+    )
+    op.create_index(
+        'ix_conversations_ended_at',
+        'conversations',
+        ['ended_at'],
+        postgresql_where=sa.text('ended_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_conversations_ended_at', table_name='conversations')
+    op.drop_index('ix_leads_cleanup', table_name='leads')
@@ -0,0 +1,35 @@
+"""Widen the per-agent load index to pending handovers
+
+Revision ID: 011_conversations_human_agent_load_index
+Revises: 010_retention_cleanup_partial_indexes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_conversations_human_agent_load_index'
+down_revision = '010_retention_cleanup_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_conversations_human_agent_load',
+        'conversations',
+        ['human_agent_id'],
+        postgresql_where=sa.text("NOT is_bot_active OR current_state = 'HUMAN_HANDOVER'"),
+    )
+    op.drop_index('ix_conversations_human_agent_active', table_name='conversations')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_conversations_human_agent_active',
+        'conversations',
+        ['human_agent_id'],
+        postgresql_where=sa.text('NOT is_bot_active'),
+    )
+    op.drop_index('ix_conversations_human_agent_load', table_name='conversations')
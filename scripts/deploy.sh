@@ -35,6 +35,10 @@ python "$SCRIPT_DIR/validate_quickstart.py" || {
 # Step 2: Run tests
 echo ""
 echo "Step 2: Running tests..."
+# Coverage on sys.monitoring (PEP 669) where available: no per-line trace hook
+if python -c 'import sys; sys.exit(sys.version_info < (3, 12))'; then
+    export COVERAGE_CORE="${COVERAGE_CORE:-sysmon}"
+fi
 pytest tests/ -v --cov=src --cov-report=term-missing || {
     echo "Tests failed!"
     exit 1
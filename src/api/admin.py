@@ -368,15 +368,13 @@ async def delete_proof_asset(
         No content
     """
     repo = ProofAssetRepository(db)
-    asset = await repo.get_by_id(asset_id)
 
-    if not asset:
+    if not await repo.delete(asset_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Proof asset {asset_id} not found"
         )
 
-    await repo.delete(asset_id)
     await db.commit()
 
     return None
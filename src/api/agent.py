@@ -242,7 +242,8 @@ async def send_agent_message(
         message = await message_repo.create(
             conversation.id,
             Sender.HUMAN,
-            request.content
+            request.content,
+            flush=True,
         )
 
         # Send via WhatsApp
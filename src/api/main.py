@@ -13,6 +13,7 @@ from src.api.health import router as health_router
 from src.api.agent import router as agent_router
 from src.api.admin import router as admin_router
 from src.api.gdpr import router as gdpr_router
+from src.db.connection import warm_pool, dispose_engine
 
 
 @asynccontextmanager
@@ -20,9 +21,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     print("Starting Meetech Lead Qualification Bot...")
+    warmed = await warm_pool()
+    print(f"Database pool warmed with {warmed} connections")
     yield
     # Shutdown
     print("Shutting down...")
+    await dispose_engine()
 
 
 # Create FastAPI application
@@ -5,7 +5,7 @@ import hashlib
 import os
 from dotenv import load_dotenv
 
-from src.services.message_processor import MessageProcessor
+from src.services.message_processor import MessageProcessor, mark_message_processed
 from src.db.connection import get_db_session
 from src.utils.logger import get_logger
 
@@ -72,6 +72,10 @@ async def receive_webhook(request: Request):
                 whatsapp_message_id=message_data["message_id"],
             )
 
+        # The turn is committed; remember the ID so redeliveries short-circuit
+        if result["status"] in ("success", "pricing_deferred", "human_active"):
+            mark_message_processed(message_data["message_id"])
+
         logger.info("Message processed", result=result["status"])
 
         return {"status": "received", "message_id": message_data["message_id"]}
@@ -8,6 +8,11 @@ load_dotenv()
 # Redis URL from environment
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# Connection pool settings; the pool is shared by every RedisClient in the process
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "50"))
+# Seconds a connection may sit idle before it is PINGed on checkout
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
 # Global Redis client
 _redis_client: Optional[Redis] = None
 
@@ -21,7 +26,8 @@ async def get_redis_client() -> Redis:
             REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
-            max_connections=50,
+            max_connections=REDIS_POOL_SIZE,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
         )
 
     return _redis_client
@@ -43,11 +49,13 @@ class RedisClient:
         self.client: Optional[Redis] = None
 
     async def connect(self) -> None:
-        """Connect to Redis."""
-        self.client = await get_redis_client()
+        """Connect to Redis (no-op once connected)."""
+        if self.client is None:
+            self.client = await get_redis_client()
 
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        self.client = None
         await close_redis_client()
 
     async def get(self, key: str) -> Optional[str]:
@@ -154,13 +154,24 @@ class AnthropicLLMClient(LLMClient):
         }
 
 
+# Clients per provider; services are built per message and share these
+_llm_clients: Dict[str, LLMClient] = {}
+
+
 def get_llm_client() -> LLMClient:
-    """Factory function to get LLM client based on provider."""
+    """Factory function to get the shared LLM client for the configured provider."""
     provider = os.getenv("LLM_PROVIDER", "openai").lower()
 
+    client = _llm_clients.get(provider)
+    if client is not None:
+        return client
+
     if provider == "openai":
-        return OpenAILLMClient()
+        client = OpenAILLMClient()
     elif provider == "anthropic":
-        return AnthropicLLMClient()
+        client = AnthropicLLMClient()
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    _llm_clients[provider] = client
+    return client
@@ -72,13 +72,26 @@ class MetaWhatsAppClient(WhatsAppClient):
         return True
 
 
+# One client per provider, built on first use: MessageProcessor,
+# FollowUpScheduler and the agent API all send through it, and credentials
+# are read from the environment once instead of per send
+_whatsapp_clients: Dict[str, WhatsAppClient] = {}
+
+
 def get_whatsapp_client() -> WhatsAppClient:
-    """Factory function to get WhatsApp client based on provider."""
+    """Factory function to get the shared WhatsApp client for the configured provider."""
     provider = os.getenv("WHATSAPP_PROVIDER", "meta").lower()
 
+    client = _whatsapp_clients.get(provider)
+    if client is not None:
+        return client
+
     if provider == "twilio":
-        return TwilioWhatsAppClient()
+        client = TwilioWhatsAppClient()
     elif provider == "meta":
-        return MetaWhatsAppClient()
+        client = MetaWhatsAppClient()
     else:
         raise ValueError(f"Unsupported WhatsApp provider: {provider}")
+
+    _whatsapp_clients[provider] = client
+    return client
@@ -11,6 +11,7 @@ from src.models.state_transition import StateTransition
 from src.models.proof_asset import ProofAsset
 from src.models.follow_up import FollowUp
 from src.models.human_agent import HumanAgent
+from src.models.metrics_rollup import MetricsRollupHourly
 
 __all__ = [
     "Base",
@@ -22,4 +23,5 @@ __all__ = [
     "ProofAsset",
     "FollowUp",
     "HumanAgent",
+    "MetricsRollupHourly",
 ]
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Boolean, Integer, DateTime, Enum as SQLEnum, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Boolean, Integer, DateTime, Enum as SQLEnum, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -12,6 +12,28 @@ class Conversation(Base):
     """Conversation model representing a message exchange session."""
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Per-agent load: conversations under human control or reserved
+        # for an agent by a pending handover
+        Index(
+            "ix_conversations_human_agent_load",
+            "human_agent_id",
+            postgresql_where=text("NOT is_bot_active OR current_state = 'HUMAN_HANDOVER'"),
+        ),
+        # At most one open conversation per lead; conflict target for get_or_create_active
+        Index(
+            "uq_conversations_lead_active",
+            "lead_id",
+            unique=True,
+            postgresql_where=text("ended_at IS NULL"),
+        ),
+        # Retention archive: ended conversations by end time
+        Index(
+            "ix_conversations_ended_at",
+            "ended_at",
+            postgresql_where=text("ended_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"), nullable=False, index=True)
@@ -34,12 +56,22 @@ class Conversation(Base):
     message_count = Column(Integer, nullable=False, default=0)
 
     # Flexible metadata (renamed from 'metadata' to avoid SQLAlchemy conflict)
-    extra_metadata = Column("metadata", JSON, nullable=True)
+    extra_metadata = Column("metadata", JSONB, nullable=True)
 
     # Relationships
     lead = relationship("Lead", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
-    state_transitions = relationship("StateTransition", back_populates="conversation", cascade="all, delete-orphan")
+    # Child rows are removed by the database (ON DELETE CASCADE), not loaded by the ORM
+    messages = relationship(
+        "Message",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Message.timestamp",
+    )
+    # State transitions are an append-only event log; never touched on conversation delete
+    state_transitions = relationship(
+        "StateTransition", back_populates="conversation", passive_deletes="all"
+    )
 
     def __repr__(self) -> str:
         return f"<Conversation(id={self.id}, lead_id={self.lead_id}, state={self.current_state})>"
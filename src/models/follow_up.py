@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Text, Integer, Boolean, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import (
+    Column, Text, Integer, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Computed, Index, text
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -12,6 +14,19 @@ class FollowUp(Base):
     """FollowUp model for tracking automated follow-up messages."""
 
     __tablename__ = "follow_ups"
+    __table_args__ = (
+        Index(
+            "ix_follow_ups_pending", "lead_id", "scheduled_at",
+            postgresql_where=text("is_pending"),
+        ),
+        Index(
+            "ix_follow_ups_due", "scheduled_at",
+            postgresql_where=text("is_pending"),
+        ),
+    )
+    # Fetch the generated is_pending column via RETURNING on UPDATE as well
+    # as INSERT, instead of expiring it and reloading on next access
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"), nullable=False, index=True)
@@ -30,6 +45,7 @@ class FollowUp(Base):
 
     # Status
     cancelled = Column(Boolean, nullable=False, default=False)
+    is_pending = Column(Boolean, Computed("sent_at IS NULL AND NOT cancelled", persisted=True))
 
     # Message content
     message_content = Column(Text, nullable=True)
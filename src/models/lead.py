@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, DateTime, Enum as SQLEnum, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -12,6 +12,20 @@ class Lead(Base):
     """Lead model representing a potential client."""
 
     __tablename__ = "leads"
+    __table_args__ = (
+        # Partial index: project type breakdowns only ever count non-null values
+        Index(
+            "ix_leads_project_type",
+            "project_type",
+            postgresql_where=text("project_type IS NOT NULL"),
+        ),
+        # Retention cleanup: parked/exited leads by last update
+        Index(
+            "ix_leads_cleanup",
+            "updated_at",
+            postgresql_where=text("current_state IN ('EXIT', 'PARK')"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     phone_number = Column(String(20), unique=True, nullable=False, index=True)
@@ -34,7 +48,7 @@ class Lead(Base):
     assigned_agent_id = Column(UUID(as_uuid=True), nullable=True, index=True)
 
     # Flexible metadata (renamed from 'metadata' to avoid SQLAlchemy conflict)
-    extra_metadata = Column("metadata", JSON, nullable=True)
+    extra_metadata = Column("metadata", JSONB, nullable=True)
 
     # Relationships
     conversations = relationship("Conversation", back_populates="lead", cascade="all, delete-orphan")
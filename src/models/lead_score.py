@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean, Text, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, Text, DateTime, Enum as SQLEnum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -12,9 +12,18 @@ class LeadScore(Base):
     """LeadScore model representing calculated lead quality assessment."""
 
     __tablename__ = "lead_scores"
+    __table_args__ = (
+        # Covers latest-score and score-history lookups per lead
+        Index(
+            "ix_lead_scores_lead_id_calculated_at",
+            "lead_id",
+            text("calculated_at DESC"),
+            postgresql_include=["score_category", "total_score", "triggered_handover"],
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"), nullable=False, index=True)
+    lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"), nullable=False)
 
     # Score components
     total_score = Column(Integer, nullable=False)
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Text, Float, DateTime, Enum as SQLEnum, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Float, DateTime, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -12,14 +12,23 @@ class Message(Base):
     """Message model representing individual messages in a conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Serves per-conversation chronological fetches as a single range scan
+        Index("ix_messages_conversation_id_timestamp", "conversation_id", "timestamp"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False, index=True)
+    conversation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
 
     # Message details
     sender = Column(SQLEnum(Sender), nullable=False)
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
     message_type = Column(SQLEnum(MessageType), nullable=False, default=MessageType.TEXT)
 
     # Intent detection
@@ -30,7 +39,7 @@ class Message(Base):
     whatsapp_message_id = Column(String(255), unique=True, nullable=True, index=True)
 
     # Flexible metadata (renamed from 'metadata' to avoid SQLAlchemy conflict)
-    extra_metadata = Column("metadata", JSON, nullable=True)
+    extra_metadata = Column("metadata", JSONB, nullable=True)
 
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, Float, DateTime
+
+from src.models import Base
+
+
+class MetricsRollupHourly(Base):
+    """
+    Hourly activity rollup for dashboard metrics.
+
+    Recomputed for the most recent hours by a periodic Celery task (see
+    src/workers/metrics_worker.py), so reads never scan the source tables
+    and writes on the hot path never touch this table.
+    """
+
+    __tablename__ = "metrics_rollup_hourly"
+
+    # Start of the UTC hour
+    hour_bucket = Column(DateTime, primary_key=True)
+
+    # Activity counts
+    messages_count = Column(Integer, nullable=False, default=0)
+    new_leads = Column(Integer, nullable=False, default=0)
+    new_conversations = Column(Integer, nullable=False, default=0)
+
+    # Reply latency (bot/agent reply to the preceding lead message), mean
+    response_count = Column(Integer, nullable=False, default=0)
+    avg_response_ms = Column(Float, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<MetricsRollupHourly(hour={self.hour_bucket}, messages={self.messages_count})>"
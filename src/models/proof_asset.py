@@ -1,6 +1,8 @@
 from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 import uuid
 
 from src.models import Base
@@ -32,5 +34,53 @@ class ProofAsset(Base):
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
+    @property
+    def normalized_project_type(self) -> str:
+        """Lowercased, stripped project type, memoized per instance.
+
+        Scored once per asset on every selection; the memo is keyed on the raw
+        value so an edited project_type is picked up.
+        """
+        raw = self.project_type
+        memo = self.__dict__.get("_normalized_project_type")
+        if memo is None or memo[0] != raw:
+            memo = (raw, (raw or "").lower().strip())
+            self.__dict__["_normalized_project_type"] = memo
+        return memo[1]
+
     def __repr__(self) -> str:
         return f"<ProofAsset(id={self.id}, type={self.asset_type}, title={self.title})>"
+
+
+@dataclass(frozen=True)
+class ProofAssetSnapshot:
+    """Immutable, session-free copy of a ProofAsset row for in-process caches."""
+
+    id: uuid.UUID
+    asset_type: AssetType
+    project_type: str
+    title: str
+    description: Optional[str]
+    content_url: Optional[str]
+    content_text: Optional[str]
+    usage_count: int
+    last_used_at: Optional[datetime]
+    is_active: bool
+    normalized_project_type: str
+
+    @classmethod
+    def from_model(cls, asset: ProofAsset) -> "ProofAssetSnapshot":
+        """Copy the loaded column values off an ORM instance."""
+        return cls(
+            id=asset.id,
+            asset_type=asset.asset_type,
+            project_type=asset.project_type,
+            title=asset.title,
+            description=asset.description,
+            content_url=asset.content_url,
+            content_text=asset.content_text,
+            usage_count=asset.usage_count,
+            last_used_at=asset.last_used_at,
+            is_active=asset.is_active,
+            normalized_project_type=(asset.project_type or "").lower().strip(),
+        )
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -14,7 +14,12 @@ class StateTransition(Base):
     __tablename__ = "state_transitions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False, index=True)
+    conversation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
 
     # State transition details
     from_state = Column(SQLEnum(State), nullable=False, index=True)
@@ -25,7 +30,7 @@ class StateTransition(Base):
     trigger = Column(String(255), nullable=True)
 
     # Flexible metadata (renamed from 'metadata' to avoid SQLAlchemy conflict)
-    extra_metadata = Column("metadata", JSON, nullable=True)
+    extra_metadata = Column("metadata", JSONB, nullable=True)
 
     # Relationships
     conversation = relationship("Conversation", back_populates="state_transitions")
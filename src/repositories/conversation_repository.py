@@ -1,9 +1,13 @@
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple
+from sqlalchemy import select, update, lambda_stmt, literal_column, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, raiseload, defaultload
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import UUID
 
 from src.models.conversation import Conversation
+from src.models.lead_score import LeadScore
 from src.models.enums import State
 
 
@@ -24,20 +28,79 @@ class ConversationRepository:
         await self.session.flush()
         return conversation
 
+    async def get_or_create_active(self, lead_id: UUID) -> Tuple[Conversation, bool]:
+        """
+        Get the lead's active conversation, starting one if there is none.
+
+        Single upsert against the partial unique index on lead_id for
+        conversations that have not ended, so concurrent webhooks for the
+        same lead cannot open two conversations.
+
+        Returns:
+            (conversation, created) where created is False if one was active
+        """
+        stmt = insert(Conversation).values(
+            lead_id=lead_id,
+            current_state=State.GREETING,
+            is_bot_active=True
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Conversation.lead_id],
+            index_where=Conversation.ended_at.is_(None),
+            set_={"lead_id": stmt.excluded.lead_id},
+        ).returning(Conversation, literal_column("xmax = 0"))  # xmax is 0 only for fresh inserts
+
+        conversation, created = (await self.session.execute(stmt)).one()
+        return conversation, created
+
     async def get_by_id(self, conversation_id: UUID) -> Optional[Conversation]:
-        """Get conversation by ID."""
+        """Get conversation by ID, using the session identity map when already loaded."""
+        return await self.session.get(Conversation, conversation_id)
+
+    async def get_for_handover(
+        self, conversation_id: UUID
+    ) -> Optional[Tuple[Conversation, Optional[LeadScore]]]:
+        """
+        Get conversation with its lead and the lead's latest score in one query.
+
+        The score comes from a LATERAL ... LIMIT 1 over
+        ix_lead_scores_lead_id_calculated_at, so older score rows are never
+        read. Any other relationship access raises instead of lazy loading.
+
+        Returns:
+            (conversation, latest score or None), or None if not found
+        """
+        latest = (
+            select(LeadScore)
+            .where(LeadScore.lead_id == Conversation.lead_id)
+            .order_by(LeadScore.calculated_at.desc())
+            .limit(1)
+            .lateral()
+        )
+        latest_score = aliased(LeadScore, latest)
+
         result = await self.session.execute(
-            select(Conversation).where(Conversation.id == conversation_id)
+            select(Conversation, latest_score)
+            .outerjoin(latest_score, true())
+            .options(
+                joinedload(Conversation.lead),
+                defaultload(Conversation.lead).raiseload("*"),
+                raiseload("*"),
+            )
+            .where(Conversation.id == conversation_id)
         )
-        return result.scalar_one_or_none()
+        row = result.one_or_none()
+        return tuple(row) if row else None
 
     async def get_active_by_lead(self, lead_id: UUID) -> Optional[Conversation]:
         """Get active conversation for a lead."""
         result = await self.session.execute(
-            select(Conversation)
-            .where(Conversation.lead_id == lead_id)
-            .where(Conversation.ended_at.is_(None))
-            .order_by(Conversation.started_at.desc())
+            lambda_stmt(
+                lambda: select(Conversation)
+                .where(Conversation.lead_id == lead_id)
+                .where(Conversation.ended_at.is_(None))
+                .order_by(Conversation.started_at.desc())
+            )
         )
         return result.scalar_one_or_none()
 
@@ -47,6 +110,35 @@ class ConversationRepository:
         await self.session.flush()
         return conversation
 
+    async def increment_message_count(self, conversation: Conversation) -> int:
+        """Atomically add one to message_count; returns the new count."""
+        return await self._increment(conversation, "message_count")
+
+    async def increment_proof_asset_count(self, conversation: Conversation) -> int:
+        """Atomically add one to proof_asset_count; returns the new count."""
+        return await self._increment(conversation, "proof_asset_count")
+
+    async def _increment(self, conversation: Conversation, field: str) -> int:
+        """
+        UPDATE ... SET field = field + 1 RETURNING field.
+
+        Concurrent turns for the same conversation cannot lose an increment,
+        unlike a read-modify-write through the unit of work. The loaded
+        instance gets the new value as committed state, so the turn's own
+        flush does not write it back.
+        """
+        column = getattr(Conversation, field)
+        result = await self.session.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation.id)
+            .values({column: column + 1})
+            .returning(column)
+            .execution_options(synchronize_session=False)
+        )
+        value = result.scalar_one()
+        set_committed_value(conversation, field, value)
+        return value
+
     async def list_active(self, limit: int = 100) -> List[Conversation]:
         """List active conversations."""
         result = await self.session.execute(
@@ -58,11 +150,11 @@ class ConversationRepository:
         return list(result.scalars().all())
 
     async def list_pending_handover(self, limit: int = 100) -> List[Conversation]:
-        """List conversations pending human handover."""
+        """List handed-over conversations no agent has taken over yet."""
         result = await self.session.execute(
             select(Conversation)
             .where(Conversation.current_state == State.HUMAN_HANDOVER)
-            .where(Conversation.human_agent_id.is_(None))
+            .where(Conversation.is_bot_active == True)
             .limit(limit)
         )
         return list(result.scalars().all())
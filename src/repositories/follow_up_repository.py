@@ -1,5 +1,5 @@
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Iterable, Optional, List
+from sqlalchemy import select, update, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from datetime import datetime
@@ -35,11 +35,8 @@ class FollowUpRepository:
         return follow_up
 
     async def get_by_id(self, follow_up_id: UUID) -> Optional[FollowUp]:
-        """Get follow-up by ID."""
-        result = await self.session.execute(
-            select(FollowUp).where(FollowUp.id == follow_up_id)
-        )
-        return result.scalar_one_or_none()
+        """Get follow-up by ID, using the session identity map when already loaded."""
+        return await self.session.get(FollowUp, follow_up_id)
 
     async def list_by_lead(self, lead_id: UUID) -> List[FollowUp]:
         """List all follow-ups for a lead."""
@@ -53,32 +50,36 @@ class FollowUpRepository:
     async def get_pending_by_lead(self, lead_id: UUID) -> List[FollowUp]:
         """Get pending (not sent, not cancelled) follow-ups for a lead."""
         result = await self.session.execute(
-            select(FollowUp)
-            .where(
-                and_(
-                    FollowUp.lead_id == lead_id,
-                    FollowUp.sent_at.is_(None),
-                    FollowUp.cancelled == False
+            lambda_stmt(
+                lambda: select(FollowUp)
+                .where(
+                    and_(
+                        FollowUp.is_pending == True,
+                        FollowUp.lead_id == lead_id
+                    )
                 )
+                .order_by(FollowUp.scheduled_at.asc())
             )
-            .order_by(FollowUp.scheduled_at.asc())
         )
         return list(result.scalars().all())
 
-    async def get_due_follow_ups(self, limit: int = 100) -> List[FollowUp]:
-        """Get follow-ups that are due to be sent."""
-        now = datetime.utcnow()
+    async def get_due_follow_ups(
+        self, limit: int = 100, now: Optional[datetime] = None
+    ) -> List[FollowUp]:
+        """Get follow-ups that are due to be sent (as of now, naive UTC)."""
+        now = now or datetime.utcnow()
         result = await self.session.execute(
-            select(FollowUp)
-            .where(
-                and_(
-                    FollowUp.scheduled_at <= now,
-                    FollowUp.sent_at.is_(None),
-                    FollowUp.cancelled == False
+            lambda_stmt(
+                lambda: select(FollowUp)
+                .where(
+                    and_(
+                        FollowUp.is_pending == True,
+                        FollowUp.scheduled_at <= now
+                    )
                 )
+                .order_by(FollowUp.scheduled_at.asc())
+                .limit(limit)
             )
-            .order_by(FollowUp.scheduled_at.asc())
-            .limit(limit)
         )
         return list(result.scalars().all())
 
@@ -90,6 +91,19 @@ class FollowUpRepository:
             await self.session.flush()
         return follow_up
 
+    async def mark_sent_many(self, follow_up_ids: Iterable[UUID]) -> int:
+        """Mark several follow-ups as sent in a single UPDATE."""
+        follow_up_ids = list(follow_up_ids)
+        if not follow_up_ids:
+            return 0
+
+        result = await self.session.execute(
+            update(FollowUp)
+            .where(FollowUp.id.in_(follow_up_ids))
+            .values(sent_at=datetime.utcnow())
+        )
+        return result.rowcount
+
     async def mark_responded(
         self, follow_up_id: UUID, response_time: datetime
     ) -> FollowUp:
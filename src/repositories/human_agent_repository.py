@@ -1,9 +1,11 @@
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import select, func, lambda_stmt, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from src.models.human_agent import HumanAgent
+from src.models.conversation import Conversation
+from src.models.enums import State
 
 
 class HumanAgentRepository:
@@ -20,16 +22,13 @@ class HumanAgentRepository:
         return agent
 
     async def get_by_id(self, agent_id: UUID) -> Optional[HumanAgent]:
-        """Get agent by ID."""
-        result = await self.session.execute(
-            select(HumanAgent).where(HumanAgent.id == agent_id)
-        )
-        return result.scalar_one_or_none()
+        """Get agent by ID, using the session identity map when already loaded."""
+        return await self.session.get(HumanAgent, agent_id)
 
     async def get_by_email(self, email: str) -> Optional[HumanAgent]:
         """Get agent by email."""
         result = await self.session.execute(
-            select(HumanAgent).where(HumanAgent.email == email)
+            lambda_stmt(lambda: select(HumanAgent).where(HumanAgent.email == email))
         )
         return result.scalar_one_or_none()
 
@@ -48,6 +47,42 @@ class HumanAgentRepository:
         )
         return list(result.scalars().all())
 
+    async def claim_least_loaded(self) -> Optional[HumanAgent]:
+        """
+        Pick and lock the least-loaded available agent with spare capacity.
+
+        Load counts conversations the agent controls plus handovers reserved
+        for it and not yet taken over. The caller reserves the agent by
+        setting human_agent_id on the handed-over conversation in the same
+        transaction. Rows locked by concurrent handovers are skipped until
+        that transaction commits, by which time the reservation counts
+        toward their load.
+
+        Returns:
+            Claimed agent, or None if every agent is at capacity or locked
+        """
+        active_conversations = (
+            select(func.count())
+            .where(Conversation.human_agent_id == HumanAgent.id)
+            .where(
+                or_(
+                    Conversation.is_bot_active == False,
+                    Conversation.current_state == State.HUMAN_HANDOVER,
+                )
+            )
+            .correlate(HumanAgent)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(HumanAgent)
+            .where(HumanAgent.is_available == True)
+            .where(active_conversations < HumanAgent.max_concurrent_conversations)
+            .order_by(active_conversations.asc(), HumanAgent.last_active_at.desc().nulls_last())
+            .limit(1)
+            .with_for_update(skip_locked=True, of=HumanAgent)
+        )
+        return result.scalar_one_or_none()
+
     async def list_all(self, limit: int = 100) -> List[HumanAgent]:
         """List all agents."""
         result = await self.session.execute(
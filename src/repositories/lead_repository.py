@@ -1,5 +1,6 @@
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Iterable, Optional, List, Tuple
+from sqlalchemy import select, lambda_stmt, literal_column
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -20,17 +21,43 @@ class LeadRepository:
         await self.session.flush()
         return lead
 
+    async def get_or_create(self, phone_number: str) -> Tuple[Lead, bool]:
+        """
+        Get the lead for a phone number, creating it if missing.
+
+        Single INSERT ... ON CONFLICT (phone_number) DO UPDATE ... RETURNING,
+        so concurrent webhooks for a new number resolve to one lead. The
+        no-op update makes RETURNING yield the existing row on conflict.
+
+        Returns:
+            (lead, created) where created is False if the lead already existed
+        """
+        stmt = insert(Lead).values(phone_number=phone_number, current_state=State.GREETING)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Lead.phone_number],
+            set_={"phone_number": stmt.excluded.phone_number},
+        ).returning(Lead, literal_column("xmax = 0"))  # xmax is 0 only for fresh inserts
+
+        lead, created = (await self.session.execute(stmt)).one()
+        return lead, created
+
     async def get_by_id(self, lead_id: UUID) -> Optional[Lead]:
-        """Get lead by ID."""
-        result = await self.session.execute(
-            select(Lead).where(Lead.id == lead_id)
-        )
-        return result.scalar_one_or_none()
+        """Get lead by ID, using the session identity map when already loaded."""
+        return await self.session.get(Lead, lead_id)
+
+    async def get_many(self, lead_ids: Iterable[UUID]) -> List[Lead]:
+        """Get several leads by ID in one query."""
+        lead_ids = list(lead_ids)
+        if not lead_ids:
+            return []
+
+        result = await self.session.execute(select(Lead).where(Lead.id.in_(lead_ids)))
+        return list(result.scalars().all())
 
     async def get_by_phone(self, phone_number: str) -> Optional[Lead]:
         """Get lead by phone number."""
         result = await self.session.execute(
-            select(Lead).where(Lead.phone_number == phone_number)
+            lambda_stmt(lambda: select(Lead).where(Lead.phone_number == phone_number))
         )
         return result.scalar_one_or_none()
 
@@ -1,5 +1,5 @@
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -24,9 +24,15 @@ class LeadScoreRepository:
         behavior_score: int,
         score_category: ScoreCategory,
         reasoning: str,
-        triggered_handover: bool = False
+        triggered_handover: bool = False,
+        flush: bool = False
     ) -> LeadScore:
-        """Create a new lead score record."""
+        """
+        Create a new lead score record.
+
+        The insert is deferred to the session's next flush or commit unless
+        flush=True.
+        """
         lead_score = LeadScore(
             lead_id=lead_id,
             total_score=total_score,
@@ -40,23 +46,23 @@ class LeadScoreRepository:
             triggered_handover=triggered_handover
         )
         self.session.add(lead_score)
-        await self.session.flush()
+        if flush:
+            await self.session.flush()
         return lead_score
 
     async def get_by_id(self, score_id: UUID) -> Optional[LeadScore]:
-        """Get lead score by ID."""
-        result = await self.session.execute(
-            select(LeadScore).where(LeadScore.id == score_id)
-        )
-        return result.scalar_one_or_none()
+        """Get lead score by ID, using the session identity map when already loaded."""
+        return await self.session.get(LeadScore, score_id)
 
     async def get_latest_by_lead(self, lead_id: UUID) -> Optional[LeadScore]:
         """Get latest score for a lead."""
         result = await self.session.execute(
-            select(LeadScore)
-            .where(LeadScore.lead_id == lead_id)
-            .order_by(LeadScore.calculated_at.desc())
-            .limit(1)
+            lambda_stmt(
+                lambda: select(LeadScore)
+                .where(LeadScore.lead_id == lead_id)
+                .order_by(LeadScore.calculated_at.desc())
+                .limit(1)
+            )
         )
         return result.scalar_one_or_none()
 
@@ -1,5 +1,5 @@
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Any, Dict, Optional, List
+from sqlalchemy import Row, insert, select, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -22,8 +22,16 @@ class MessageRepository:
         detected_intent: Optional[str] = None,
         intent_confidence: Optional[float] = None,
         whatsapp_message_id: Optional[str] = None,
+        flush: bool = False,
     ) -> Message:
-        """Create a new message."""
+        """
+        Create a new message.
+
+        The insert is deferred to the session's next flush or commit unless
+        flush=True, so messages added during one webhook share a round-trip.
+        Pass flush=True when the caller needs server-side values (id,
+        timestamp) straight away.
+        """
         message = Message(
             conversation_id=conversation_id,
             sender=sender,
@@ -34,20 +42,40 @@ class MessageRepository:
             whatsapp_message_id=whatsapp_message_id,
         )
         self.session.add(message)
-        await self.session.flush()
+        if flush:
+            await self.session.flush()
         return message
 
-    async def get_by_id(self, message_id: UUID) -> Optional[Message]:
-        """Get message by ID."""
-        result = await self.session.execute(
-            select(Message).where(Message.id == message_id)
+    async def create_many(self, messages: List[Dict[str, Any]]) -> List[Message]:
+        """
+        Insert several messages in one batched statement.
+
+        Args:
+            messages: Column values for each message, as accepted by create
+
+        Returns:
+            Created messages, in input order
+        """
+        if not messages:
+            return []
+
+        result = await self.session.scalars(
+            insert(Message).returning(Message, sort_by_parameter_order=True),
+            messages,
         )
-        return result.scalar_one_or_none()
+        return list(result.all())
+
+    async def get_by_id(self, message_id: UUID) -> Optional[Message]:
+        """Get message by ID, using the session identity map when already loaded."""
+        return await self.session.get(Message, message_id)
 
     async def get_by_whatsapp_id(self, whatsapp_message_id: str) -> Optional[Message]:
         """Get message by WhatsApp message ID (for deduplication)."""
         result = await self.session.execute(
-            select(Message).where(Message.whatsapp_message_id == whatsapp_message_id)
+            lambda_stmt(
+                lambda: select(Message)
+                .where(Message.whatsapp_message_id == whatsapp_message_id)
+            )
         )
         return result.scalar_one_or_none()
 
@@ -56,19 +84,55 @@ class MessageRepository:
     ) -> List[Message]:
         """List messages for a conversation."""
         result = await self.session.execute(
-            select(Message)
-            .where(Message.conversation_id == conversation_id)
-            .order_by(Message.timestamp.asc())
-            .limit(limit)
+            lambda_stmt(
+                lambda: select(Message)
+                .where(Message.conversation_id == conversation_id)
+                .order_by(Message.timestamp.asc())
+                .limit(limit)
+            )
         )
         return list(result.scalars().all())
 
+    async def list_by_conversation_projection(
+        self, conversation_id: UUID, limit: int = 100
+    ) -> List[Row]:
+        """
+        List the newest message summaries for a conversation without loading
+        ORM objects.
+
+        The newest rows are read by a backward scan of
+        ix_messages_conversation_id_timestamp and returned in chronological
+        order, so a history longer than limit loses its oldest messages.
+
+        Returns:
+            Rows of (sender, content, timestamp, detected_intent), oldest first
+        """
+        result = await self.session.execute(
+            lambda_stmt(
+                lambda: select(
+                    Message.sender,
+                    Message.content,
+                    Message.timestamp,
+                    Message.detected_intent,
+                )
+                .where(Message.conversation_id == conversation_id)
+                .order_by(Message.timestamp.desc())
+                .limit(limit)
+            )
+        )
+        rows = result.all()
+        rows.reverse()
+        return rows
+
     async def get_last_message(self, conversation_id: UUID) -> Optional[Message]:
         """Get the last message in a conversation."""
+        # Served by a backward scan of ix_messages_conversation_id_timestamp
         result = await self.session.execute(
-            select(Message)
-            .where(Message.conversation_id == conversation_id)
-            .order_by(Message.timestamp.desc())
-            .limit(1)
+            lambda_stmt(
+                lambda: select(Message)
+                .where(Message.conversation_id == conversation_id)
+                .order_by(Message.timestamp.desc())
+                .limit(1)
+            )
         )
         return result.scalar_one_or_none()
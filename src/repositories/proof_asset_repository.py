@@ -1,11 +1,56 @@
-from typing import Optional, List
-from sqlalchemy import select, update
+from typing import Callable, Optional, List, Union
+from dataclasses import replace
+from sqlalchemy import event, select, update, delete, func, literal, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from datetime import datetime
 
-from src.models.proof_asset import ProofAsset
+from src.models.proof_asset import ProofAsset, ProofAssetSnapshot
 from src.models.enums import AssetType
+from src.utils.cache import TTLCache
+from src.utils.project_types import project_type_spellings
+
+# Proof assets are read-mostly reference data; serve list lookups from RAM.
+# Keyed by (asset_type, project_type, is_active). Entries are tuples of
+# ProofAssetSnapshot, never ORM instances: those belong to the session that
+# loaded them and break once it rolls back or closes. Usage counters are not
+# part of the cached selection criteria, so increment_usage does not
+# invalidate; it swaps in updated snapshots so selection keeps rotating assets.
+# Both only touch the cache once the writing transaction commits: doing it
+# earlier lets a concurrent reader re-cache the old committed rows, and a
+# rollback would leave the cache describing writes that never happened.
+_asset_list_cache = TTLCache(maxsize=256, ttl=300)
+
+
+def invalidate_proof_asset_cache() -> None:
+    """Drop all cached proof asset lists (call after content/status changes)."""
+    _asset_list_cache.clear()
+
+
+def _refresh_cached_usage(asset: Union[ProofAsset, ProofAssetSnapshot]) -> None:
+    """Replace cached snapshots of the asset with copies carrying fresh usage."""
+    for key, assets in list(_asset_list_cache.items()):
+        if any(cached.id == asset.id for cached in assets):
+            _asset_list_cache.replace(key, tuple(
+                replace(cached, usage_count=asset.usage_count, last_used_at=asset.last_used_at)
+                if cached.id == asset.id else cached
+                for cached in assets
+            ))
+
+
+def _on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run callback once the session's transaction commits; drop it on rollback."""
+    state = {"pending": True}
+
+    def on_commit(_session) -> None:
+        if state["pending"]:
+            state["pending"] = False
+            callback()
+
+    def on_rollback(_session) -> None:
+        state["pending"] = False
+
+    event.listen(session.sync_session, "after_commit", on_commit, once=True)
+    event.listen(session.sync_session, "after_rollback", on_rollback, once=True)
 
 
 class ProofAssetRepository:
@@ -34,14 +79,12 @@ class ProofAssetRepository:
         )
         self.session.add(asset)
         await self.session.flush()
+        _on_commit(self.session, invalidate_proof_asset_cache)
         return asset
 
     async def get_by_id(self, asset_id: UUID) -> Optional[ProofAsset]:
-        """Get proof asset by ID."""
-        result = await self.session.execute(
-            select(ProofAsset).where(ProofAsset.id == asset_id)
-        )
-        return result.scalar_one_or_none()
+        """Get proof asset by ID, using the session identity map when already loaded."""
+        return await self.session.get(ProofAsset, asset_id)
 
     async def list_active(self, limit: int = 100) -> List[ProofAsset]:
         """List all active proof assets."""
@@ -52,6 +95,84 @@ class ProofAssetRepository:
         )
         return list(result.scalars().all())
 
+    async def list_for(
+        self,
+        asset_type: Optional[AssetType] = None,
+        project_type: Optional[str] = None,
+        active_only: bool = True
+    ) -> List[ProofAssetSnapshot]:
+        """
+        List proof assets matching the given filters, served from the
+        in-process cache when possible.
+
+        Args:
+            asset_type: Optional asset type filter
+            project_type: Optional project type filter
+            active_only: If True, only return active assets
+
+        Returns:
+            Snapshots of the matching proof assets
+        """
+        key = (asset_type, project_type, active_only)
+        assets = _asset_list_cache.get(key)
+        if assets is not None:
+            return list(assets)
+
+        query = select(ProofAsset)
+        if asset_type is not None:
+            query = query.where(ProofAsset.asset_type == asset_type)
+        if project_type is not None:
+            query = query.where(ProofAsset.project_type == project_type)
+        if active_only:
+            query = query.where(ProofAsset.is_active == True)
+
+        result = await self.session.execute(query)
+        assets = tuple(ProofAssetSnapshot.from_model(a) for a in result.scalars())
+        _asset_list_cache.set(key, assets)
+        return list(assets)
+
+    async def list_matching(self, project_type: str) -> List[ProofAssetSnapshot]:
+        """
+        List active assets whose project type can match the lead's, served
+        from the in-process cache when possible.
+
+        Mirrors ProofAssetSelector's project type rule: same canonical type
+        (aliases included) or contained either way, case-insensitive. Assets
+        failing it can never reach the selection threshold, so only
+        candidates leave the database.
+
+        Args:
+            project_type: The lead's project type
+
+        Returns:
+            Snapshots of the candidate proof assets, unranked
+        """
+        lead_type = project_type.lower().strip()
+        if not lead_type:
+            return []
+
+        key = ("matching", lead_type)
+        assets = _asset_list_cache.get(key)
+        if assets is not None:
+            return list(assets)
+
+        asset_type = func.lower(func.btrim(ProofAsset.project_type))
+        result = await self.session.execute(
+            select(ProofAsset)
+            .where(ProofAsset.is_active == True)
+            .where(asset_type != "")
+            .where(
+                or_(
+                    asset_type.in_(sorted(project_type_spellings(lead_type))),
+                    func.strpos(literal(lead_type), asset_type) > 0,
+                    func.strpos(asset_type, lead_type) > 0,
+                )
+            )
+        )
+        assets = tuple(ProofAssetSnapshot.from_model(a) for a in result.scalars())
+        _asset_list_cache.set(key, assets)
+        return list(assets)
+
     async def list_by_project_type(
         self,
         project_type: str,
@@ -84,36 +205,60 @@ class ProofAssetRepository:
         """Update proof asset."""
         self.session.add(asset)
         await self.session.flush()
+        _on_commit(self.session, invalidate_proof_asset_cache)
         return asset
 
-    async def increment_usage(self, asset_id: UUID) -> ProofAsset:
-        """Increment usage count and update last_used_at."""
-        asset = await self.get_by_id(asset_id)
+    async def increment_usage(self, asset_id: UUID) -> Optional[ProofAsset]:
+        """Increment usage count and update last_used_at atomically."""
+        result = await self.session.execute(
+            update(ProofAsset)
+            .where(ProofAsset.id == asset_id)
+            .values(
+                usage_count=ProofAsset.usage_count + 1,
+                last_used_at=func.timezone("UTC", func.now())
+            )
+            .returning(ProofAsset)
+        )
+        asset = result.scalar_one_or_none()
         if asset:
-            asset.usage_count += 1
-            asset.last_used_at = datetime.utcnow()
-            await self.session.flush()
+            # Copy the values now; the instance may change again before the commit
+            used = ProofAssetSnapshot.from_model(asset)
+            _on_commit(self.session, lambda: _refresh_cached_usage(used))
         return asset
 
-    async def deactivate(self, asset_id: UUID) -> Optional[ProofAsset]:
-        """Deactivate a proof asset (soft delete)."""
-        asset = await self.get_by_id(asset_id)
+    async def _set_active(self, asset_id: UUID, is_active: bool) -> Optional[ProofAsset]:
+        """Set is_active with a single UPDATE ... RETURNING."""
+        result = await self.session.execute(
+            update(ProofAsset)
+            .where(ProofAsset.id == asset_id)
+            .values(is_active=is_active)
+            .returning(ProofAsset)
+        )
+        asset = result.scalar_one_or_none()
         if asset:
-            asset.is_active = False
-            await self.session.flush()
+            _on_commit(self.session, invalidate_proof_asset_cache)
         return asset
 
+    async def deactivate(self, asset_id: UUID) -> Optional[ProofAsset]:
+        """Deactivate a proof asset (soft delete)."""
+        return await self._set_active(asset_id, False)
+
     async def activate(self, asset_id: UUID) -> Optional[ProofAsset]:
         """Activate a proof asset."""
-        asset = await self.get_by_id(asset_id)
-        if asset:
-            asset.is_active = True
-            await self.session.flush()
-        return asset
+        return await self._set_active(asset_id, True)
 
-    async def delete(self, asset_id: UUID) -> None:
-        """Delete proof asset (hard delete for admin cleanup)."""
-        asset = await self.get_by_id(asset_id)
-        if asset:
-            await self.session.delete(asset)
-            await self.session.flush()
+    async def delete(self, asset_id: UUID) -> bool:
+        """
+        Delete proof asset (hard delete for admin cleanup).
+
+        Returns:
+            True if an asset was deleted
+        """
+        result = await self.session.execute(
+            delete(ProofAsset).where(ProofAsset.id == asset_id)
+        )
+        if not result.rowcount:
+            return False
+
+        _on_commit(self.session, invalidate_proof_asset_cache)
+        return True
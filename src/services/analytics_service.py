@@ -1,5 +1,5 @@
 from typing import Dict, Any, List
-from sqlalchemy import select, func, and_
+from sqlalchemy import String, select, func, and_, text, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
@@ -7,7 +7,73 @@ from src.models.lead import Lead
 from src.models.conversation import Conversation
 from src.models.message import Message
 from src.models.lead_score import LeadScore
+from src.models.metrics_rollup import MetricsRollupHourly
 from src.models.enums import State, ScoreCategory
+from src.utils.cache import AsyncTTLCache
+
+# Leads that reached human handover or beyond
+CONVERTED_STATES = [
+    State.HUMAN_HANDOVER,
+    State.CALL_PUSH,
+    State.EXIT,
+]
+
+# Score categories always reported, even with no scores yet
+SCORE_CATEGORY_KEYS = [category.value for category in ScoreCategory]
+
+# Dashboard aggregates are not per-user; tolerate up to 30s staleness rather
+# than invalidating on every lead, conversation and message write
+_metrics_cache = AsyncTTLCache(maxsize=32, ttl=30)
+
+# Recompute every hourly rollup bucket from :since onward in one statement.
+# Reply latency is a BOT or HUMAN message minus the LEAD message directly
+# before it, found by a backward scan of ix_messages_conversation_id_timestamp.
+_REFRESH_ROLLUP_SQL = text("""
+    WITH replies AS (
+        SELECT
+            date_trunc('hour', m.timestamp) AS hour_bucket,
+            CASE
+                WHEN m.sender <> 'LEAD' AND p.sender = 'LEAD'
+                THEN extract(epoch FROM m.timestamp - p.timestamp) * 1000
+            END AS response_ms
+        FROM messages m
+        LEFT JOIN LATERAL (
+            SELECT prev.sender, prev.timestamp
+            FROM messages prev
+            WHERE prev.conversation_id = m.conversation_id
+              AND prev.timestamp <= m.timestamp
+              AND prev.id <> m.id
+            ORDER BY prev.timestamp DESC
+            LIMIT 1
+        ) p ON m.sender <> 'LEAD'
+        WHERE m.timestamp >= :since
+    ),
+    activity AS (
+        SELECT hour_bucket, count(*) AS messages_count, 0 AS new_leads,
+               0 AS new_conversations, count(response_ms) AS response_count,
+               avg(response_ms) AS avg_response_ms
+        FROM replies GROUP BY hour_bucket
+        UNION ALL
+        SELECT date_trunc('hour', created_at), 0, count(*), 0, 0, NULL
+        FROM leads WHERE created_at >= :since GROUP BY 1
+        UNION ALL
+        SELECT date_trunc('hour', started_at), 0, 0, count(*), 0, NULL
+        FROM conversations WHERE started_at >= :since GROUP BY 1
+    )
+    INSERT INTO metrics_rollup_hourly
+        (hour_bucket, messages_count, new_leads, new_conversations,
+         response_count, avg_response_ms)
+    SELECT hour_bucket, sum(messages_count), sum(new_leads), sum(new_conversations),
+           sum(response_count), max(avg_response_ms)
+    FROM activity
+    GROUP BY hour_bucket
+    ON CONFLICT (hour_bucket) DO UPDATE SET
+        messages_count = EXCLUDED.messages_count,
+        new_leads = EXCLUDED.new_leads,
+        new_conversations = EXCLUDED.new_conversations,
+        response_count = EXCLUDED.response_count,
+        avg_response_ms = EXCLUDED.avg_response_ms
+""")
 
 
 class AnalyticsService:
@@ -18,16 +84,19 @@ class AnalyticsService:
 
     async def get_dashboard_metrics(self) -> Dict[str, Any]:
         """
-        Get comprehensive dashboard metrics.
+        Get comprehensive dashboard metrics (cached for a short TTL).
 
         Returns:
             Dictionary with analytics data
         """
-        # Total counts
-        total_leads = await self._get_total_leads()
-        total_conversations = await self._get_total_conversations()
-        total_messages = await self._get_total_messages()
-        active_conversations = await self._get_active_conversations()
+        return await _metrics_cache.get_or_load(
+            ("dashboard",), self._compute_dashboard_metrics
+        )
+
+    async def _compute_dashboard_metrics(self) -> Dict[str, Any]:
+        """Compute dashboard metrics from the database."""
+        # Total counts (single round-trip)
+        counts = await self._get_counts()
 
         # Performance metrics
         avg_response_time = await self._get_avg_response_time()
@@ -37,16 +106,18 @@ class AnalyticsService:
         leads_by_state = await self._get_leads_by_state()
 
         # Conversion metrics
-        conversion_rate = await self._calculate_conversion_rate()
+        conversion_rate = self._calculate_conversion_rate(
+            counts["total_leads"], counts["converted_leads"]
+        )
 
         # Top project types
         top_project_types = await self._get_top_project_types()
 
         return {
-            "total_leads": total_leads,
-            "total_conversations": total_conversations,
-            "total_messages": total_messages,
-            "active_conversations": active_conversations,
+            "total_leads": counts["total_leads"],
+            "total_conversations": counts["total_conversations"],
+            "total_messages": counts["total_messages"],
+            "active_conversations": counts["active_conversations"],
             "avg_response_time_ms": avg_response_time,
             "leads_by_score_category": leads_by_score,
             "leads_by_state": leads_by_state,
@@ -54,111 +125,120 @@ class AnalyticsService:
             "top_project_types": top_project_types
         }
 
-    async def _get_total_leads(self) -> int:
-        """Get total number of leads."""
-        result = await self.session.execute(
-            select(func.count(Lead.id))
-        )
-        return result.scalar() or 0
+    async def _get_counts(self) -> Dict[str, int]:
+        """
+        Get all dashboard totals in one statement.
 
-    async def _get_total_conversations(self) -> int:
-        """Get total number of conversations."""
-        result = await self.session.execute(
-            select(func.count(Conversation.id))
-        )
-        return result.scalar() or 0
+        Each table is scanned once; conditional counts use FILTER clauses.
 
-    async def _get_total_messages(self) -> int:
-        """Get total number of messages."""
-        result = await self.session.execute(
-            select(func.count(Message.id))
-        )
-        return result.scalar() or 0
+        Returns:
+            Dict with total/converted leads, total/active conversations and total messages
+        """
+        lead_counts = select(
+            func.count(Lead.id).label("total_leads"),
+            func.count(Lead.id).filter(
+                Lead.current_state.in_(CONVERTED_STATES)
+            ).label("converted_leads"),
+        ).cte("lead_counts")
+
+        conversation_counts = select(
+            func.count(Conversation.id).label("total_conversations"),
+            func.count(Conversation.id).filter(
+                Conversation.ended_at.is_(None)
+            ).label("active_conversations"),
+        ).cte("conversation_counts")
+
+        message_counts = select(
+            func.count(Message.id).label("total_messages"),
+        ).cte("message_counts")
 
-    async def _get_active_conversations(self) -> int:
-        """Get number of active conversations (not ended)."""
         result = await self.session.execute(
-            select(func.count(Conversation.id)).where(
-                Conversation.ended_at.is_(None)
+            select(
+                lead_counts.c.total_leads,
+                lead_counts.c.converted_leads,
+                conversation_counts.c.total_conversations,
+                conversation_counts.c.active_conversations,
+                message_counts.c.total_messages,
             )
+            .select_from(lead_counts)
+            .join(conversation_counts, true())
+            .join(message_counts, true())
         )
-        return result.scalar() or 0
+
+        row = result.one()
+        return {key: value or 0 for key, value in row._mapping.items()}
+
+    async def refresh_rollup(self, since: datetime) -> None:
+        """
+        Recompute the hourly rollup for every hour from since onward.
+
+        Buckets are overwritten, not incremented, so rerunning over the same
+        hours is safe.
+
+        Args:
+            since: Start of the first hour bucket to recompute (naive UTC)
+        """
+        await self.session.execute(_REFRESH_ROLLUP_SQL, {"since": since})
 
     async def _get_avg_response_time(self) -> float:
         """
-        Get average response time in milliseconds.
+        Get average reply latency in milliseconds.
 
-        Note: This is a placeholder. In production, this would be calculated
-        from actual response time metrics stored in a time-series database.
+        Combines the per-hour running means from the rollup table, weighted
+        by the number of replies in each hour.
         """
-        # TODO: Implement actual response time tracking
-        # For now, return a placeholder value
-        return 850.0  # Placeholder: 850ms average
+        result = await self.session.execute(
+            select(
+                func.sum(
+                    MetricsRollupHourly.avg_response_ms * MetricsRollupHourly.response_count
+                ),
+                func.sum(MetricsRollupHourly.response_count),
+            ).where(MetricsRollupHourly.response_count > 0)
+        )
+        weighted_total, response_count = result.one()
+
+        if not response_count:
+            return 0.0
+
+        return round(weighted_total / response_count, 2)
 
     async def _get_leads_by_score_category(self) -> Dict[str, int]:
         """Get lead count by score category."""
+        # Labels come back as plain strings; count(*) needs no heap columns, so
+        # ix_lead_scores_score_category answers this with an index-only scan
+        category = LeadScore.score_category.cast(String).label("category")
         result = await self.session.execute(
-            select(
-                LeadScore.score_category,
-                func.count(LeadScore.id)
-            ).group_by(LeadScore.score_category)
+            select(category, func.count().label("n")).group_by(category)
         )
 
-        scores = {
-            "LOW": 0,
-            "MEDIUM": 0,
-            "HIGH": 0
+        return {
+            **dict.fromkeys(SCORE_CATEGORY_KEYS, 0),
+            **{row.category: row.n for row in result.all()},
         }
 
-        for category, count in result.all():
-            if category:
-                scores[category.value] = count
-
-        return scores
-
     async def _get_leads_by_state(self) -> Dict[str, int]:
         """Get lead count by current state."""
+        state = Lead.current_state.cast(String).label("state")
         result = await self.session.execute(
-            select(
-                Lead.current_state,
-                func.count(Lead.id)
-            ).group_by(Lead.current_state)
+            select(state, func.count().label("n")).group_by(state)
         )
 
-        states = {}
-        for state, count in result.all():
-            if state:
-                states[state.value] = count
+        return {row.state: row.n for row in result.all()}
 
-        return states
-
-    async def _calculate_conversion_rate(self) -> float:
+    def _calculate_conversion_rate(self, total_leads: int, converted_leads: int) -> float:
         """
         Calculate conversion rate (leads that reached HUMAN_HANDOVER or beyond).
 
+        Args:
+            total_leads: Total number of leads
+            converted_leads: Number of leads in a converted state
+
         Returns:
             Conversion rate as percentage (0-100)
         """
-        total_leads = await self._get_total_leads()
-
         if total_leads == 0:
             return 0.0
 
-        # Count leads that reached human handover or beyond
-        converted_states = [
-            State.HUMAN_HANDOVER,
-            State.CALL_PUSH,
-            State.EXIT
-        ]
-
-        result = await self.session.execute(
-            select(func.count(Lead.id)).where(
-                Lead.current_state.in_(converted_states)
-            )
-        )
-
-        converted_leads = result.scalar() or 0
-
         return round((converted_leads / total_leads) * 100, 2)
 
     async def _get_top_project_types(self, limit: int = 5) -> List[Dict[str, Any]]:
@@ -171,14 +251,12 @@ class AnalyticsService:
         Returns:
             List of project types with counts
         """
+        lead_count = func.count().label("count")
         result = await self.session.execute(
-            select(
-                Lead.project_type,
-                func.count(Lead.id).label("count")
-            )
+            select(Lead.project_type, lead_count)
             .where(Lead.project_type.isnot(None))
             .group_by(Lead.project_type)
-            .order_by(func.count(Lead.id).desc())
+            .order_by(lead_count.desc())
             .limit(limit)
         )
 
@@ -193,7 +271,7 @@ class AnalyticsService:
 
     async def get_performance_metrics(self, hours: int = 24) -> Dict[str, Any]:
         """
-        Get performance metrics for the last N hours.
+        Get performance metrics for the last N hours (cached for a short TTL).
 
         Args:
             hours: Number of hours to look back
@@ -201,31 +279,28 @@ class AnalyticsService:
         Returns:
             Performance metrics
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        # Messages in time period
-        result = await self.session.execute(
-            select(func.count(Message.id)).where(
-                Message.created_at >= since
-            )
+        return await _metrics_cache.get_or_load(
+            ("performance", hours), lambda: self._compute_performance_metrics(hours)
         )
-        messages_count = result.scalar() or 0
 
-        # New leads in time period
-        result = await self.session.execute(
-            select(func.count(Lead.id)).where(
-                Lead.created_at >= since
-            )
-        )
-        new_leads = result.scalar() or 0
+    async def _compute_performance_metrics(self, hours: int) -> Dict[str, Any]:
+        """
+        Compute performance metrics from the hourly rollup.
+
+        Whole hour buckets are summed, so the window starts at the top of
+        the hour containing the cutoff.
+        """
+        since = datetime.utcnow() - timedelta(hours=hours)
+        since_bucket = since.replace(minute=0, second=0, microsecond=0)
 
-        # New conversations in time period
         result = await self.session.execute(
-            select(func.count(Conversation.id)).where(
-                Conversation.started_at >= since
-            )
+            select(
+                func.coalesce(func.sum(MetricsRollupHourly.messages_count), 0),
+                func.coalesce(func.sum(MetricsRollupHourly.new_leads), 0),
+                func.coalesce(func.sum(MetricsRollupHourly.new_conversations), 0),
+            ).where(MetricsRollupHourly.hour_bucket >= since_bucket)
         )
-        new_conversations = result.scalar() or 0
+        messages_count, new_leads, new_conversations = result.one()
 
         return {
             "time_period_hours": hours,
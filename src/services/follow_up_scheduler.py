@@ -1,5 +1,7 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import defaultdict
 from datetime import datetime, timedelta
+import asyncio
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,10 +10,47 @@ from src.models.lead import Lead
 from src.models.enums import FollowUpScenario
 from src.repositories.follow_up_repository import FollowUpRepository
 from src.repositories.lead_repository import LeadRepository
+from src.integrations.whatsapp_client import get_whatsapp_client
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Follow-up message templates keyed by (scenario, attempt)
+_FOLLOW_UP_TEMPLATES: Dict[Tuple[FollowUpScenario, int], str] = {
+    (FollowUpScenario.INACTIVE, 1):
+        "Hi! Just checking in. Are you still interested in discussing your project?",
+    (FollowUpScenario.INACTIVE, 2):
+        "Hello! I wanted to follow up on your project inquiry. "
+        "Let me know if you'd like to continue our conversation.",
+    (FollowUpScenario.INACTIVE, 3):
+        "This is my last follow-up. If you're still interested in your project, "
+        "feel free to reach out anytime!",
+    (FollowUpScenario.CALL_NOT_BOOKED, 1):
+        "Hi! I noticed you haven't booked a call yet. "
+        "Would you like to schedule a time to discuss your project?",
+    (FollowUpScenario.CALL_NOT_BOOKED, 2):
+        "Just following up on scheduling a call. "
+        "Our team is ready to discuss your project whenever you're available.",
+    (FollowUpScenario.CALL_NOT_BOOKED, 3):
+        "Last reminder about scheduling a call. "
+        "Let us know if you'd like to connect with our team!",
+    (FollowUpScenario.CALL_MISSED, 1):
+        "Hi! We missed you on our scheduled call. Would you like to reschedule?",
+    (FollowUpScenario.CALL_MISSED, 2):
+        "Following up on our missed call. We're happy to find another time that works for you.",
+    (FollowUpScenario.CALL_MISSED, 3):
+        "Final follow-up about rescheduling. Let us know if you'd still like to connect!",
+    (FollowUpScenario.PROPOSAL_SENT, 1):
+        "Hi! Just checking if you had a chance to review the proposal we sent?",
+    (FollowUpScenario.PROPOSAL_SENT, 2):
+        "Following up on the proposal. "
+        "Do you have any questions or need clarification on anything?",
+    (FollowUpScenario.PROPOSAL_SENT, 3):
+        "Last follow-up on our proposal. We're here if you need any additional information!",
+}
+
+_DEFAULT_FOLLOW_UP_MESSAGE = "Following up on your inquiry."
+
 
 class FollowUpScheduler:
     """Service for scheduling and managing automated follow-ups."""
@@ -22,33 +61,32 @@ class FollowUpScheduler:
         2: timedelta(hours=24),
         3: timedelta(days=3),
     }
+    _INTERVAL_SEQUENCE = tuple(INTERVALS.values())
 
     def __init__(self, session: AsyncSession):
         self.session = session
         self.follow_up_repo = FollowUpRepository(session)
         self.lead_repo = LeadRepository(session)
+        self.whatsapp_client = get_whatsapp_client()
 
     @staticmethod
-    def get_follow_up_intervals() -> List[timedelta]:
-        """Get follow-up intervals."""
-        return [
-            FollowUpScheduler.INTERVALS[1],
-            FollowUpScheduler.INTERVALS[2],
-            FollowUpScheduler.INTERVALS[3],
-        ]
+    def get_follow_up_intervals() -> Tuple[timedelta, ...]:
+        """Get follow-up intervals in attempt order."""
+        return FollowUpScheduler._INTERVAL_SEQUENCE
 
     @staticmethod
-    def is_inactive(last_message_time: datetime) -> bool:
+    def is_inactive(last_message_time: datetime, now: Optional[datetime] = None) -> bool:
         """
         Check if lead is inactive (no response for 2+ hours).
 
         Args:
             last_message_time: Timestamp of last message
+            now: Current time (naive UTC); read once per batch by callers
 
         Returns:
             True if inactive
         """
-        time_since_last_message = datetime.utcnow() - last_message_time
+        time_since_last_message = (now or datetime.utcnow()) - last_message_time
         return time_since_last_message >= timedelta(hours=2)
 
     @staticmethod
@@ -80,36 +118,14 @@ class FollowUpScheduler:
         Returns:
             Follow-up message text
         """
-        messages = {
-            FollowUpScenario.INACTIVE: {
-                1: "Hi! Just checking in. Are you still interested in discussing your project?",
-                2: "Hello! I wanted to follow up on your project inquiry. Let me know if you'd like to continue our conversation.",
-                3: "This is my last follow-up. If you're still interested in your project, feel free to reach out anytime!",
-            },
-            FollowUpScenario.CALL_NOT_BOOKED: {
-                1: "Hi! I noticed you haven't booked a call yet. Would you like to schedule a time to discuss your project?",
-                2: "Just following up on scheduling a call. Our team is ready to discuss your project whenever you're available.",
-                3: "Last reminder about scheduling a call. Let us know if you'd like to connect with our team!",
-            },
-            FollowUpScenario.CALL_MISSED: {
-                1: "Hi! We missed you on our scheduled call. Would you like to reschedule?",
-                2: "Following up on our missed call. We're happy to find another time that works for you.",
-                3: "Final follow-up about rescheduling. Let us know if you'd still like to connect!",
-            },
-            FollowUpScenario.PROPOSAL_SENT: {
-                1: "Hi! Just checking if you had a chance to review the proposal we sent?",
-                2: "Following up on the proposal. Do you have any questions or need clarification on anything?",
-                3: "Last follow-up on our proposal. We're here if you need any additional information!",
-            },
-        }
-
-        return messages.get(scenario, {}).get(attempt, "Following up on your inquiry.")
+        return _FOLLOW_UP_TEMPLATES.get((scenario, attempt), _DEFAULT_FOLLOW_UP_MESSAGE)
 
     async def schedule_follow_up(
         self,
         lead_id: UUID,
         scenario: FollowUpScenario,
-        attempt: int = 1
+        attempt: int = 1,
+        now: Optional[datetime] = None
     ) -> FollowUp:
         """
         Schedule a follow-up for a lead.
@@ -118,6 +134,7 @@ class FollowUpScheduler:
             lead_id: Lead ID
             scenario: Follow-up scenario
             attempt: Attempt number (1, 2, or 3)
+            now: Base time (naive UTC), defaults to the current time
 
         Returns:
             Created FollowUp record
@@ -132,7 +149,7 @@ class FollowUpScheduler:
             raise ValueError("Maximum 3 follow-up attempts allowed")
 
         # Calculate scheduled time
-        scheduled_at = self.calculate_scheduled_time(datetime.utcnow(), attempt)
+        scheduled_at = self.calculate_scheduled_time(now or datetime.utcnow(), attempt)
 
         # Get message template
         message_content = self.get_follow_up_message(scenario, attempt)
@@ -217,14 +234,101 @@ class FollowUpScheduler:
 
         return follow_up
 
-    async def get_due_follow_ups(self) -> List[FollowUp]:
+    async def get_due_follow_ups(self, now: Optional[datetime] = None) -> List[FollowUp]:
         """
         Get follow-ups that are due to be sent.
 
+        Args:
+            now: Cutoff time (naive UTC), defaults to the current time
+
         Returns:
             List of due follow-ups
         """
-        return await self.follow_up_repo.get_due_follow_ups()
+        return await self.follow_up_repo.get_due_follow_ups(now=now)
+
+    async def process_due(self, concurrency: int = 16) -> int:
+        """
+        Send all due follow-ups concurrently and mark them sent.
+
+        Leads are loaded in one query up front, since the session cannot be
+        shared between concurrent tasks. Sends for different leads overlap,
+        bounded by concurrency; a lead's own follow-ups go out in order.
+        Successful sends are marked sent with a single UPDATE.
+
+        Args:
+            concurrency: Maximum number of in-flight WhatsApp sends
+
+        Returns:
+            Number of follow-ups sent
+        """
+        # One clock read per tick
+        now = datetime.utcnow()
+        due_follow_ups = await self.get_due_follow_ups(now)
+        if not due_follow_ups:
+            return 0
+
+        by_lead: Dict[UUID, List[FollowUp]] = defaultdict(list)
+        for follow_up in due_follow_ups:
+            by_lead[follow_up.lead_id].append(follow_up)
+
+        leads = {lead.id: lead for lead in await self.lead_repo.get_many(by_lead)}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        results = await asyncio.gather(*(
+            self._send_for_lead(leads.get(lead_id), follow_ups, semaphore)
+            for lead_id, follow_ups in by_lead.items()
+        ))
+        sent_ids = [follow_up_id for ids in results for follow_up_id in ids]
+
+        await self.follow_up_repo.mark_sent_many(sent_ids)
+
+        logger.info(
+            "Due follow-ups processed",
+            due=len(due_follow_ups),
+            sent=len(sent_ids)
+        )
+
+        return len(sent_ids)
+
+    async def _send_for_lead(
+        self,
+        lead: Optional[Lead],
+        follow_ups: List[FollowUp],
+        semaphore: asyncio.Semaphore
+    ) -> List[UUID]:
+        """Send a lead's due follow-ups in order, returning the IDs that were sent."""
+        if lead is None:
+            logger.warning(
+                "Lead not found for follow-up",
+                follow_up_ids=[str(follow_up.id) for follow_up in follow_ups]
+            )
+            return []
+
+        sent_ids = []
+        for follow_up in follow_ups:
+            try:
+                async with semaphore:
+                    await self.whatsapp_client.send_message(
+                        lead.phone_number,
+                        follow_up.message_content
+                    )
+            except Exception as e:
+                logger.error(
+                    "Failed to send follow-up",
+                    follow_up_id=str(follow_up.id),
+                    error=str(e)
+                )
+                continue
+
+            sent_ids.append(follow_up.id)
+            logger.info(
+                "Follow-up sent",
+                follow_up_id=str(follow_up.id),
+                lead_id=str(lead.id),
+                attempt=follow_up.attempt_number
+            )
+
+        return sent_ids
 
     async def schedule_next_attempt(self, follow_up: FollowUp) -> Optional[FollowUp]:
         """
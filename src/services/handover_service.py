@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Set
 from uuid import UUID
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.lead import Lead
@@ -7,19 +8,48 @@ from src.models.conversation import Conversation
 from src.models.enums import State
 from src.repositories.conversation_repository import ConversationRepository
 from src.repositories.human_agent_repository import HumanAgentRepository
+from src.repositories.message_repository import MessageRepository
 from src.repositories.lead_score_repository import LeadScoreRepository
+from src.integrations.llm_client import get_llm_client, LLMClient
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Handover history: conversations longer than this get an LLM summary and
+# only their most recent messages verbatim
+SUMMARY_THRESHOLD = 50
+MAX_HISTORY_MESSAGES = 500
+
+# Hierarchical summarization: messages per extract call, notes per combine call
+SUMMARY_BATCH_SIZE = 25
+SUMMARY_COMBINE_FANIN = 4
+
+EXTRACT_PROMPT = """You are helping a sales agent take over a WhatsApp conversation.
+Extract the key facts from this part of the conversation as short notes: project
+requirements, budget, timeline, objections, questions asked and commitments made.
+Respond with notes only."""
+
+COMBINE_PROMPT = """Merge these notes from consecutive parts of one sales conversation
+into a single set of notes. Keep every distinct fact, drop repetition, keep the
+chronological order. Respond with notes only."""
+
+SUMMARIZE_PROMPT = """Write a brief handover summary for a sales agent from these notes
+about a WhatsApp conversation with a lead. Cover what the lead needs, budget and
+timeline, open questions and the suggested next step. Maximum 6 sentences."""
+
+# Strong references to fire-and-forget notification tasks until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
 
 class HandoverService:
     """Service for managing human agent handovers."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, llm_client: Optional[LLMClient] = None):
         self.session = session
+        self.llm_client = llm_client or get_llm_client()
         self.conversation_repo = ConversationRepository(session)
         self.agent_repo = HumanAgentRepository(session)
+        self.message_repo = MessageRepository(session)
         self.score_repo = LeadScoreRepository(session)
 
     async def trigger_handover(
@@ -42,8 +72,9 @@ class HandoverService:
             Handover result with agent assignment
         """
         try:
-            # Create score record with handover flag
-            lead_score = await self.score_repo.create(
+            # Score insert and state change are written together by the
+            # session's next flush/commit rather than flushed one by one
+            await self.score_repo.create(
                 lead_id=lead.id,
                 total_score=score_data["total_score"],
                 budget_score=score_data["budget_score"],
@@ -59,13 +90,15 @@ class HandoverService:
             # Transition conversation to HUMAN_HANDOVER state
             conversation.previous_state = conversation.current_state
             conversation.current_state = State.HUMAN_HANDOVER
-            await self.conversation_repo.update(conversation)
 
-            # Find available agent (optional - can be assigned later)
-            available_agent = await self._find_available_agent()
+            # Reserve an agent; the takeover may still come from another one
+            available_agent_id = await self._find_available_agent()
+            conversation.human_agent_id = available_agent_id
 
-            # Notify agents (implementation depends on notification system)
-            await self._notify_agents(lead, conversation, score_data)
+            # Notify agents off the request path
+            task = asyncio.create_task(self._notify_agents(lead, conversation, score_data))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
             logger.info(
                 "Handover triggered",
@@ -80,7 +113,7 @@ class HandoverService:
                 "lead_id": str(lead.id),
                 "conversation_id": str(conversation.id),
                 "score": score_data["total_score"],
-                "available_agent": str(available_agent.id) if available_agent else None,
+                "available_agent": str(available_agent_id) if available_agent_id else None,
             }
 
         except Exception as e:
@@ -125,25 +158,31 @@ class HandoverService:
         Returns:
             Dict with conversation history, lead data, and score
         """
-        from src.repositories.message_repository import MessageRepository
-        from src.repositories.lead_repository import LeadRepository
-
-        message_repo = MessageRepository(self.session)
-        lead_repo = LeadRepository(self.session)
-
-        # Get conversation
-        conversation = await self.conversation_repo.get_by_id(conversation_id)
-        if not conversation:
+        # Conversation, lead and latest score in a single fetch
+        handover = await self.conversation_repo.get_for_handover(conversation_id)
+        if not handover:
             raise ValueError(f"Conversation {conversation_id} not found")
+        conversation, latest_score = handover
 
-        # Get lead
-        lead = await lead_repo.get_by_id(conversation.lead_id)
-
-        # Get messages
-        messages = await message_repo.list_by_conversation(conversation_id)
+        lead = conversation.lead
+        # Only the fields shown to the agent, as plain rows; the newest
+        # MAX_HISTORY_MESSAGES in chronological order
+        messages = await self.message_repo.list_by_conversation_projection(
+            conversation_id, limit=MAX_HISTORY_MESSAGES
+        )
 
-        # Get latest score
-        latest_score = await self.score_repo.get_latest_by_lead(lead.id)
+        # Long histories: summarize what was fetched, show only the recent tail verbatim
+        summary = None
+        if len(messages) > SUMMARY_THRESHOLD:
+            try:
+                summary = await self._summarize_history(messages)
+                messages = messages[-SUMMARY_THRESHOLD:]
+            except Exception as e:
+                logger.warning(
+                    "History summarization failed, returning full history",
+                    conversation_id=str(conversation_id),
+                    error=str(e)
+                )
 
         return {
             "conversation": {
@@ -170,6 +209,7 @@ class HandoverService:
                 }
                 for msg in messages
             ],
+            "summary": summary,
             "score": {
                 "total": latest_score.total_score,
                 "category": latest_score.score_category.value,
@@ -184,13 +224,64 @@ class HandoverService:
             } if latest_score else None,
         }
 
-    async def _find_available_agent(self):
-        """Find an available agent with capacity."""
-        agents = await self.agent_repo.list_available()
+    async def _summarize_history(self, messages: Sequence[Any]) -> str:
+        """
+        Summarize a long conversation with bounded-size LLM calls.
+
+        Message batches are condensed to notes concurrently, the notes are
+        merged in parallel groups until few enough remain for one call, and
+        a final call writes the summary.
 
-        # TODO: Implement load balancing logic
-        # For now, return first available agent
-        return agents[0] if agents else None
+        Args:
+            messages: Message rows (sender, content, timestamp, detected_intent)
+
+        Returns:
+            Handover summary text
+        """
+        batches = [
+            messages[i:i + SUMMARY_BATCH_SIZE]
+            for i in range(0, len(messages), SUMMARY_BATCH_SIZE)
+        ]
+        notes = await asyncio.gather(*(
+            self._llm_step(EXTRACT_PROMPT, self._format_transcript(batch))
+            for batch in batches
+        ))
+
+        while len(notes) > SUMMARY_COMBINE_FANIN:
+            groups = [
+                notes[i:i + SUMMARY_COMBINE_FANIN]
+                for i in range(0, len(notes), SUMMARY_COMBINE_FANIN)
+            ]
+            notes = await asyncio.gather(*(
+                self._llm_step(COMBINE_PROMPT, "\n\n".join(group))
+                for group in groups
+            ))
+
+        return await self._llm_step(SUMMARIZE_PROMPT, "\n\n".join(notes))
+
+    async def _llm_step(self, system_prompt: str, prompt: str) -> str:
+        """Run one summarization call, raising if the LLM request failed."""
+        response = await self.llm_client.generate_response(
+            prompt, system_prompt, temperature=0.2, max_tokens=300
+        )
+        if not response.get("success"):
+            raise RuntimeError(response.get("error", "LLM request failed"))
+        return response["response"]
+
+    @staticmethod
+    def _format_transcript(messages: Sequence[Any]) -> str:
+        """Render message rows as a plain-text transcript."""
+        return "\n".join(f"{msg.sender.value}: {msg.content}" for msg in messages)
+
+    async def _find_available_agent(self) -> Optional[UUID]:
+        """
+        Claim the least-loaded available agent with capacity.
+
+        The agent row stays locked until the turn commits along with the
+        conversation's human_agent_id, so concurrent handovers pick others.
+        """
+        agent = await self.agent_repo.claim_least_loaded()
+        return agent.id if agent else None
 
     async def _notify_agents(
         self,
@@ -1,10 +1,113 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Final, Optional
+import json
+import logging
 import re
 from src.integrations.llm_client import get_llm_client, LLMClient
+from src.utils.cache import TTLCache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+INTENT_SYSTEM_PROMPT: Final[str] = """You are an intent classifier for a sales chatbot.
+Classify the user's message into one of these intents:
+- greeting: Initial hello/hi messages
+- project_inquiry: Asking about services or projects
+- budget_question: Discussing budget or pricing
+- timeline_question: Asking about project timeline
+- pricing_inquiry: Asking for specific prices (IMPORTANT: flag this)
+- general_question: Other questions
+
+Respond ONLY with JSON in this exact format:
+{"intent": "intent_name", "confidence": 0.95}
+
+Be strict: confidence should be 0.7+ only if you're certain."""
+
+# Intents the classifier prompt allows
+LLM_INTENTS = frozenset({
+    "greeting",
+    "project_inquiry",
+    "budget_question",
+    "timeline_question",
+    "pricing_inquiry",
+    "general_question",
+})
+
+# Fallback for replies that are not valid JSON (trailing commas, prose around it)
+_INTENT_JSON_RE = re.compile(
+    r'"intent"\s*:\s*"([^"]+)".*?"confidence"\s*:\s*([\d.]+)', re.DOTALL
+)
+
+# Exact-match cache of classifications, keyed by normalized message text.
+# Traffic is highly repetitive ("hi", "how much?"), so repeats skip the LLM.
+_intent_cache = TTLCache(maxsize=4096, ttl=600)
+
+
+def _cache_key(message: str) -> str:
+    """Normalize message text for the intent cache (case and whitespace)."""
+    return " ".join(message.lower().split())
+
+
+def _default_intent() -> Dict[str, Any]:
+    """Classification used when neither patterns nor the LLM decide."""
+    return {"intent": "general_question", "confidence": 0.6, "method": "default"}
+
+
+# Intent patterns for quick detection (fallback if LLM fails)
+INTENT_PATTERNS = {
+    "greeting": [
+        r"\b(hi|hello|hey|good morning|good afternoon|good evening)\b",
+    ],
+    "project_inquiry": [
+        r"\b(need|want|looking for|require)\b.*\b(website|app|mobile|platform|system)\b",
+    ],
+    "pricing_inquiry": [
+        r"\b(price|cost|how much|pricing|quote|estimate)\b",
+    ],
+    "budget_question": [
+        r"\b(budget|afford|spend|investment)\b",
+    ],
+    "timeline_question": [
+        r"\b(when|timeline|deadline|how long|duration)\b",
+    ],
+}
+
+# All intents fused into one alternation of named groups so a message is
+# scanned once; the earliest match in the message wins and lastgroup names it.
+# Compiled once per process; IntentDetector is created per message.
+_INTENT_RE = re.compile(
+    "|".join(
+        f"(?P<{intent}>{'|'.join(patterns)})"
+        for intent, patterns in INTENT_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Pricing keywords (constitution: pricing questions go to a human). Substring
+# semantics are kept on purpose: "prices", "costs" and "payments" must match.
+_PRICING_RE = re.compile(
+    r"price|cost|how much|pricing|quote|estimate|payment|pay", re.IGNORECASE
+)
+
+# Budget forms fused into one alternation; the named groups say which form
+# matched so the amount is computed from the same match
+_BUDGET_RE = re.compile(
+    r"\$\s*(?P<amount>\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?P<amount_k>k|thousand)?"  # $5000, $5k
+    r"|(?P<plain>\d+(?:,\d{3})*)\s*(?:dollars|usd|\$)"  # 5000 dollars
+    r"|(?P<low>\d+)\s*-\s*(?P<high>\d+)\s*(?P<range_k>k|thousand)?",  # 5-10k range
+    re.IGNORECASE,
+)
+
+_TIMELINE_RES = [
+    re.compile(r"(\d+)\s*(week|month|day)s?", re.IGNORECASE),
+    re.compile(r"(urgent|asap|immediately)", re.IGNORECASE),
+    re.compile(r"(flexible|no rush)", re.IGNORECASE),
+]
+
+# Every timeline match contains one of these: a digit, or u (urgent, no rush),
+# p (asap), y (immediately), x (flexible). ASCII text without any of them
+# cannot match, so it skips the regex scans.
+_TIMELINE_HINT_CHARS = frozenset("0123456789uUpPyYxX")
+
 
 class IntentDetector:
     """Service for detecting user intent from messages."""
@@ -12,25 +115,6 @@ class IntentDetector:
     def __init__(self, llm_client: Optional[LLMClient] = None):
         self.llm_client = llm_client or get_llm_client()
 
-        # Intent patterns for quick detection (fallback if LLM fails)
-        self.patterns = {
-            "greeting": [
-                r"\b(hi|hello|hey|good morning|good afternoon|good evening)\b",
-            ],
-            "project_inquiry": [
-                r"\b(need|want|looking for|require)\b.*\b(website|app|mobile|platform|system)\b",
-            ],
-            "pricing_inquiry": [
-                r"\b(price|cost|how much|pricing|quote|estimate)\b",
-            ],
-            "budget_question": [
-                r"\b(budget|afford|spend|investment)\b",
-            ],
-            "timeline_question": [
-                r"\b(when|timeline|deadline|how long|duration)\b",
-            ],
-        }
-
     async def detect_intent(self, message: str) -> Dict[str, Any]:
         """
         Detect intent from user message.
@@ -41,74 +125,134 @@ class IntentDetector:
         Returns:
             Dict with intent, confidence, and optional extracted data
         """
+        # Deterministic fast path: a pattern hit needs no LLM round-trip
+        pattern_result = self.detect_intent_sync(message)
+        if pattern_result is not None:
+            return pattern_result
+        pattern_result = _default_intent()
+
+        # Cache holds LLM outcomes only; pattern hits are cheaper to recompute
+        key = _cache_key(message)
+        cached = _intent_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            # Try LLM-based intent detection first
+            # Only messages no pattern recognizes go to the LLM
             result = await self._detect_with_llm(message)
+            if result is None:
+                # Failed or unparseable call: not cached, so the LLM is retried
+                return pattern_result
 
             # Validate confidence threshold (constitution: 70%)
             if result["confidence"] >= 0.7:
-                logger.info(
-                    "Intent detected",
-                    intent=result["intent"],
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info(
+                        "Intent detected",
+                        intent=result["intent"],
+                        confidence=result["confidence"],
+                    )
+            else:
+                # If confidence too low, keep the pattern default
+                logger.warning(
+                    "Low confidence from LLM, using pattern default",
                     confidence=result["confidence"],
                 )
-                return result
+                result = pattern_result
 
-            # If confidence too low, try pattern matching
-            logger.warning(
-                "Low confidence from LLM, trying pattern matching",
-                confidence=result["confidence"],
-            )
-            return self._detect_with_patterns(message)
+            _intent_cache.set(key, result)
+            return dict(result)
 
         except Exception as e:
             logger.error("Intent detection failed", error=str(e))
-            # Fallback to pattern matching
-            return self._detect_with_patterns(message)
-
-    async def _detect_with_llm(self, message: str) -> Dict[str, Any]:
-        """Detect intent using LLM."""
-        system_prompt = """You are an intent classifier for a sales chatbot.
-        Classify the user's message into one of these intents:
-        - greeting: Initial hello/hi messages
-        - project_inquiry: Asking about services or projects
-        - budget_question: Discussing budget or pricing
-        - timeline_question: Asking about project timeline
-        - pricing_inquiry: Asking for specific prices (IMPORTANT: flag this)
-        - general_question: Other questions
-
-        Respond ONLY with JSON in this exact format:
-        {"intent": "intent_name", "confidence": 0.95}
-
-        Be strict: confidence should be 0.7+ only if you're certain."""
+            # Fallback to the pattern default (not cached, so the LLM is retried)
+            return pattern_result
 
+    async def _detect_with_llm(self, message: str) -> Optional[Dict[str, Any]]:
+        """Detect intent using LLM; None if the call failed or the reply is unusable."""
         response = await self.llm_client.generate_response(
-            message, system_prompt, temperature=0.3, max_tokens=50
+            message, INTENT_SYSTEM_PROMPT, temperature=0.3, max_tokens=50
         )
 
         if not response.get("success"):
-            return {"intent": "general_question", "confidence": 0.5}
+            return None
 
-        # Parse LLM response
-        # TODO: Implement proper JSON parsing
-        # For now, return mock response
-        return {"intent": "general_question", "confidence": 0.8}
+        parsed = self._parse_llm_intent(response["response"])
+        if parsed is None:
+            logger.warning("Unparseable intent response", response=response["response"][:200])
 
-    def _detect_with_patterns(self, message: str) -> Dict[str, Any]:
-        """Detect intent using regex patterns (fallback)."""
-        message_lower = message.lower()
+        return parsed
 
-        for intent, patterns in self.patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, message_lower, re.IGNORECASE):
-                    return {
-                        "intent": intent,
-                        "confidence": 0.85,  # Pattern matching is fairly reliable
-                        "method": "pattern",
-                    }
+    @staticmethod
+    def _parse_llm_intent(text: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the classifier's JSON reply defensively.
+
+        Tries the outermost {...} span as JSON first, then a regex over the
+        raw text. Unknown intents are rejected and confidence is clamped to
+        0-1.
 
-        # Default to general question
-        return {"intent": "general_question", "confidence": 0.6, "method": "default"}
+        Args:
+            text: Raw LLM response text
+
+        Returns:
+            Dict with intent, confidence and method, or None if unparseable
+        """
+        intent = confidence = None
+
+        start = text.find("{")
+        end = text.rfind("}")
+        if start >= 0 and end > start:
+            try:
+                data = json.loads(text[start:end + 1])
+                intent = data["intent"]
+                confidence = float(data["confidence"])
+            except (ValueError, TypeError, KeyError):
+                intent = confidence = None
+
+        if intent is None:
+            match = _INTENT_JSON_RE.search(text)
+            if match:
+                try:
+                    intent, confidence = match.group(1), float(match.group(2))
+                except ValueError:
+                    return None
+
+        if not isinstance(intent, str) or intent not in LLM_INTENTS:
+            return None
+
+        return {
+            "intent": intent,
+            "confidence": min(max(confidence, 0.0), 1.0),
+            "method": "llm",
+        }
+
+    def detect_intent_sync(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Detect intent from regex patterns alone, without the LLM.
+
+        For callers outside the event loop (workers, batch jobs) and as the
+        first step of detect_intent.
+
+        Args:
+            message: User message text
+
+        Returns:
+            Pattern classification, or None if no pattern matches
+        """
+        match = _INTENT_RE.search(message)
+        if match is None:
+            return None
+
+        return {
+            "intent": match.lastgroup,
+            "confidence": 0.85,  # Pattern matching is fairly reliable
+            "method": "pattern",
+        }
+
+    def _detect_with_patterns(self, message: str) -> Dict[str, Any]:
+        """Detect intent using regex patterns (fallback)."""
+        return self.detect_intent_sync(message) or _default_intent()
 
     def is_pricing_inquiry(self, message: str) -> bool:
         """
@@ -120,19 +264,7 @@ class IntentDetector:
         Returns:
             True if pricing inquiry detected
         """
-        message_lower = message.lower()
-        pricing_keywords = [
-            "price",
-            "cost",
-            "how much",
-            "pricing",
-            "quote",
-            "estimate",
-            "payment",
-            "pay",
-        ]
-
-        return any(keyword in message_lower for keyword in pricing_keywords)
+        return _PRICING_RE.search(message) is not None
 
     def extract_budget(self, message: str) -> Optional[Dict[str, Any]]:
         """
@@ -142,24 +274,29 @@ class IntentDetector:
             message: User message
 
         Returns:
-            Dict with budget string and numeric value, or None
+            Dict with budget string and numeric value (whole dollars), or None
         """
-        # Pattern for currency amounts
-        patterns = [
-            r"\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:k|thousand)?",  # $5000, $5k
-            r"(\d+(?:,\d{3})*)\s*(?:dollars|usd|\$)",  # 5000 dollars
-            r"(\d+)\s*-\s*(\d+)\s*(?:k|thousand)?",  # 5-10k range
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                # Extract numeric value
-                budget_str = match.group(0)
-                # TODO: Implement proper budget parsing
-                return {"budget": budget_str, "budget_numeric": 5000}
-
-        return None
+        match = _BUDGET_RE.search(message)
+        if not match:
+            return None
+
+        groups = match.groupdict()
+        if groups["amount"] is not None:
+            amount = groups["amount"].replace(",", "")
+            value = float(amount) if "." in amount else int(amount)
+            multiplier = 1000 if groups["amount_k"] else 1
+        elif groups["plain"] is not None:
+            value = int(groups["plain"].replace(",", ""))
+            multiplier = 1
+        else:
+            # Ranges are scored on their midpoint
+            value = (int(groups["low"]) + int(groups["high"])) / 2
+            multiplier = 1000 if groups["range_k"] else 1
+
+        return {
+            "budget": match.group(0).strip(),
+            "budget_numeric": int(round(value * multiplier)),
+        }
 
     def extract_timeline(self, message: str) -> Optional[str]:
         """
@@ -171,14 +308,12 @@ class IntentDetector:
         Returns:
             Timeline string or None
         """
-        timeline_patterns = [
-            r"(\d+)\s*(week|month|day)s?",
-            r"(urgent|asap|immediately)",
-            r"(flexible|no rush)",
-        ]
-
-        for pattern in timeline_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        # \d also matches non-ASCII digits, so only ASCII text is pre-rejected
+        if message.isascii() and _TIMELINE_HINT_CHARS.isdisjoint(message):
+            return None
+
+        for regex in _TIMELINE_RES:
+            match = regex.search(message)
             if match:
                 return match.group(0)
 
@@ -1,9 +1,53 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from bisect import bisect_right
+import logging
+import re
 from src.models.enums import ScoreCategory
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Budget score bands: a budget at or above BUDGET_THRESHOLDS[i] scores
+# BUDGET_SCORES[i + 1]; anything below the first threshold scores BUDGET_SCORES[0]
+BUDGET_THRESHOLDS = (3000, 5000, 7000, 10000, 20000)
+BUDGET_SCORES = (5, 10, 15, 20, 25, 30)
+
+# Score category by total (FR-008): below 40 LOW, 40-69 MEDIUM, 70+ HIGH
+SCORE_CATEGORY_EDGES = (40, 70)
+SCORE_CATEGORIES = (ScoreCategory.LOW, ScoreCategory.MEDIUM, ScoreCategory.HIGH)
+
+# Timeline keyword tiers in priority order (first tier with any match wins)
+TIMELINE_TIERS = (
+    (("urgent", "asap", "immediately", "1 week", "2 weeks"), 25),
+    (("1 month", "2 months", "1-2 months"), 18),
+    (("2-3 months", "3 months"), 12),
+    (("flexible", "no rush", "6 months", "later"), 5),
+)
+
+# Country score by ISO 3166-1 alpha-2 code: high-value (15), medium-value (10)
+# markets; anything else scores 7
+COUNTRY_SCORES: Dict[str, int] = {
+    **dict.fromkeys(("US", "GB", "CA", "AU", "DE", "FR", "NL", "SE", "NO", "DK"), 15),
+    **dict.fromkeys(("IN", "BR", "MX", "ES", "IT", "PL", "SG", "AE"), 10),
+}
+
+# Reasoning text per score band, same bisect layout as the budget table:
+# a score at or above EDGES[i] gets REASONS[i + 1]
+BUDGET_REASON_EDGES = (15, 25)
+BUDGET_REASONS = ("Low budget", "Medium budget ($5k-$10k)", "High budget ($10k+)")
+TIMELINE_REASON_EDGES = (10, 20)
+TIMELINE_REASONS = ("Flexible timeline", "Normal timeline", "Urgent timeline")
+CLARITY_REASON_EDGES = (10, 15)
+CLARITY_REASONS = ("Vague requirements", "Moderate clarity", "Clear requirements")
+BEHAVIOR_REASON_EDGES = (6, 8)
+BEHAVIOR_REASONS = ("Limited engagement", None, "Engaged communication")
+
+# One case-insensitive substring alternation per tier
+_TIMELINE_RES = tuple(
+    (re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE), score)
+    for words, score in TIMELINE_TIERS
+)
+
 
 class LeadScorer:
     """Lead scoring engine that calculates lead quality based on multiple factors."""
@@ -26,31 +70,8 @@ class LeadScorer:
         Returns:
             Dict with total_score, component scores, category, and reasoning
         """
-        # Calculate component scores (FR-007)
-        budget_score = self.calculate_budget_score(
-            lead_data.get("budget_numeric"),
-            lead_data.get("budget_avoidance_count", 0)
-        )
-
-        timeline_score = self.calculate_timeline_score(
-            lead_data.get("timeline")
-        )
-
-        clarity_score = self.calculate_clarity_score(
-            lead_data.get("project_type"),
-            lead_data.get("timeline") is not None,
-            lead_data.get("budget_numeric") is not None,
-            lead_data.get("message_count", 0)
-        )
-
-        country_score = self.calculate_country_score(
-            lead_data.get("country")
-        )
-
-        behavior_score = self.calculate_behavior_score(
-            lead_data.get("budget_avoidance_count", 0),
-            lead_data.get("message_count", 0),
-            lead_data.get("response_pattern", "normal")
+        budget_score, timeline_score, clarity_score, country_score, behavior_score = (
+            self._component_scores(lead_data)
         )
 
         # Calculate total (FR-008: 0-100 scale)
@@ -71,16 +92,17 @@ class LeadScorer:
             country_score, behavior_score, lead_data
         )
 
-        logger.info(
-            "Lead scored",
-            total_score=total_score,
-            category=score_category.value,
-            budget=budget_score,
-            timeline=timeline_score,
-            clarity=clarity_score,
-            country=country_score,
-            behavior=behavior_score
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Lead scored",
+                total_score=total_score,
+                category=score_category.value,
+                budget=budget_score,
+                timeline=timeline_score,
+                clarity=clarity_score,
+                country=country_score,
+                behavior=behavior_score
+            )
 
         return {
             "total_score": total_score,
@@ -93,6 +115,54 @@ class LeadScorer:
             "reasoning": reasoning,
         }
 
+    def calculate_total_score_batch(
+        self, leads: List[Dict[str, Any]]
+    ) -> List[Tuple[int, ScoreCategory]]:
+        """
+        Score many leads at once (CRM exports, nightly rescoring).
+
+        Uses the same component rules as calculate_total_score but skips the
+        per-lead reasoning text and log line, logging one summary instead.
+
+        Args:
+            leads: Lead data dicts, as accepted by calculate_total_score
+
+        Returns:
+            (total_score, score_category) per lead, in input order
+        """
+        results = []
+        for lead_data in leads:
+            total_score = sum(self._component_scores(lead_data))
+            results.append((total_score, self._categorize_score(total_score)))
+
+        logger.info("Lead batch scored", count=len(results))
+
+        return results
+
+    def _component_scores(self, lead_data: Dict[str, Any]) -> Tuple[int, int, int, int, int]:
+        """Calculate the five component scores (FR-007) for one lead."""
+        budget_numeric = lead_data.get("budget_numeric")
+        budget_avoidance_count = lead_data.get("budget_avoidance_count", 0)
+        timeline = lead_data.get("timeline")
+        message_count = lead_data.get("message_count", 0)
+
+        budget_score = self.calculate_budget_score(budget_numeric, budget_avoidance_count)
+        timeline_score = self.calculate_timeline_score(timeline)
+        clarity_score = self.calculate_clarity_score(
+            lead_data.get("project_type"),
+            timeline is not None,
+            budget_numeric is not None,
+            message_count
+        )
+        country_score = self.calculate_country_score(lead_data.get("country"))
+        behavior_score = self.calculate_behavior_score(
+            budget_avoidance_count,
+            message_count,
+            lead_data.get("response_pattern", "normal")
+        )
+
+        return budget_score, timeline_score, clarity_score, country_score, behavior_score
+
     def calculate_budget_score(
         self,
         budget_numeric: Optional[int],
@@ -116,18 +186,7 @@ class LeadScorer:
             return 0
 
         # Score based on budget ranges
-        if budget_numeric >= 20000:
-            return 30  # High budget
-        elif budget_numeric >= 10000:
-            return 25
-        elif budget_numeric >= 7000:
-            return 20
-        elif budget_numeric >= 5000:
-            return 15
-        elif budget_numeric >= 3000:
-            return 10
-        else:
-            return 5  # Low budget
+        return BUDGET_SCORES[bisect_right(BUDGET_THRESHOLDS, budget_numeric)]
 
     def calculate_timeline_score(self, timeline: Optional[str]) -> int:
         """
@@ -142,23 +201,10 @@ class LeadScorer:
         if not timeline:
             return 0
 
-        timeline_lower = timeline.lower()
-
-        # Urgent timelines get high scores
-        if any(word in timeline_lower for word in ["urgent", "asap", "immediately", "1 week", "2 weeks"]):
-            return 25
-
-        # Short timelines (1-2 months)
-        if any(word in timeline_lower for word in ["1 month", "2 months", "1-2 months"]):
-            return 18
-
-        # Medium timelines (2-3 months)
-        if any(word in timeline_lower for word in ["2-3 months", "3 months"]):
-            return 12
-
-        # Flexible/long timelines
-        if any(word in timeline_lower for word in ["flexible", "no rush", "6 months", "later"]):
-            return 5
+        # Urgent (25) > short (18) > medium (12) > flexible/long (5)
+        for regex, score in _TIMELINE_RES:
+            if regex.search(timeline):
+                return score
 
         # Default for specified timeline
         return 10
@@ -215,21 +261,8 @@ class LeadScorer:
         Returns:
             Country score (0-15)
         """
-        if not country:
-            return 7  # Neutral score if unknown
-
-        # High-value markets
-        high_value = ["US", "GB", "CA", "AU", "DE", "FR", "NL", "SE", "NO", "DK"]
-        if country in high_value:
-            return 15
-
-        # Medium-value markets
-        medium_value = ["IN", "BR", "MX", "ES", "IT", "PL", "SG", "AE"]
-        if country in medium_value:
-            return 10
-
-        # Other markets
-        return 7
+        # Unknown and other markets get the neutral score
+        return COUNTRY_SCORES.get(country, 7)
 
     def calculate_behavior_score(
         self,
@@ -277,12 +310,7 @@ class LeadScorer:
         Returns:
             Score category
         """
-        if total_score >= 70:
-            return ScoreCategory.HIGH
-        elif total_score >= 40:
-            return ScoreCategory.MEDIUM
-        else:
-            return ScoreCategory.LOW
+        return SCORE_CATEGORIES[bisect_right(SCORE_CATEGORY_EDGES, total_score)]
 
     def _generate_reasoning(
         self,
@@ -294,38 +322,21 @@ class LeadScorer:
         lead_data: Dict[str, Any]
     ) -> str:
         """Generate human-readable score reasoning."""
-        reasons = []
-
-        # Budget reasoning
-        if budget_score >= 25:
-            reasons.append("High budget ($10k+)")
-        elif budget_score >= 15:
-            reasons.append("Medium budget ($5k-$10k)")
-        elif lead_data.get("budget_avoidance_count", 0) >= 2:
-            reasons.append("Budget information avoided")
+        budget_band = bisect_right(BUDGET_REASON_EDGES, budget_score)
+        if budget_band == 0 and lead_data.get("budget_avoidance_count", 0) >= 2:
+            budget_reason = "Budget information avoided"
         else:
-            reasons.append("Low budget")
-
-        # Timeline reasoning
-        if timeline_score >= 20:
-            reasons.append("Urgent timeline")
-        elif timeline_score >= 10:
-            reasons.append("Normal timeline")
-        else:
-            reasons.append("Flexible timeline")
-
-        # Clarity reasoning
-        if clarity_score >= 15:
-            reasons.append("Clear requirements")
-        elif clarity_score >= 10:
-            reasons.append("Moderate clarity")
-        else:
-            reasons.append("Vague requirements")
-
-        # Behavior reasoning
-        if behavior_score >= 8:
-            reasons.append("Engaged communication")
-        elif behavior_score <= 5:
-            reasons.append("Limited engagement")
+            budget_reason = BUDGET_REASONS[budget_band]
+
+        reasons = [
+            budget_reason,
+            TIMELINE_REASONS[bisect_right(TIMELINE_REASON_EDGES, timeline_score)],
+            CLARITY_REASONS[bisect_right(CLARITY_REASON_EDGES, clarity_score)],
+        ]
+
+        # Middling behavior adds no reason
+        behavior_reason = BEHAVIOR_REASONS[bisect_right(BEHAVIOR_REASON_EDGES, behavior_score)]
+        if behavior_reason is not None:
+            reasons.append(behavior_reason)
 
         return "; ".join(reasons)
@@ -1,9 +1,12 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from uuid import UUID
+import asyncio
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.lead import Lead
 from src.models.conversation import Conversation
+from src.models.message import Message
 from src.models.enums import State, Sender, MessageType
 from src.repositories.lead_repository import LeadRepository
 from src.repositories.conversation_repository import ConversationRepository
@@ -12,7 +15,7 @@ from src.repositories.proof_asset_repository import ProofAssetRepository
 from src.services.intent_detector import IntentDetector
 from src.services.state_machine import StateMachine
 from src.services.qualification_service import QualificationService
-from src.services.response_generator import ResponseGenerator
+from src.services.response_generator import ResponseGenerator, PRICING_DEFERRAL_RESPONSE
 from src.services.session_manager import SessionManager
 from src.services.lead_scorer import LeadScorer
 from src.services.handover_service import HandoverService
@@ -20,15 +23,67 @@ from src.services.follow_up_scheduler import FollowUpScheduler
 from src.services.proof_asset_selector import ProofAssetSelector
 from src.utils.state_logger import StateLogger
 from src.utils.rate_limiter import check_rate_limit
+from src.utils.cache import TTLCache
 from src.utils.content_filter import get_content_filter
 from src.utils.logger import get_logger
 from src.integrations.whatsapp_client import get_whatsapp_client
 
 logger = get_logger(__name__)
 
+# Enum .value is a descriptor call on every access (Python < 3.12); the state
+# value is needed on every turn, so resolve them once
+_STATE_VALUES = {state: state.value for state in State}
+
+# Fixed bot replies
+SCORED_ACK_RESPONSE = "Thank you for the information. Our team will be in touch shortly."
+CALL_PUSH_RESPONSE = "Would you like to schedule a call to discuss your project in detail?"
+DEFAULT_RESPONSE = "Thank you for your message. How can I help you today?"
+HIGH_SCORE_RESPONSE = (
+    "Thank you! Based on your requirements, I'd like to connect you "
+    "with one of our senior team members who can discuss this in detail. "
+    "They'll reach out to you shortly."
+)
+MEDIUM_SCORE_RESPONSE = (
+    "Great! Let me share some relevant examples of our work. "
+    "We've helped similar businesses achieve their goals."
+)
+LOW_SCORE_RESPONSE = (
+    "Thank you for your interest! We'll follow up with you soon "
+    "with more information about how we can help."
+)
+
+# Replies whose filtered form the content filter can memoize
+_CANNED_RESPONSES = frozenset({
+    PRICING_DEFERRAL_RESPONSE,
+    SCORED_ACK_RESPONSE,
+    CALL_PUSH_RESPONSE,
+    DEFAULT_RESPONSE,
+    HIGH_SCORE_RESPONSE,
+    MEDIUM_SCORE_RESPONSE,
+    LOW_SCORE_RESPONSE,
+})
+
+# WhatsApp message IDs this worker has stored and committed. Redeliveries of
+# the same message (webhook retries) are answered from here without Redis or
+# DB round-trips; only committed IDs are added, so a rolled-back turn is
+# still reprocessed on retry.
+_processed_message_ids = TTLCache(maxsize=10_000, ttl=3600)
+
+
+def mark_message_processed(whatsapp_message_id: str) -> None:
+    """Record a message ID once its turn has been committed."""
+    _processed_message_ids.set(whatsapp_message_id, True)
+
 
 class MessageProcessor:
-    """Orchestrator for processing incoming WhatsApp messages."""
+    """
+    Orchestrator for processing incoming WhatsApp messages.
+
+    A turn runs in the caller's session transaction (get_db_session commits
+    once at the end). Changes to the loaded lead and conversation are left
+    to the unit of work instead of being flushed one by one; explicit
+    flushes remain only where a generated id is needed straight away.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -64,32 +119,52 @@ class MessageProcessor:
             Processing result with response
         """
         try:
+            # Known redelivery: skip the rate limit and DB lookups entirely
+            if whatsapp_message_id in _processed_message_ids:
+                logger.info("Duplicate message ignored", message_id=whatsapp_message_id)
+                return {"status": "duplicate"}
+
+            # Rate limit check (Redis) overlaps the DB lookups; the lookups
+            # share one session, so they stay sequential with each other.
+            # Both are awaited before any error is raised, so the session is
+            # never left mid-query.
+            rate_limited, sender = await asyncio.gather(
+                check_rate_limit(phone_number),
+                self._lookup_sender(phone_number, whatsapp_message_id),
+                return_exceptions=True,
+            )
+            for outcome in (rate_limited, sender):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            existing_message, lead = sender
+
             # Check rate limiting (constitution: 10 msg/min)
-            if await check_rate_limit(phone_number):
+            if rate_limited:
                 logger.warning("Rate limit exceeded", phone=phone_number)
                 return {"status": "rate_limited"}
 
             # Check for duplicate message
-            existing_message = await self.message_repo.get_by_whatsapp_id(
-                whatsapp_message_id
-            )
             if existing_message:
+                mark_message_processed(whatsapp_message_id)
                 logger.info("Duplicate message ignored", message_id=whatsapp_message_id)
                 return {"status": "duplicate"}
 
-            # Get or create lead
-            lead = await self.lead_repo.get_by_phone(phone_number)
+            # Get or create lead (upsert only on a miss; returning leads stay read-only)
             if not lead:
-                lead = await self.lead_repo.create(phone_number)
-                logger.info("New lead created", lead_id=str(lead.id), phone=phone_number)
+                lead, created = await self.lead_repo.get_or_create(phone_number)
+                if created:
+                    logger.info("New lead created", lead_id=str(lead.id), phone=phone_number)
 
             # Get or create active conversation
             conversation = await self.conversation_repo.get_active_by_lead(lead.id)
             if not conversation:
-                conversation = await self.conversation_repo.create(lead.id)
-                logger.info(
-                    "New conversation created", conversation_id=str(conversation.id)
+                conversation, created = await self.conversation_repo.get_or_create_active(
+                    lead.id
                 )
+                if created:
+                    logger.info(
+                        "New conversation created", conversation_id=str(conversation.id)
+                    )
 
             # Check if human has taken over
             if not conversation.is_bot_active:
@@ -108,13 +183,16 @@ class MessageProcessor:
 
             # Detect intent
             intent_result = await self.intent_detector.detect_intent(message_text)
-            logger.info(
-                "Intent detected",
-                intent=intent_result["intent"],
-                confidence=intent_result["confidence"],
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    "Intent detected",
+                    intent=intent_result["intent"],
+                    confidence=intent_result["confidence"],
+                )
 
-            # Store incoming message
+            # Store incoming message. Flush now: the unique whatsapp_message_id
+            # insert makes a concurrent redelivery block and fail here, before
+            # either copy can send a reply.
             await self.message_repo.create(
                 conversation.id,
                 Sender.LEAD,
@@ -123,6 +201,7 @@ class MessageProcessor:
                 detected_intent=intent_result["intent"],
                 intent_confidence=intent_result["confidence"],
                 whatsapp_message_id=whatsapp_message_id,
+                flush=True,
             )
 
             # Cancel any pending follow-ups (lead responded)
@@ -130,10 +209,7 @@ class MessageProcessor:
 
             # Check for pricing inquiry (constitution: defer to human)
             if self.intent_detector.is_pricing_inquiry(message_text):
-                response_text = (
-                    "Pricing is customized based on your specific needs. "
-                    "Let me connect you with our team to discuss this in detail."
-                )
+                response_text = PRICING_DEFERRAL_RESPONSE
                 await self._send_response(conversation, lead, response_text)
                 return {"status": "pricing_deferred", "response": response_text}
 
@@ -152,6 +228,16 @@ class MessageProcessor:
             logger.error("Message processing failed", error=str(e), phone=phone_number)
             return {"status": "error", "error": str(e)}
 
+    async def _lookup_sender(
+        self, phone_number: str, whatsapp_message_id: str
+    ) -> Tuple[Optional[Message], Optional[Lead]]:
+        """Look up an already-stored copy of the message and the sender's lead."""
+        existing_message = await self.message_repo.get_by_whatsapp_id(whatsapp_message_id)
+        if existing_message:
+            return existing_message, None
+
+        return None, await self.lead_repo.get_by_phone(phone_number)
+
     async def _process_by_state(
         self,
         lead: Lead,
@@ -160,73 +246,103 @@ class MessageProcessor:
         intent: Dict[str, Any],
     ) -> str:
         """Process message based on current conversation state."""
-        current_state = conversation.current_state
+        handler = self._STATE_HANDLERS.get(
+            conversation.current_state, MessageProcessor._handle_default
+        )
+        return await handler(self, lead, conversation, message, intent)
 
-        if current_state == State.GREETING:
-            # Transition to intent detection
-            await self._transition_state(
-                conversation, State.INTENT_DETECTION, "greeting_received"
-            )
-            return await self.response_generator.generate_greeting_response(lead)
+    async def _handle_greeting(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """GREETING: greet and move to intent detection."""
+        # Transition to intent detection
+        await self._transition_state(
+            conversation, State.INTENT_DETECTION, "greeting_received"
+        )
+        return await self.response_generator.generate_greeting_response(lead)
+
+    async def _handle_intent_detection(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """INTENT_DETECTION: start qualification."""
+        # Transition to qualification
+        await self._transition_state(
+            conversation, State.QUALIFICATION, "intent_detected"
+        )
+        return await self.response_generator.generate_qualification_start(lead)
 
-        elif current_state == State.INTENT_DETECTION:
-            # Transition to qualification
+    async def _handle_qualification(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """QUALIFICATION: record answers, then score or ask the next question."""
+        # Process qualification data
+        result = await self.qualification_service.process_message(
+            lead, message, intent
+        )
+
+        if result["is_complete"]:
+            # Qualification complete, move to scoring
             await self._transition_state(
-                conversation, State.QUALIFICATION, "intent_detected"
+                conversation, State.SCORING, "qualification_complete"
             )
-            return await self.response_generator.generate_qualification_start(lead)
 
-        elif current_state == State.QUALIFICATION:
-            # Process qualification data
-            result = await self.qualification_service.process_message(
-                lead, message, intent
-            )
+            # Calculate lead score
+            score_result = await self._calculate_and_handle_score(lead, conversation)
 
-            if result["is_complete"]:
-                # Qualification complete, move to scoring
-                await self._transition_state(
-                    conversation, State.SCORING, "qualification_complete"
-                )
+            return score_result["response"]
 
-                # Calculate lead score
-                score_result = await self._calculate_and_handle_score(lead, conversation)
-
-                return score_result["response"]
-            else:
-                # Ask next question
-                next_question = result["next_question"]
-                response = self.qualification_service.get_next_question_text(next_question)
-
-                # Try to inject proof asset during qualification (US4)
-                asset_message = await self._try_inject_proof_asset(lead, conversation)
-                if asset_message:
-                    response = f"{response}\n\n{asset_message}"
-
-                return response
-
-        elif current_state == State.SCORING:
-            # Already scored, determine next action
-            return "Thank you for the information. Our team will be in touch shortly."
-
-        elif current_state == State.PROOF_DELIVERY:
-            # Inject proof asset if not already done
-            asset_message = await self._try_inject_proof_asset(lead, conversation)
-            if asset_message:
-                # Transition to call push after showing proof
-                await self._transition_state(
-                    conversation, State.CALL_PUSH, "proof_delivered"
-                )
-                return f"{asset_message}\n\nWould you like to schedule a call to discuss your project in detail?"
-            else:
-                # No relevant asset, skip to call push
-                await self._transition_state(
-                    conversation, State.CALL_PUSH, "no_proof_available"
-                )
-                return "Would you like to schedule a call to discuss your project in detail?"
+        # Ask next question
+        next_question = result["next_question"]
+        response = self.qualification_service.get_next_question_text(next_question)
 
-        else:
-            # Default response
-            return "Thank you for your message. How can I help you today?"
+        # Try to inject proof asset during qualification (US4)
+        asset_message = await self._try_inject_proof_asset(lead, conversation)
+        if asset_message:
+            response = f"{response}\n\n{asset_message}"
+
+        return response
+
+    async def _handle_scoring(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """SCORING: lead already scored, acknowledge."""
+        # Already scored, determine next action
+        return SCORED_ACK_RESPONSE
+
+    async def _handle_proof_delivery(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """PROOF_DELIVERY: share a proof asset if any, then push for a call."""
+        # Inject proof asset if not already done
+        asset_message = await self._try_inject_proof_asset(lead, conversation)
+        if asset_message:
+            # Transition to call push after showing proof
+            await self._transition_state(
+                conversation, State.CALL_PUSH, "proof_delivered"
+            )
+            return f"{asset_message}\n\n{CALL_PUSH_RESPONSE}"
+
+        # No relevant asset, skip to call push
+        await self._transition_state(
+            conversation, State.CALL_PUSH, "no_proof_available"
+        )
+        return CALL_PUSH_RESPONSE
+
+    async def _handle_default(
+        self, lead: Lead, conversation: Conversation, message: str, intent: Dict[str, Any]
+    ) -> str:
+        """Any other state: generic reply."""
+        # Default response
+        return DEFAULT_RESPONSE
+
+    # Per-state turn handlers; states not listed get the default response
+    _STATE_HANDLERS = {
+        State.GREETING: _handle_greeting,
+        State.INTENT_DETECTION: _handle_intent_detection,
+        State.QUALIFICATION: _handle_qualification,
+        State.SCORING: _handle_scoring,
+        State.PROOF_DELIVERY: _handle_proof_delivery,
+    }
 
     async def _transition_state(
         self, conversation: Conversation, new_state: State, trigger: str
@@ -242,26 +358,29 @@ class MessageProcessor:
             conversation.id, old_state, new_state, trigger
         )
 
-        # Update conversation
+        # Update conversation (written with the turn's commit)
         conversation.previous_state = old_state
         conversation.current_state = new_state
-        await self.conversation_repo.update(conversation)
-
-        logger.info(
-            "State transition",
-            conversation_id=str(conversation.id),
-            from_state=old_state.value,
-            to_state=new_state.value,
-            trigger=trigger,
-        )
+
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "State transition",
+                conversation_id=str(conversation.id),
+                from_state=_STATE_VALUES[old_state],
+                to_state=_STATE_VALUES[new_state],
+                trigger=trigger,
+            )
 
     async def _send_response(
         self, conversation: Conversation, lead: Lead, response_text: str
     ) -> None:
         """Send response to lead via WhatsApp."""
-        # Validate and sanitize response
-        response_text = self.content_filter.enforce_brevity(response_text)
-        response_text = self.content_filter.sanitize_response(response_text)
+        # Validate and sanitize response; canned replies are filtered once
+        if response_text in _CANNED_RESPONSES:
+            response_text = self.content_filter.filter_canned(response_text)
+        else:
+            response_text = self.content_filter.enforce_brevity(response_text)
+            response_text = self.content_filter.sanitize_response(response_text)
 
         # Store bot message
         await self.message_repo.create(
@@ -271,9 +390,8 @@ class MessageProcessor:
         # Send via WhatsApp
         await self.whatsapp_client.send_message(lead.phone_number, response_text)
 
-        # Update conversation message count
-        conversation.message_count += 1
-        await self.conversation_repo.update(conversation)
+        # Update conversation message count (atomic, safe across concurrent turns)
+        await self.conversation_repo.increment_message_count(conversation)
 
     async def _calculate_and_handle_score(
         self, lead: Lead, conversation: Conversation
@@ -293,12 +411,13 @@ class MessageProcessor:
         # Calculate score
         score_result = self.lead_scorer.calculate_total_score(lead_data)
 
-        logger.info(
-            "Lead scored",
-            lead_id=str(lead.id),
-            total_score=score_result["total_score"],
-            category=score_result["score_category"].value
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Lead scored",
+                lead_id=str(lead.id),
+                total_score=score_result["total_score"],
+                category=score_result["score_category"].value
+            )
 
         # Handle based on score category (FR-008, FR-009)
         if score_result["total_score"] >= 70:
@@ -306,20 +425,13 @@ class MessageProcessor:
             await self.handover_service.trigger_handover(
                 conversation, lead, score_result, reason="high_score"
             )
-            response = (
-                "Thank you! Based on your requirements, I'd like to connect you "
-                "with one of our senior team members who can discuss this in detail. "
-                "They'll reach out to you shortly."
-            )
+            response = HIGH_SCORE_RESPONSE
         elif score_result["total_score"] >= 40:
             # Medium score - continue with proof delivery
             await self._transition_state(
                 conversation, State.PROOF_DELIVERY, "medium_score"
             )
-            response = (
-                "Great! Let me share some relevant examples of our work. "
-                "We've helped similar businesses achieve their goals."
-            )
+            response = MEDIUM_SCORE_RESPONSE
         else:
             # Low score - schedule follow-up
             await self._transition_state(
@@ -334,10 +446,7 @@ class MessageProcessor:
                 attempt=1
             )
 
-            response = (
-                "Thank you for your interest! We'll follow up with you soon "
-                "with more information about how we can help."
-            )
+            response = LOW_SCORE_RESPONSE
 
         return {"response": response, "score": score_result}
 
@@ -360,17 +469,17 @@ class MessageProcessor:
         should_inject = self.proof_asset_selector.should_inject_asset(
             conversation_proof_asset_count=conversation.proof_asset_count,
             project_type=lead.project_type,
-            current_state=conversation.current_state.value
+            current_state=_STATE_VALUES[conversation.current_state]
         )
 
         if not should_inject:
             return None
 
-        # Get available assets
-        available_assets = await self.proof_asset_repo.list_active()
+        # Candidate assets for this project type (filtered in SQL, cached in-process)
+        available_assets = await self.proof_asset_repo.list_matching(lead.project_type)
 
         if not available_assets:
-            logger.info("No active proof assets available")
+            logger.info("No matching proof assets available", project_type=lead.project_type)
             return None
 
         # Select most relevant asset
@@ -389,18 +498,18 @@ class MessageProcessor:
         # Format asset message
         asset_message = self.proof_asset_selector.format_asset_message(selected_asset)
 
-        # Update conversation proof asset count
-        conversation.proof_asset_count += 1
-        await self.conversation_repo.update(conversation)
+        # Update conversation proof asset count (atomic, safe across concurrent turns)
+        await self.conversation_repo.increment_proof_asset_count(conversation)
 
         # Update asset usage tracking
         await self.proof_asset_repo.increment_usage(selected_asset.id)
 
-        logger.info(
-            "Proof asset injected",
-            conversation_id=str(conversation.id),
-            asset_id=str(selected_asset.id),
-            asset_title=selected_asset.title
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Proof asset injected",
+                conversation_id=str(conversation.id),
+                asset_id=str(selected_asset.id),
+                asset_title=selected_asset.title
+            )
 
         return asset_message
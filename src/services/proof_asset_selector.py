@@ -1,15 +1,32 @@
-from typing import Optional, List
+from typing import Optional, List, Union
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 
-from src.models.proof_asset import ProofAsset
+from src.models.proof_asset import ProofAsset, ProofAssetSnapshot
 from src.models.enums import State
+from src.utils.project_types import canonical_project_type
+
+# Recency score by whole days since last use: at or above RECENCY_DAYS[i]
+# scores RECENCY_SCORES[i + 1]; used in the last 3 days scores 0.2
+RECENCY_DAYS = (3, 7, 14, 30)
+RECENCY_SCORES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+# Usage score by usage count: at most USAGE_COUNTS[i] scores USAGE_SCORES[i];
+# more than 50 uses scores 0.1
+USAGE_COUNTS = (0, 1, 2, 3, 4, 5, 10, 20, 50)
+USAGE_SCORES = (1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.6, 0.4, 0.2, 0.1)
+
+# Rows from a session or cached snapshots; both expose the same attributes
+ProofAssetLike = Union[ProofAsset, ProofAssetSnapshot]
 
 
 class ProofAssetSelector:
     """Service for selecting and injecting relevant proof assets during conversations."""
 
     # States where asset injection is appropriate
-    INJECTION_STATES = [State.QUALIFICATION, State.PROOF_DELIVERY]
+    INJECTION_STATES = (State.QUALIFICATION, State.PROOF_DELIVERY)
+    # Callers pass the state's string value
+    _INJECTION_STATE_VALUES = frozenset(state.value for state in INJECTION_STATES)
 
     # Max assets per conversation (constitution requirement)
     MAX_ASSETS_PER_CONVERSATION = 1
@@ -40,7 +57,7 @@ class ProofAssetSelector:
             return False
 
         # Only inject in appropriate states
-        if current_state not in [s.value for s in self.INJECTION_STATES]:
+        if current_state not in self._INJECTION_STATE_VALUES:
             return False
 
         return True
@@ -48,15 +65,15 @@ class ProofAssetSelector:
     def select_asset(
         self,
         project_type: str,
-        available_assets: List[ProofAsset]
-    ) -> Optional[ProofAsset]:
+        available_assets: List[ProofAssetLike]
+    ) -> Optional[ProofAssetLike]:
         """
         Select the most relevant proof asset for the given project type.
 
         Selection algorithm:
-        1. Filter to active assets only
+        1. Skip inactive assets
         2. Calculate relevance score for each asset
-        3. Return asset with highest score
+        3. Return the first asset with the highest score of at least 0.5
         4. Return None if no relevant assets found
 
         Args:
@@ -64,39 +81,37 @@ class ProofAssetSelector:
             available_assets: List of available proof assets
 
         Returns:
-            Selected ProofAsset or None if no relevant match
+            Selected asset or None if no relevant match
         """
         if not available_assets:
             return None
 
-        # Filter to active assets only
-        active_assets = [a for a in available_assets if a.is_active]
+        # One clock read and one lead normalization per selection
+        now = datetime.utcnow()
+        lead_type = (project_type or "").lower().strip()
+        lead_canonical = canonical_project_type(lead_type)
 
-        if not active_assets:
-            return None
+        # Single pass keeping the best so far; ties go to the earlier asset.
+        # Starting the bar at 0.5 drops assets with very low relevance, so
+        # only truly relevant assets are selected.
+        best_asset = None
+        best_score = 0.5
+        for asset in available_assets:
+            if not asset.is_active:
+                continue
 
-        # Calculate relevance score for each asset
-        scored_assets = [
-            (asset, self.calculate_relevance_score(asset, project_type))
-            for asset in active_assets
-        ]
+            score = self._relevance_score(asset, lead_type, lead_canonical, now)
+            if score > best_score or (best_asset is None and score == best_score):
+                best_asset = asset
+                best_score = score
 
-        # Filter out assets with very low relevance (< 0.5)
-        # Higher threshold ensures only truly relevant assets are selected
-        relevant_assets = [(a, s) for a, s in scored_assets if s >= 0.5]
-
-        if not relevant_assets:
-            return None
-
-        # Sort by score (descending) and return highest
-        relevant_assets.sort(key=lambda x: x[1], reverse=True)
-
-        return relevant_assets[0][0]
+        return best_asset
 
     def calculate_relevance_score(
         self,
-        asset: ProofAsset,
-        project_type: str
+        asset: ProofAssetLike,
+        project_type: str,
+        now: Optional[datetime] = None
     ) -> float:
         """
         Calculate relevance score for an asset based on multiple factors.
@@ -109,17 +124,32 @@ class ProofAssetSelector:
         Args:
             asset: The proof asset to score
             project_type: The lead's project type
+            now: Current time (naive UTC), defaults to the current time
 
         Returns:
             Relevance score between 0.0 and 1.0
         """
+        lead_type = (project_type or "").lower().strip()
+        return self._relevance_score(
+            asset, lead_type, canonical_project_type(lead_type), now
+        )
+
+    def _relevance_score(
+        self,
+        asset: ProofAssetLike,
+        lead_type: str,
+        lead_canonical: str,
+        now: Optional[datetime]
+    ) -> float:
+        """Relevance score for an already-normalized lead project type."""
         score = 0.0
 
         # Component 1: Project type match (weight: 0.6)
         # Primary factor for relevance
-        project_type_score = self._calculate_project_type_score(
-            asset.project_type,
-            project_type
+        project_type_score = self._match_project_type(
+            asset.normalized_project_type,
+            lead_type,
+            lead_canonical
         )
         score += project_type_score * 0.6
 
@@ -130,31 +160,27 @@ class ProofAssetSelector:
 
         # Component 3: Usage recency (weight: 0.15)
         # Secondary factor to distribute usage over time
-        recency_score = self._calculate_recency_score(asset.last_used_at)
+        recency_score = self._calculate_recency_score(asset.last_used_at, now)
         score += recency_score * 0.15
 
         return min(score, 1.0)  # Cap at 1.0
 
-    def _calculate_project_type_score(
-        self,
-        asset_project_type: str,
-        lead_project_type: str
-    ) -> float:
+    @staticmethod
+    def _match_project_type(asset_type: str, lead_type: str, lead_canonical: str) -> float:
         """
         Calculate project type match score.
 
+        Both types are already lowercased and stripped: the asset side is
+        memoized on the instance, the lead side normalized once per selection.
+
         Returns:
-            1.0 for exact match, 0.0 for no match
+            1.0 for the same canonical type, 0.7 for partial match, 0.0 for no match
         """
-        if not asset_project_type or not lead_project_type:
+        if not asset_type or not lead_type:
             return 0.0
 
-        # Normalize to lowercase for comparison
-        asset_type = asset_project_type.lower().strip()
-        lead_type = lead_project_type.lower().strip()
-
-        # Exact match
-        if asset_type == lead_type:
+        # Exact match, aliases included (e.g. "shop" and "e-commerce")
+        if canonical_project_type(asset_type) == lead_canonical:
             return 1.0
 
         # Partial match (e.g., "e-commerce" in "e-commerce-website")
@@ -166,7 +192,8 @@ class ProofAssetSelector:
 
     def _calculate_recency_score(
         self,
-        last_used_at: Optional[datetime]
+        last_used_at: Optional[datetime],
+        now: Optional[datetime] = None
     ) -> float:
         """
         Calculate recency score based on when asset was last used.
@@ -178,19 +205,10 @@ class ProofAssetSelector:
             # Never used - highest score
             return 1.0
 
-        days_since_use = (datetime.utcnow() - last_used_at).days
+        days_since_use = ((now or datetime.utcnow()) - last_used_at).days
 
         # Score decreases as recency increases
-        if days_since_use >= 30:
-            return 1.0  # Used 30+ days ago
-        elif days_since_use >= 14:
-            return 0.8  # Used 14-29 days ago
-        elif days_since_use >= 7:
-            return 0.6  # Used 7-13 days ago
-        elif days_since_use >= 3:
-            return 0.4  # Used 3-6 days ago
-        else:
-            return 0.2  # Used in last 3 days
+        return RECENCY_SCORES[bisect_right(RECENCY_DAYS, days_since_use)]
 
     def _calculate_usage_score(self, usage_count: int) -> float:
         """
@@ -199,28 +217,9 @@ class ProofAssetSelector:
         Returns:
             1.0 for never used, decreasing as usage increases
         """
-        if usage_count == 0:
-            return 1.0  # Never used - highest score
-        elif usage_count == 1:
-            return 0.95
-        elif usage_count == 2:
-            return 0.9
-        elif usage_count == 3:
-            return 0.85
-        elif usage_count == 4:
-            return 0.8
-        elif usage_count == 5:
-            return 0.75
-        elif usage_count <= 10:
-            return 0.6
-        elif usage_count <= 20:
-            return 0.4
-        elif usage_count <= 50:
-            return 0.2
-        else:
-            return 0.1  # Heavily used
-
-    def format_asset_message(self, asset: ProofAsset) -> str:
+        return USAGE_SCORES[bisect_left(USAGE_COUNTS, usage_count)]
+
+    def format_asset_message(self, asset: ProofAssetLike) -> str:
         """
         Format proof asset into a WhatsApp message.
 
@@ -1,25 +1,111 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 from uuid import UUID
+from functools import lru_cache
+import re
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.lead import Lead
-from src.repositories.lead_repository import LeadRepository
 from src.services.intent_detector import IntentDetector
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword tables, in precedence order (first matching category wins)
+PROJECT_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "website": ["website", "web site", "web app", "web application"],
+    "mobile-app": ["mobile app", "mobile application", "ios app", "android app"],
+    "e-commerce": ["e-commerce", "ecommerce", "online store", "shop"],
+    "custom-software": ["custom software", "software", "system", "platform"],
+}
+
+BUSINESS_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "startup": ["startup", "start-up", "new business"],
+    "enterprise": ["enterprise", "large company", "corporation"],
+    "agency": ["agency", "consulting"],
+    "small-business": ["small business", "smb"],
+}
+
+BUDGET_AVOIDANCE_PHRASES = [
+    "not sure",
+    "don't know",
+    "later",
+    "discuss later",
+    "flexible",
+    "depends",
+    "varies",
+]
+
+
+# Qualification fields in collection order (FR-004)
+QUALIFICATION_FIELDS = ("project_type", "budget", "timeline", "business_type")
+
+# Question text per qualification field
+QUALIFICATION_QUESTIONS: Dict[str, str] = {
+    "project_type": "What type of project are you looking to build?",
+    "budget": "What's your budget range for this project?",
+    "timeline": "When do you need this completed?",
+    "business_type": "What type of business are you?",
+}
+
+DEFAULT_QUALIFICATION_QUESTION = "Can you tell me more about your needs?"
+
+
+def _keyword_re(keywords: List[str]) -> Pattern[str]:
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# One C-level scan per category instead of a Python loop of substring probes;
+# matching ignores case, so the message is never copied to lowercase
+_PROJECT_TYPE_RES: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (label, _keyword_re(keywords)) for label, keywords in PROJECT_TYPE_KEYWORDS.items()
+)
+_BUSINESS_TYPE_RES: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (label, _keyword_re(keywords)) for label, keywords in BUSINESS_TYPE_KEYWORDS.items()
+)
+_BUDGET_AVOIDANCE_RE = _keyword_re(BUDGET_AVOIDANCE_PHRASES)
+
+
+def _first_category(
+    message: str, category_res: Tuple[Tuple[str, Pattern[str]], ...]
+) -> Optional[str]:
+    """Return the first category whose keywords occur in the message."""
+    for label, regex in category_res:
+        if regex.search(message):
+            return label
+    return None
+
+
+# Short replies ("website", "not sure", "later") repeat across leads, so their
+# results are memoized; longer messages are scanned directly to keep the
+# memo small
+_MEMO_MAX_LENGTH = 64
+
+
+@lru_cache(maxsize=4096)
+def _project_type_of(message: str) -> Optional[str]:
+    return _first_category(message, _PROJECT_TYPE_RES)
+
+
+@lru_cache(maxsize=4096)
+def _business_type_of(message: str) -> Optional[str]:
+    return _first_category(message, _BUSINESS_TYPE_RES)
+
+
+@lru_cache(maxsize=4096)
+def _is_avoidance(message: str) -> bool:
+    return _BUDGET_AVOIDANCE_RE.search(message) is not None
+
 
 class QualificationService:
     """Service for collecting and managing lead qualification data."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.lead_repo = LeadRepository(session)
         self.intent_detector = IntentDetector()
 
         # Required qualification fields (FR-004)
-        self.required_fields = ["project_type", "budget", "timeline", "business_type"]
+        self.required_fields = list(QUALIFICATION_FIELDS)
 
     async def process_message(
         self, lead: Lead, message: str, intent: Dict[str, Any]
@@ -35,69 +121,17 @@ class QualificationService:
         Returns:
             Dict with extracted data and next action
         """
-        extracted_data = {}
+        # The first missing field (in collection order) is the current stage
+        extracted_data: Dict[str, Any] = {}
         next_question = None
+        for field in QUALIFICATION_FIELDS:
+            if not getattr(lead, field):
+                handler = self._STAGE_HANDLERS[field]
+                next_question = handler(self, lead, message, extracted_data)
+                break
 
-        # Extract project type
-        if not lead.project_type:
-            project_type = self._extract_project_type(message)
-            if project_type:
-                extracted_data["project_type"] = project_type
-                lead.project_type = project_type
-                next_question = "budget"
-            else:
-                next_question = "project_type"
-
-        # Extract budget (FR-005: ask within first 6 messages)
-        elif not lead.budget:
-            budget_data = self.intent_detector.extract_budget(message)
-            if budget_data:
-                extracted_data["budget"] = budget_data["budget"]
-                extracted_data["budget_numeric"] = budget_data["budget_numeric"]
-                lead.budget = budget_data["budget"]
-                lead.budget_numeric = budget_data["budget_numeric"]
-                next_question = "timeline"
-            else:
-                # Check for budget avoidance (FR-006)
-                if self._is_budget_avoidance(message):
-                    lead.budget_avoidance_count += 1
-                    logger.info(
-                        "Budget avoidance detected",
-                        lead_id=str(lead.id),
-                        count=lead.budget_avoidance_count,
-                    )
-
-                    if lead.budget_avoidance_count >= 2:
-                        # Flag budget avoidance, move to next question
-                        extracted_data["budget_avoidance_flagged"] = True
-                        next_question = "timeline"
-                    else:
-                        next_question = "budget"
-                else:
-                    next_question = "budget"
-
-        # Extract timeline
-        elif not lead.timeline:
-            timeline = self.intent_detector.extract_timeline(message)
-            if timeline:
-                extracted_data["timeline"] = timeline
-                lead.timeline = timeline
-                next_question = "business_type"
-            else:
-                next_question = "timeline"
-
-        # Extract business type
-        elif not lead.business_type:
-            business_type = self._extract_business_type(message)
-            if business_type:
-                extracted_data["business_type"] = business_type
-                lead.business_type = business_type
-                next_question = None  # Qualification complete
-            else:
-                next_question = "business_type"
-
-        # Update lead
-        await self.lead_repo.update(lead)
+        # The lead is attached to the turn's session; its changes are written
+        # by the commit, not flushed here
 
         return {
             "extracted_data": extracted_data,
@@ -105,6 +139,79 @@ class QualificationService:
             "is_complete": self.is_qualification_complete(lead),
         }
 
+    def _collect_project_type(
+        self, lead: Lead, message: str, extracted_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Project type stage; returns the next question."""
+        project_type = self._extract_project_type(message)
+        if not project_type:
+            return "project_type"
+
+        extracted_data["project_type"] = project_type
+        lead.project_type = project_type
+        return "budget"
+
+    def _collect_budget(
+        self, lead: Lead, message: str, extracted_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Budget stage (FR-005: ask within first 6 messages); returns the next question."""
+        budget_data = self.intent_detector.extract_budget(message)
+        if budget_data:
+            extracted_data["budget"] = budget_data["budget"]
+            extracted_data["budget_numeric"] = budget_data["budget_numeric"]
+            lead.budget = budget_data["budget"]
+            lead.budget_numeric = budget_data["budget_numeric"]
+            return "timeline"
+
+        # Check for budget avoidance (FR-006)
+        if not self._is_budget_avoidance(message):
+            return "budget"
+
+        lead.budget_avoidance_count += 1
+        logger.info(
+            "Budget avoidance detected",
+            lead_id=str(lead.id),
+            count=lead.budget_avoidance_count,
+        )
+
+        if lead.budget_avoidance_count >= 2:
+            # Flag budget avoidance, move to next question
+            extracted_data["budget_avoidance_flagged"] = True
+            return "timeline"
+        return "budget"
+
+    def _collect_timeline(
+        self, lead: Lead, message: str, extracted_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Timeline stage; returns the next question."""
+        timeline = self.intent_detector.extract_timeline(message)
+        if not timeline:
+            return "timeline"
+
+        extracted_data["timeline"] = timeline
+        lead.timeline = timeline
+        return "business_type"
+
+    def _collect_business_type(
+        self, lead: Lead, message: str, extracted_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Business type stage; returns None once qualification is complete."""
+        business_type = self._extract_business_type(message)
+        if not business_type:
+            return "business_type"
+
+        extracted_data["business_type"] = business_type
+        lead.business_type = business_type
+        return None  # Qualification complete
+
+    # Per-stage collectors, keyed by the lead field they fill
+    _STAGE_HANDLERS = {
+        "project_type": _collect_project_type,
+        "budget": _collect_budget,
+        "timeline": _collect_timeline,
+        "business_type": _collect_business_type,
+    }
+
     def is_qualification_complete(self, lead: Lead) -> bool:
         """
         Check if all required qualification fields are collected.
@@ -115,72 +222,31 @@ class QualificationService:
         Returns:
             True if qualification is complete
         """
-        return all(
-            [
-                lead.project_type,
-                lead.budget or lead.budget_avoidance_count >= 2,
-                lead.timeline,
-                lead.business_type,
-            ]
+        return bool(
+            lead.project_type
+            and (lead.budget or lead.budget_avoidance_count >= 2)
+            and lead.timeline
+            and lead.business_type
         )
 
     def _extract_project_type(self, message: str) -> Optional[str]:
         """Extract project type from message."""
-        message_lower = message.lower()
-
-        project_types = {
-            "website": ["website", "web site", "web app", "web application"],
-            "mobile-app": ["mobile app", "mobile application", "ios app", "android app"],
-            "e-commerce": ["e-commerce", "ecommerce", "online store", "shop"],
-            "custom-software": ["custom software", "software", "system", "platform"],
-        }
-
-        for project_type, keywords in project_types.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return project_type
-
-        return None
+        if len(message) <= _MEMO_MAX_LENGTH:
+            return _project_type_of(message)
+        return _first_category(message, _PROJECT_TYPE_RES)
 
     def _extract_business_type(self, message: str) -> Optional[str]:
         """Extract business type from message."""
-        message_lower = message.lower()
-
-        business_types = {
-            "startup": ["startup", "start-up", "new business"],
-            "enterprise": ["enterprise", "large company", "corporation"],
-            "agency": ["agency", "consulting"],
-            "small-business": ["small business", "smb"],
-        }
-
-        for business_type, keywords in business_types.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return business_type
-
-        return None
+        if len(message) <= _MEMO_MAX_LENGTH:
+            return _business_type_of(message)
+        return _first_category(message, _BUSINESS_TYPE_RES)
 
     def _is_budget_avoidance(self, message: str) -> bool:
         """Check if message indicates budget avoidance."""
-        message_lower = message.lower()
-
-        avoidance_phrases = [
-            "not sure",
-            "don't know",
-            "later",
-            "discuss later",
-            "flexible",
-            "depends",
-            "varies",
-        ]
-
-        return any(phrase in message_lower for phrase in avoidance_phrases)
+        if len(message) <= _MEMO_MAX_LENGTH:
+            return _is_avoidance(message)
+        return _BUDGET_AVOIDANCE_RE.search(message) is not None
 
     def get_next_question_text(self, question_type: str) -> str:
         """Get question text for next qualification field."""
-        questions = {
-            "project_type": "What type of project are you looking to build?",
-            "budget": "What's your budget range for this project?",
-            "timeline": "When do you need this completed?",
-            "business_type": "What type of business are you?",
-        }
-
-        return questions.get(question_type, "Can you tell me more about your needs?")
+        return QUALIFICATION_QUESTIONS.get(question_type, DEFAULT_QUALIFICATION_QUESTION)
@@ -1,7 +1,59 @@
-from typing import Optional
+from typing import Any, Dict, Optional
+import asyncio
+import re
 from src.models.lead import Lead
 from src.integrations.llm_client import get_llm_client, LLMClient
+from src.utils.cache import TTLCache
 from src.utils.content_filter import get_content_filter
+from src.utils.metrics import record_llm_call_avoided
+
+RESPONSE_SYSTEM_PROMPT = """You are a friendly sales assistant for a software development company.
+Your role is to qualify leads by asking about their project needs.
+
+Guidelines:
+- Keep responses SHORT (1-3 sentences, max 300 characters)
+- Be conversational and friendly
+- Never commit to specific prices
+- Ask one question at a time
+- Be confident and professional"""
+
+GREETING_RESPONSE = (
+    "Hi! Thanks for reaching out. "
+    "I'm here to help you with your project. What are you looking to build?"
+)
+
+PRICING_DEFERRAL_RESPONSE = (
+    "Pricing is customized based on your specific needs and requirements. "
+    "Let me connect you with our team to discuss this in detail."
+)
+
+# Pricing questions answered with the deferral instead of the LLM. Whole
+# words only, so "costume" or "payroll" do not match; budget is left out
+# because leads mention it when answering the bot's own budget question.
+_PRICING_QUESTION_RE = re.compile(
+    r"\b(price|prices|pricing|cost|costs|how much|quote)\b", re.IGNORECASE
+)
+
+# Messages that are only a greeting ("hi", "Hello there!"); anything more goes
+# to the LLM
+_GREETING_RE = re.compile(
+    r"^\s*(hi|hello|hey|good (morning|afternoon|evening))(\s+there)?[\s!.,]*$",
+    re.IGNORECASE,
+)
+
+# Raw LLM replies keyed by normalized message text. Short repeats ("hi", "ok",
+# "tell me more") skip the LLM; the content filter still runs on every hit so
+# blacklist changes apply to cached text.
+_response_cache = TTLCache(maxsize=2000, ttl=1800)
+
+# LLM calls in flight, by cache key; concurrent identical messages (webhook
+# bursts) await the same call instead of each starting one
+_in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _cache_key(prompt: str) -> str:
+    """Normalize message text for the response cache (case and whitespace)."""
+    return " ".join(prompt.lower().split())
 
 
 class ResponseGenerator:
@@ -14,10 +66,7 @@ class ResponseGenerator:
     async def generate_greeting_response(self, lead: Lead) -> str:
         """Generate greeting response."""
         # Use template for consistency
-        return (
-            "Hi! Thanks for reaching out. "
-            "I'm here to help you with your project. What are you looking to build?"
-        )
+        return GREETING_RESPONSE
 
     async def generate_qualification_start(self, lead: Lead) -> str:
         """Generate response to start qualification."""
@@ -31,41 +80,72 @@ class ResponseGenerator:
 
         Args:
             prompt: User message
-            context: Conversation context
+            context: Conversation context; replies are cached only without it
 
         Returns:
             Generated response
         """
-        system_prompt = """You are a friendly sales assistant for a software development company.
-        Your role is to qualify leads by asking about their project needs.
-
-        Guidelines:
-        - Keep responses SHORT (1-3 sentences, max 300 characters)
-        - Be conversational and friendly
-        - Never commit to specific prices
-        - Ask one question at a time
-        - Be confident and professional"""
-
-        response = await self.llm_client.generate_response(
-            prompt, system_prompt, temperature=0.7, max_tokens=100
-        )
+        # Replies that need no LLM: pricing always defers to a human, and a
+        # bare greeting gets the greeting template unless already qualified
+        if _PRICING_QUESTION_RE.search(prompt):
+            record_llm_call_avoided("pricing")
+            return PRICING_DEFERRAL_RESPONSE
+        if _GREETING_RE.match(prompt) and not (context and context.get("lead_qualified")):
+            record_llm_call_avoided("greeting")
+            return GREETING_RESPONSE
 
-        if response.get("success"):
-            text = response["response"]
-            # Enforce brevity and brand safety
-            text = self.content_filter.enforce_brevity(text)
-            text = self.content_filter.sanitize_response(text)
-            return text
+        # Context-dependent replies are lead-specific and never cached
+        key = _cache_key(prompt) if context is None else None
+        text = _response_cache.get(key) if key is not None else None
+
+        if text is not None:
+            record_llm_call_avoided("cache_hit")
         else:
-            # Fallback response
-            return "Thanks for your message. Can you tell me more about what you're looking for?"
+            if key is not None:
+                response = await self._generate_shared(key, prompt)
+            else:
+                response = await self._generate(prompt)
+
+            if not response.get("success"):
+                # Fallback response
+                return "Thanks for your message. Can you tell me more about what you're looking for?"
+
+            text = response["response"]
+            if key is not None:
+                _response_cache.set(key, text)
+
+        # Enforce brevity and brand safety
+        text = self.content_filter.enforce_brevity(text)
+        text = self.content_filter.sanitize_response(text)
+        return text
+
+    async def _generate(self, prompt: str) -> Dict[str, Any]:
+        """Call the LLM for a reply to prompt."""
+        return await self.llm_client.generate_response(
+            prompt, RESPONSE_SYSTEM_PROMPT, temperature=0.7, max_tokens=100
+        )
+
+    async def _generate_shared(self, key: str, prompt: str) -> Dict[str, Any]:
+        """
+        Call the LLM, sharing one in-flight call among callers with the same key.
+
+        Failed results are shared with the concurrent callers too, but not
+        cached, so the next message retries.
+        """
+        call = _in_flight.get(key)
+        if call is None or call.get_loop() is not asyncio.get_running_loop():
+            call = asyncio.ensure_future(self._generate(prompt))
+            _in_flight[key] = call
+            call.add_done_callback(
+                lambda done: _in_flight.pop(key, None) if _in_flight.get(key) is done else None
+            )
+
+        # A cancelled caller must not cancel the call for the others
+        return await asyncio.shield(call)
 
     async def generate_pricing_deferral(self) -> str:
         """Generate response for pricing inquiries (constitution requirement)."""
-        return (
-            "Pricing is customized based on your specific needs and requirements. "
-            "Let me connect you with our team to discuss this in detail."
-        )
+        return PRICING_DEFERRAL_RESPONSE
 
     async def generate_budget_question(self, attempt: int = 1) -> str:
         """Generate budget question (FR-005: ask within first 6 messages)."""
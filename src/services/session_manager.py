@@ -4,6 +4,33 @@ from src.db.redis_client import RedisClient
 from src.models.lead import Lead
 from src.models.conversation import Conversation
 
+# Compact separators keep values small; one encoder instance avoids
+# json.dumps building a new encoder for non-default options on every call
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Sessions are Redis hashes with one JSON-encoded value per field. The prefix
+# is versioned because earlier releases stored a single JSON string under
+# session:{phone}; those keys simply expire.
+_KEY_PREFIX = "session:v2:"
+
+# Write the changed fields of an existing session and reset its TTL,
+# atomically and in one round-trip. Missing sessions are left absent.
+# ARGV[1] is the TTL, followed by field/value pairs.
+_UPDATE_SESSION_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if #ARGV > 1 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def _session_key(phone_number: str) -> str:
+    return f"{_KEY_PREFIX}{phone_number}"
+
 
 class SessionManager:
     """Manage conversation session state in Redis."""
@@ -11,40 +38,57 @@ class SessionManager:
     def __init__(self):
         self.redis = RedisClient()
         self.session_ttl = 3600  # 1 hour
+        self._update_script = None
 
     async def get_session(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """Get session data for a phone number."""
         await self.redis.connect()
-        key = f"session:{phone_number}"
-        data = await self.redis.get(key)
+        fields = await self.redis.client.hgetall(_session_key(phone_number))
 
-        if data:
-            return json.loads(data)
+        if fields:
+            return {field: json.loads(value) for field, value in fields.items()}
         return None
 
     async def set_session(
         self, phone_number: str, session_data: Dict[str, Any]
     ) -> None:
-        """Set session data for a phone number."""
+        """Replace session data for a phone number."""
         await self.redis.connect()
-        key = f"session:{phone_number}"
-        data = json.dumps(session_data)
-        await self.redis.set(key, data, ex=self.session_ttl)
+        key = _session_key(phone_number)
+
+        async with self.redis.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if session_data:
+                pipe.hset(key, mapping={
+                    field: _encode_json(value) for field, value in session_data.items()
+                })
+                pipe.expire(key, self.session_ttl)
+            await pipe.execute()
 
     async def update_session(
         self, phone_number: str, updates: Dict[str, Any]
     ) -> None:
-        """Update session data."""
-        session = await self.get_session(phone_number)
-        if session:
-            session.update(updates)
-            await self.set_session(phone_number, session)
+        """
+        Update session data.
+
+        Only the changed fields are sent; a Lua script writes them if the
+        session exists, so the check and write are one round-trip and
+        concurrent updates to different fields cannot overwrite each other.
+        """
+        if self._update_script is None:
+            await self.redis.connect()
+            self._update_script = self.redis.client.register_script(_UPDATE_SESSION_LUA)
+
+        args = [self.session_ttl]
+        for field, value in updates.items():
+            args.append(field)
+            args.append(_encode_json(value))
+
+        await self._update_script(keys=[_session_key(phone_number)], args=args)
 
     async def delete_session(self, phone_number: str) -> None:
         """Delete session data."""
-        await self.redis.connect()
-        key = f"session:{phone_number}"
-        await self.redis.delete(key)
+        await self.redis.delete(_session_key(phone_number))
 
     async def store_conversation_context(
         self, phone_number: str, lead: Lead, conversation: Conversation
@@ -1,29 +1,42 @@
-from typing import Dict, Set, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional
 from src.models.enums import State
 
+_NO_STATES: FrozenSet[State] = frozenset()
+
+# Shared read-only context for callers that pass none
+_EMPTY_CONTEXT: Mapping = MappingProxyType({})
+
+_QUALIFYING_INTENTS = frozenset({"project_inquiry", "greeting", "general_question"})
+
+# Lead fields that must be filled before scoring
+_REQUIRED_FIELDS = ("project_type", "budget", "timeline", "business_type")
+
 
 class StateMachine:
     """State machine for managing conversation flow."""
 
-    def __init__(self):
-        # Define valid state transitions
-        self.transitions: Dict[State, Set[State]] = {
-            State.GREETING: {State.INTENT_DETECTION, State.HUMAN_HANDOVER},
-            State.INTENT_DETECTION: {State.QUALIFICATION, State.HUMAN_HANDOVER},
-            State.QUALIFICATION: {State.SCORING, State.HUMAN_HANDOVER},
-            State.SCORING: {
-                State.PROOF_DELIVERY,
-                State.CALL_PUSH,
-                State.HUMAN_HANDOVER,
-                State.FOLLOW_UP,
-            },
-            State.PROOF_DELIVERY: {State.CALL_PUSH, State.HUMAN_HANDOVER},
-            State.CALL_PUSH: {State.HUMAN_HANDOVER, State.FOLLOW_UP, State.EXIT},
-            State.HUMAN_HANDOVER: {State.FOLLOW_UP, State.EXIT},
-            State.FOLLOW_UP: {State.QUALIFICATION, State.EXIT, State.PARK},
-            State.EXIT: set(),  # Terminal state
-            State.PARK: {State.FOLLOW_UP, State.EXIT},  # Inactive conversations
-        }
+    # Stateless; the transition table is shared by every instance
+    __slots__ = ()
+
+    # Define valid state transitions (built once, immutable)
+    transitions: Mapping[State, FrozenSet[State]] = MappingProxyType({
+        State.GREETING: frozenset({State.INTENT_DETECTION, State.HUMAN_HANDOVER}),
+        State.INTENT_DETECTION: frozenset({State.QUALIFICATION, State.HUMAN_HANDOVER}),
+        State.QUALIFICATION: frozenset({State.SCORING, State.HUMAN_HANDOVER}),
+        State.SCORING: frozenset({
+            State.PROOF_DELIVERY,
+            State.CALL_PUSH,
+            State.HUMAN_HANDOVER,
+            State.FOLLOW_UP,
+        }),
+        State.PROOF_DELIVERY: frozenset({State.CALL_PUSH, State.HUMAN_HANDOVER}),
+        State.CALL_PUSH: frozenset({State.HUMAN_HANDOVER, State.FOLLOW_UP, State.EXIT}),
+        State.HUMAN_HANDOVER: frozenset({State.FOLLOW_UP, State.EXIT}),
+        State.FOLLOW_UP: frozenset({State.QUALIFICATION, State.EXIT, State.PARK}),
+        State.EXIT: _NO_STATES,  # Terminal state
+        State.PARK: frozenset({State.FOLLOW_UP, State.EXIT}),  # Inactive conversations
+    })
 
     def can_transition(self, from_state: State, to_state: State) -> bool:
         """
@@ -41,7 +54,7 @@ class StateMachine:
             return True
 
         # Check if transition is in allowed transitions
-        return to_state in self.transitions.get(from_state, set())
+        return to_state in self.transitions.get(from_state, _NO_STATES)
 
     def get_next_state(
         self, current_state: State, trigger: str, context: Optional[Dict] = None
@@ -57,54 +70,71 @@ class StateMachine:
         Returns:
             Next state
         """
-        context = context or {}
-
-        # State transition logic
-        if current_state == State.GREETING:
-            if trigger == "message_received":
-                return State.INTENT_DETECTION
-
-        elif current_state == State.INTENT_DETECTION:
-            intent = context.get("intent")
-            if intent in ["project_inquiry", "greeting", "general_question"]:
-                return State.QUALIFICATION
-
-        elif current_state == State.QUALIFICATION:
-            # Check if all required fields are collected
-            if self._is_qualification_complete(context):
-                return State.SCORING
-
-        elif current_state == State.SCORING:
-            score = context.get("score", 0)
-            if score >= 70:
-                return State.HUMAN_HANDOVER
-            elif score >= 40:
-                return State.PROOF_DELIVERY
-            else:
-                return State.FOLLOW_UP
-
-        elif current_state == State.PROOF_DELIVERY:
-            return State.CALL_PUSH
-
-        elif current_state == State.CALL_PUSH:
-            if context.get("call_booked"):
-                return State.HUMAN_HANDOVER
-            else:
-                return State.FOLLOW_UP
+        handler = self._NEXT_STATE_HANDLERS.get(current_state)
+        if handler is None:
+            return current_state
 
-        # Default: stay in current state
-        return current_state
+        next_state = handler(self, trigger, _EMPTY_CONTEXT if context is None else context)
 
-    def _is_qualification_complete(self, context: Dict) -> bool:
+        # Default: stay in current state
+        return current_state if next_state is None else next_state
+
+    def _next_from_greeting(self, trigger: str, context: Mapping) -> Optional[State]:
+        """GREETING: any message starts intent detection."""
+        if trigger == "message_received":
+            return State.INTENT_DETECTION
+        return None
+
+    def _next_from_intent_detection(self, trigger: str, context: Mapping) -> Optional[State]:
+        """INTENT_DETECTION: qualify leads with a recognized opening intent."""
+        if context.get("intent") in _QUALIFYING_INTENTS:
+            return State.QUALIFICATION
+        return None
+
+    def _next_from_qualification(self, trigger: str, context: Mapping) -> Optional[State]:
+        """QUALIFICATION: score once all required fields are collected."""
+        if self._is_qualification_complete(context):
+            return State.SCORING
+        return None
+
+    def _next_from_scoring(self, trigger: str, context: Mapping) -> Optional[State]:
+        """SCORING: route by lead score."""
+        score = context.get("score", 0)
+        if score >= 70:
+            return State.HUMAN_HANDOVER
+        elif score >= 40:
+            return State.PROOF_DELIVERY
+        return State.FOLLOW_UP
+
+    def _next_from_proof_delivery(self, trigger: str, context: Mapping) -> Optional[State]:
+        """PROOF_DELIVERY: always push for a call next."""
+        return State.CALL_PUSH
+
+    def _next_from_call_push(self, trigger: str, context: Mapping) -> Optional[State]:
+        """CALL_PUSH: hand over if a call was booked, else follow up."""
+        if context.get("call_booked"):
+            return State.HUMAN_HANDOVER
+        return State.FOLLOW_UP
+
+    # Per-state transition rules; states not listed stay where they are
+    _NEXT_STATE_HANDLERS = {
+        State.GREETING: _next_from_greeting,
+        State.INTENT_DETECTION: _next_from_intent_detection,
+        State.QUALIFICATION: _next_from_qualification,
+        State.SCORING: _next_from_scoring,
+        State.PROOF_DELIVERY: _next_from_proof_delivery,
+        State.CALL_PUSH: _next_from_call_push,
+    }
+
+    def _is_qualification_complete(self, context: Mapping) -> bool:
         """Check if all required qualification fields are collected."""
-        required_fields = ["project_type", "budget", "timeline", "business_type"]
-        lead_data = context.get("lead_data", {})
+        lead_data = context.get("lead_data", _EMPTY_CONTEXT)
 
-        return all(lead_data.get(field) for field in required_fields)
+        return all(lead_data.get(field) for field in _REQUIRED_FIELDS)
 
-    def get_allowed_transitions(self, current_state: State) -> Set[State]:
+    def get_allowed_transitions(self, current_state: State) -> FrozenSet[State]:
         """Get all allowed transitions from current state."""
-        return self.transitions.get(current_state, set())
+        return self.transitions.get(current_state, _NO_STATES)
 
     def validate_transition(self, from_state: State, to_state: State) -> None:
         """
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+import asyncio
+import time
+
+
+class TTLCache:
+    """Bounded in-process cache with per-entry expiry and LRU eviction."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def items(self) -> Iterator[tuple[Hashable, Any]]:
+        """Iterate over unexpired (key, value) pairs without touching recency."""
+        now = time.monotonic()
+        for key, (expires_at, value) in list(self._data.items()):
+            if expires_at > now:
+                yield key, value
+
+    def replace(self, key: Hashable, value: Any) -> bool:
+        """
+        Swap the value of a live entry, keeping its expiry and recency.
+
+        Returns:
+            True if the key was present and unexpired
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return False
+
+        self._data[key] = (entry[0], value)
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all keys."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class AsyncTTLCache(TTLCache):
+    """
+    TTL cache with coalesced async loads.
+
+    Concurrent misses on the same key await a single loader call instead of
+    each hitting the backing store.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._waiters: Dict[Hashable, int] = {}
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get value for key, calling loader once on a miss."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    value = await loader()
+                    self.set(key, value)
+        finally:
+            # Drop the lock with its last waiter, so keys don't pile up.
+            # lock.locked() is no guide: it reads False while a woken
+            # waiter has yet to re-acquire.
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                del self._locks[key]
+
+        return value
+
+
+_MISSING = object()
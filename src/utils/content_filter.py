@@ -1,6 +1,11 @@
-from typing import List, Set
+from typing import Dict, List, Optional, Pattern, Set
 import re
 
+# Pricing keywords, matched as case-insensitive substrings
+_PRICING_KEYWORDS_RE = re.compile(
+    "price|cost|how much|pricing|quote|estimate|budget|payment|pay", re.IGNORECASE
+)
+
 
 class ContentFilter:
     """Content filter for brand-safe language validation."""
@@ -16,38 +21,49 @@ class ContentFilter:
 
         # Patterns to detect
         self.patterns = [
-            r'\b(payment|pay|credit card|bank account)\b',  # Payment-related
-            r'\b(price|cost|how much)\b',  # Pricing (should defer to human)
+            re.compile(r'\b(payment|pay|credit card|bank account)\b', re.IGNORECASE),  # Payment-related
+            re.compile(r'\b(price|cost|how much)\b', re.IGNORECASE),  # Pricing (should defer to human)
         ]
 
+        # Filtered forms of fixed bot replies; reset whenever the blacklist changes
+        self._canned: Dict[str, str] = {}
+
+        self._blacklist_re: Optional[Pattern[str]] = None
+        self._rebuild_blacklist_re()
+
+    def _rebuild_blacklist_re(self) -> None:
+        """
+        Compile the blacklist into one case-insensitive alternation.
+
+        Longer phrases come first so an overlapping shorter phrase does not
+        pre-empt them. Also drops memoized canned replies.
+        """
+        if self.blacklist:
+            phrases = sorted(self.blacklist, key=len, reverse=True)
+            self._blacklist_re = re.compile(
+                "|".join(map(re.escape, phrases)), re.IGNORECASE
+            )
+        else:
+            self._blacklist_re = None
+        self._canned.clear()
+
     def add_to_blacklist(self, phrase: str) -> None:
         """Add phrase to blacklist."""
         self.blacklist.add(phrase.lower())
+        self._rebuild_blacklist_re()
 
     def remove_from_blacklist(self, phrase: str) -> None:
         """Remove phrase from blacklist."""
         self.blacklist.discard(phrase.lower())
+        self._rebuild_blacklist_re()
 
     def contains_blacklisted_content(self, text: str) -> bool:
         """Check if text contains blacklisted content."""
-        text_lower = text.lower()
-
-        # Check blacklist
-        for phrase in self.blacklist:
-            if phrase in text_lower:
-                return True
-
-        return False
+        return self._blacklist_re is not None and self._blacklist_re.search(text) is not None
 
     def contains_pricing_intent(self, text: str) -> bool:
         """Check if text contains pricing-related intent."""
-        text_lower = text.lower()
-        pricing_keywords = [
-            "price", "cost", "how much", "pricing", "quote",
-            "estimate", "budget", "payment", "pay"
-        ]
-
-        return any(keyword in text_lower for keyword in pricing_keywords)
+        return _PRICING_KEYWORDS_RE.search(text) is not None
 
     def is_brand_safe(self, text: str) -> bool:
         """
@@ -68,19 +84,11 @@ class ContentFilter:
         Returns:
             Sanitized text
         """
-        # Remove any blacklisted content
-        sanitized = text
-
-        for phrase in self.blacklist:
-            # Replace with asterisks
-            sanitized = re.sub(
-                re.escape(phrase),
-                "*" * len(phrase),
-                sanitized,
-                flags=re.IGNORECASE
-            )
+        if self._blacklist_re is None:
+            return text
 
-        return sanitized
+        # Replace blacklisted content with asterisks in a single pass
+        return self._blacklist_re.sub(_mask, text)
 
     def validate_message_length(self, text: str, max_length: int = 300) -> bool:
         """
@@ -105,14 +113,45 @@ class ContentFilter:
         if len(text) <= max_length:
             return text
 
-        # Truncate at sentence boundary if possible
-        truncated = text[:max_length]
-        last_period = truncated.rfind('.')
+        # Truncate at sentence boundary if possible (searched in place, so
+        # only the returned slice is copied)
+        last_period = text.rfind('.', 0, max_length)
 
         if last_period > max_length * 0.7:  # If we can keep 70%+ of content
-            return truncated[:last_period + 1]
+            return text[:last_period + 1]
+
+        return text[:max_length] + "..."
+
+    def filter_canned(self, text: str) -> str:
+        """
+        Apply enforce_brevity and sanitize_response to a fixed bot reply.
+
+        The result is memoized per text, so only pass constant strings
+        (the memo is unbounded) and never LLM output.
+
+        Args:
+            text: Canned response text
+
+        Returns:
+            Filtered text
+        """
+        filtered = self._canned.get(text)
+        if filtered is None:
+            filtered = self.sanitize_response(self.enforce_brevity(text))
+            self._canned[text] = filtered
+        return filtered
+
+
+# Longest mask served by slicing; longer matches fall back to repetition
+_MASK = "*" * 256
+
 
-        return truncated + "..."
+def _mask(match: "re.Match[str]") -> str:
+    """Asterisks the length of the matched phrase."""
+    length = match.end() - match.start()
+    if length <= len(_MASK):
+        return _MASK[:length]
+    return "*" * length
 
 
 # Global content filter instance
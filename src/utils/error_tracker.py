@@ -8,7 +8,10 @@ Provides:
 - User context for debugging
 """
 
+import hashlib
 import os
+import re
+from functools import lru_cache
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
@@ -20,6 +23,14 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Exceptions whose message mentions these are expected noise and not reported
+_DROPPED_EXCEPTION_RE = re.compile(r"rate_limit|validation", re.IGNORECASE)
+
+_SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie"})
+
+# Query parameters whose name contains a sensitive word; the value is masked
+_SENSITIVE_PARAM_RE = re.compile(r"([^&=]*(?:token|api_key|password)[^&=]*)=[^&]*")
+
 
 def init_sentry(
     dsn: Optional[str] = None,
@@ -91,16 +102,11 @@ def before_send_filter(event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[
     Returns:
         Modified event or None to drop the event
     """
-    # Filter out specific errors
+    # Filter out specific errors (rate limit and validation errors)
     if "exc_info" in hint:
         exc_type, exc_value, tb = hint["exc_info"]
 
-        # Don't send rate limit errors
-        if "rate_limit" in str(exc_value).lower():
-            return None
-
-        # Don't send validation errors
-        if "validation" in str(exc_value).lower():
+        if _DROPPED_EXCEPTION_RE.search(str(exc_value)):
             return None
 
     # Scrub sensitive data
@@ -108,20 +114,15 @@ def before_send_filter(event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[
         request = event["request"]
 
         # Remove sensitive headers
-        if "headers" in request:
-            sensitive_headers = ["authorization", "x-api-key", "cookie"]
-            for header in sensitive_headers:
-                if header in request["headers"]:
-                    request["headers"][header] = "[REDACTED]"
-
-        # Remove sensitive query params
-        if "query_string" in request:
-            sensitive_params = ["token", "api_key", "password"]
-            for param in sensitive_params:
-                if param in request["query_string"]:
-                    request["query_string"] = request["query_string"].replace(
-                        param, "[REDACTED]"
-                    )
+        headers = request.get("headers")
+        if headers:
+            for header in _SENSITIVE_HEADERS.intersection(headers):
+                headers[header] = "[REDACTED]"
+
+        # Remove sensitive query param values
+        query_string = request.get("query_string")
+        if query_string:
+            request["query_string"] = _SENSITIVE_PARAM_RE.sub(r"\1=[REDACTED]", query_string)
 
     return event
 
@@ -143,25 +144,19 @@ def capture_exception(
         Event ID or None
     """
     try:
-        with sentry_sdk.push_scope() as scope:
-            # Set level
-            scope.level = level
-
-            # Add context
-            if context:
-                for key, value in context.items():
-                    scope.set_context(key, value)
-
-            # Capture exception
-            event_id = sentry_sdk.capture_exception(error)
+        # Level and contexts go in as scope kwargs, which apply to this event
+        # only without pushing and popping a scope
+        event_id = sentry_sdk.capture_exception(
+            error, level=level, contexts=context or {}
+        )
 
-            logger.info(
-                "Exception captured by Sentry",
-                event_id=event_id,
-                error_type=type(error).__name__
-            )
+        logger.info(
+            "Exception captured by Sentry",
+            event_id=event_id,
+            error_type=type(error).__name__
+        )
 
-            return event_id
+        return event_id
 
     except Exception as e:
         logger.error("Failed to capture exception in Sentry", error=str(e))
@@ -185,25 +180,21 @@ def capture_message(
         Event ID or None
     """
     try:
-        with sentry_sdk.push_scope() as scope:
-            # Set level
-            scope.level = level
-
-            # Add context
-            if context:
-                for key, value in context.items():
-                    scope.set_context(key, value)
-
-            # Capture message
-            event_id = sentry_sdk.capture_message(message)
-
-            return event_id
+        return sentry_sdk.capture_message(
+            message, level=level, contexts=context or {}
+        )
 
     except Exception as e:
         logger.error("Failed to capture message in Sentry", error=str(e))
         return None
 
 
+@lru_cache(maxsize=4096)
+def _hash_pii(value: str) -> str:
+    """Short SHA-256 digest of a PII value (a lead's events repeat the same one)."""
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
 def set_user_context(
     user_id: Optional[str] = None,
     phone_number: Optional[str] = None,
@@ -220,8 +211,6 @@ def set_user_context(
         **kwargs: Additional user attributes
     """
     try:
-        import hashlib
-
         user_data = {}
 
         if user_id:
@@ -229,14 +218,10 @@ def set_user_context(
 
         # Hash PII for privacy
         if phone_number:
-            user_data["phone_hash"] = hashlib.sha256(
-                phone_number.encode()
-            ).hexdigest()[:16]
+            user_data["phone_hash"] = _hash_pii(phone_number)
 
         if email:
-            user_data["email_hash"] = hashlib.sha256(
-                email.encode()
-            ).hexdigest()[:16]
+            user_data["email_hash"] = _hash_pii(email)
 
         # Add additional attributes
         user_data.update(kwargs)
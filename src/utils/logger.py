@@ -1,48 +1,159 @@
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any
-import json
+import time
 
-# Configure logging format
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
 
 
-class StructuredLogger:
-    """Structured logger for JSON output."""
+class JSONLineFormatter(logging.Formatter):
+    """Emit the record's pre-serialized JSON message as-is.
 
-    def __init__(self, name: str, level: int = logging.INFO):
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
+    The payload already holds timestamp, level, logger and message, so there
+    is no format string to interpolate and no asctime to compute.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return record.getMessage()
+
+
+# Console and file handlers shared by every logger, so the process holds one
+# logs/app.log descriptor. Loggers only get a QueueHandler; a listener
+# thread does the stdout/disk writes so callers on the event loop never
+# block on them. Levels are left to the loggers.
+_handlers: List[logging.Handler] = []
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+def _shared_handlers() -> List[logging.Handler]:
+    """Create the shared queue handler and start its listener on first use."""
+    global _listener
+
+    if not _handlers:
+        formatter = JSONLineFormatter()
 
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
+        console_handler.setFormatter(formatter)
 
         # File handler
         file_handler = logging.FileHandler("logs/app.log")
-        file_handler.setLevel(level)
-
-        # Formatter
-        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-        console_handler.setFormatter(formatter)
         file_handler.setFormatter(formatter)
 
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        _listener = QueueListener(_log_queue, console_handler, file_handler)
+        _listener.start()
+        # Drains queued records on shutdown
+        atexit.register(_stop_listener)
+
+        _handlers.append(QueueHandler(_log_queue))
+
+    return _handlers
+
+
+def _stop_listener() -> None:
+    """Stop the current listener, flushing records still in the queue."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_after_fork() -> None:
+    """Give a forked child (Celery prefork, gunicorn) its own listener thread.
+
+    Threads do not survive fork; without this the child's records would
+    queue up and never be written. Records the parent had not written yet
+    are dropped so they are not logged twice.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    while not _log_queue.empty():
+        _log_queue.get_nowait()
+
+    _listener = QueueListener(_log_queue, *_listener.handlers)
+    _listener.start()
+
+
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+# (second, "YYYY-MM-DDTHH:MM:SS") for the last second a record was logged in;
+# swapped as one tuple so concurrent readers never see a mismatched pair
+_second_prefix = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds.
+
+    The date/time part is formatted once per second and reused.
+    """
+    global _second_prefix
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _second_prefix = (second, prefix)
+
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+class StructuredLogger:
+    """Structured logger for JSON output."""
+
+    def __init__(self, name: str, level: int = logging.INFO):
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(level)
+
+        # Attach handlers once per underlying logger; another StructuredLogger
+        # for the same name would otherwise duplicate every record
+        if not self.logger.handlers:
+            for handler in _shared_handlers():
+                self.logger.addHandler(handler)
+
+        # Bound log methods per level name, resolved once
+        self._log_methods = {
+            "DEBUG": self.logger.debug,
+            "INFO": self.logger.info,
+            "WARNING": self.logger.warning,
+            "ERROR": self.logger.error,
+        }
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a record at this level would be emitted.
+
+        Lets hot paths skip building log fields that would be discarded.
+        """
+        return self.logger.isEnabledFor(level)
 
     def _log_structured(self, level: str, message: str, **kwargs: Any) -> None:
         """Log structured data as JSON."""
+        # Skip the timestamp and JSON encoding when the level is filtered out
+        if not self.logger.isEnabledFor(LEVELS[level]):
+            return
+
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "level": level,
+            "logger": self.logger.name,
             "message": message,
             **kwargs
         }
 
-        log_method = getattr(self.logger, level.lower())
-        log_method(json.dumps(log_data))
+        self._log_methods[level](json.dumps(log_data))
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info level message."""
@@ -61,6 +172,13 @@ class StructuredLogger:
         self._log_structured("DEBUG", message, **kwargs)
 
 
+# One StructuredLogger per name
+_loggers: Dict[str, StructuredLogger] = {}
+
+
 def get_logger(name: str) -> StructuredLogger:
-    """Get a structured logger instance."""
-    return StructuredLogger(name)
+    """Get the structured logger for a name, creating it on first use."""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = StructuredLogger(name)
+    return logger
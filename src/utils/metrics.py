@@ -10,7 +10,8 @@ Tracks key performance indicators:
 """
 
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+import functools
 import time
 
 
@@ -154,6 +155,16 @@ proof_assets_injected_counter = Counter(
     ['asset_type']  # PORTFOLIO, CASE_STUDY, TESTIMONIAL
 )
 
+# ============================================================================
+# LLM Metrics
+# ============================================================================
+
+llm_calls_avoided_counter = Counter(
+    'bot_llm_calls_avoided_total',
+    'Total number of replies served without an LLM call',
+    ['reason']  # cache_hit, pricing, greeting
+)
+
 # ============================================================================
 # Error Metrics
 # ============================================================================
@@ -197,6 +208,21 @@ redis_connection_gauge = Gauge(
 # Helper Functions
 # ============================================================================
 
+# Bound children of labelled metrics, keyed by (metric, label values). Label
+# domains are small and fixed, so after the first event per label set the
+# record_* helpers skip labels() validation, str conversion and its lock.
+_children: Dict[Tuple[Any, Tuple[Any, ...]], Any] = {}
+
+
+def _child(metric: Any, *label_values: Any) -> Any:
+    """Get the child of a labelled metric for these label values (positional)."""
+    key = (metric, label_values)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*label_values)
+    return child
+
+
 class ResponseTimeTracker:
     """Context manager for tracking response time."""
 
@@ -204,36 +230,45 @@ class ResponseTimeTracker:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration = time.perf_counter() - self.start_time
             response_time_histogram.observe(duration)
 
 
 def track_response_time(func):
     """Decorator to track response time of async functions."""
+    # Bound once per decorated function; the start time lives in a local
+    # instead of a tracker object per call
+    observe = response_time_histogram.observe
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        with ResponseTimeTracker():
+        start = perf_counter()
+        try:
             return await func(*args, **kwargs)
+        finally:
+            observe(perf_counter() - start)
     return wrapper
 
 
 def record_message_received(sender_type: str):
     """Record a received message."""
-    messages_received_counter.labels(sender_type=sender_type).inc()
+    _child(messages_received_counter, sender_type).inc()
 
 
 def record_message_sent(message_type: str):
     """Record a sent message."""
-    messages_sent_counter.labels(message_type=message_type).inc()
+    _child(messages_sent_counter, message_type).inc()
 
 
 def record_message_failed(error_type: str):
     """Record a failed message."""
-    messages_failed_counter.labels(error_type=error_type).inc()
+    _child(messages_failed_counter, error_type).inc()
 
 
 def record_lead_created():
@@ -248,15 +283,12 @@ def record_conversation_created():
 
 def record_conversation_ended(end_reason: str):
     """Record a conversation ending."""
-    conversations_ended_counter.labels(end_reason=end_reason).inc()
+    _child(conversations_ended_counter, end_reason).inc()
 
 
 def record_state_transition(from_state: str, to_state: str):
     """Record a state transition."""
-    state_transitions_counter.labels(
-        from_state=from_state,
-        to_state=to_state
-    ).inc()
+    _child(state_transitions_counter, from_state, to_state).inc()
 
 
 def record_lead_score(score: float):
@@ -266,32 +298,37 @@ def record_lead_score(score: float):
 
 def record_handover_triggered(reason: str):
     """Record a human handover."""
-    handovers_triggered_counter.labels(reason=reason).inc()
+    _child(handovers_triggered_counter, reason).inc()
 
 
 def record_followup_scheduled(scenario: str):
     """Record a follow-up scheduled."""
-    followups_scheduled_counter.labels(scenario=scenario).inc()
+    _child(followups_scheduled_counter, scenario).inc()
 
 
 def record_followup_sent(attempt: int):
     """Record a follow-up sent."""
-    followups_sent_counter.labels(attempt=str(attempt)).inc()
+    _child(followups_sent_counter, attempt).inc()
 
 
 def record_followup_cancelled(reason: str):
     """Record a follow-up cancelled."""
-    followups_cancelled_counter.labels(reason=reason).inc()
+    _child(followups_cancelled_counter, reason).inc()
 
 
 def record_proof_asset_injected(asset_type: str):
     """Record a proof asset injection."""
-    proof_assets_injected_counter.labels(asset_type=asset_type).inc()
+    _child(proof_assets_injected_counter, asset_type).inc()
+
+
+def record_llm_call_avoided(reason: str):
+    """Record a reply served without an LLM call."""
+    _child(llm_calls_avoided_counter, reason).inc()
 
 
 def record_error(error_type: str, component: str):
     """Record an error."""
-    errors_counter.labels(error_type=error_type, component=component).inc()
+    _child(errors_counter, error_type, component).inc()
 
 
 def record_rate_limit_exceeded():
@@ -316,12 +353,12 @@ def update_redis_connection(is_connected: bool):
 
 def update_leads_by_state(state: str, count: int):
     """Update leads by state gauge."""
-    leads_by_state_gauge.labels(state=state).set(count)
+    _child(leads_by_state_gauge, state).set(count)
 
 
 def update_leads_by_score(category: str, count: int):
     """Update leads by score category gauge."""
-    leads_by_score_gauge.labels(category=category).set(count)
+    _child(leads_by_score_gauge, category).set(count)
 
 
 def update_active_conversations(count: int):
@@ -334,14 +371,33 @@ def update_active_handovers(count: int):
     handovers_active_gauge.set(count)
 
 
+# Serialized exposition reused across scrapes for this many seconds, so
+# back-to-back scrapes (several Prometheus replicas, health probes) don't
+# each walk every collector. One third of the default 15s scrape interval.
+_SNAPSHOT_MAX_AGE = 5.0
+
+# (monotonic time taken, serialized metrics); swapped as one tuple
+_snapshot: Tuple[float, bytes] = (float("-inf"), b"")
+
+
 def get_metrics() -> bytes:
     """
     Get metrics in Prometheus format.
 
+    Serves a snapshot at most _SNAPSHOT_MAX_AGE seconds old.
+
     Returns:
         Metrics in Prometheus text format
     """
-    return generate_latest()
+    global _snapshot
+
+    taken_at, payload = _snapshot
+    now = time.monotonic()
+    if now - taken_at >= _SNAPSHOT_MAX_AGE:
+        payload = generate_latest()
+        _snapshot = (now, payload)
+
+    return payload
 
 
 def get_metrics_content_type() -> str:
@@ -0,0 +1,32 @@
+from typing import Dict, FrozenSet, Mapping
+
+# Canonical project types (as produced by QualificationService) and the other
+# spellings admins use for proof assets. Keys and aliases are lowercase.
+PROJECT_TYPE_ALIASES: Mapping[str, FrozenSet[str]] = {
+    "website": frozenset({"web site", "web app", "web application"}),
+    "mobile-app": frozenset({"mobile app", "mobile application", "ios app", "android app"}),
+    "e-commerce": frozenset({"ecommerce", "online store", "shop"}),
+    "custom-software": frozenset({"custom software"}),
+}
+
+# Reverse lookup: every known spelling, canonical ones included
+_CANONICAL: Dict[str, str] = {
+    spelling: canonical
+    for canonical, aliases in PROJECT_TYPE_ALIASES.items()
+    for spelling in (canonical, *aliases)
+}
+
+
+def canonical_project_type(project_type: str) -> str:
+    """
+    Map a normalized (lowercased, stripped) project type to its canonical name.
+
+    Unknown project types are returned unchanged.
+    """
+    return _CANONICAL.get(project_type, project_type)
+
+
+def project_type_spellings(project_type: str) -> FrozenSet[str]:
+    """All normalized spellings with the same canonical project type."""
+    canonical = canonical_project_type(project_type)
+    return frozenset({canonical, *PROJECT_TYPE_ALIASES.get(canonical, ())})
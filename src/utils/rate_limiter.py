@@ -2,12 +2,27 @@ from typing import Optional
 from datetime import datetime, timedelta
 from src.db.redis_client import RedisClient
 
+# Count the request and report whether it is over the limit, atomically and in
+# one round-trip. The window starts with the first request (fixed window).
+# ARGV[1] is max_requests, ARGV[2] the window in seconds.
+_RATE_LIMIT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+if count > tonumber(ARGV[1]) then
+    return 1
+end
+return 0
+"""
+
 
 class RateLimiter:
     """Rate limiter using Redis for tracking request counts."""
 
     def __init__(self, redis_client: RedisClient):
         self.redis = redis_client
+        self._script = None
 
     async def is_rate_limited(
         self,
@@ -26,24 +41,14 @@ class RateLimiter:
         Returns:
             True if rate limited, False otherwise
         """
-        key = f"ratelimit:{identifier}"
-
-        # Get current count
-        count_str = await self.redis.get(key)
-        count = int(count_str) if count_str else 0
+        if self._script is None:
+            await self.redis.connect()
+            self._script = self.redis.client.register_script(_RATE_LIMIT_LUA)
 
-        if count >= max_requests:
-            return True
-
-        # Increment count
-        if count == 0:
-            # First request in window, set with expiration
-            await self.redis.set(key, "1", ex=window_seconds)
-        else:
-            # Increment existing count
-            await self.redis.client.incr(key)
-
-        return False
+        limited = await self._script(
+            keys=[f"ratelimit:{identifier}"], args=[max_requests, window_seconds]
+        )
+        return bool(limited)
 
     async def get_remaining_requests(
         self,
@@ -62,6 +67,10 @@ class RateLimiter:
         await self.redis.delete(key)
 
 
+# Shared by check_rate_limit so the script is registered once per process
+_rate_limiter = RateLimiter(RedisClient())
+
+
 async def check_rate_limit(phone_number: str) -> bool:
     """
     Convenience function to check rate limit for a phone number.
@@ -69,11 +78,7 @@ async def check_rate_limit(phone_number: str) -> bool:
     Returns:
         True if rate limited, False otherwise
     """
-    redis_client = RedisClient()
-    await redis_client.connect()
-
-    rate_limiter = RateLimiter(redis_client)
-    is_limited = await rate_limiter.is_rate_limited(
+    is_limited = await _rate_limiter.is_rate_limited(
         phone_number,
         max_requests=10,  # 10 messages per minute per constitution
         window_seconds=60
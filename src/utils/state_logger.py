@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Any, Dict, Iterable
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -18,17 +20,22 @@ class StateLogger:
         from_state: State,
         to_state: State,
         trigger: str = None,
-        metadata: dict = None
+        metadata: dict = None,
+        flush: bool = False
     ) -> StateTransition:
         """
         Log a state transition.
 
+        The insert rides on the session's next flush or commit unless
+        flush=True.
+
         Args:
             conversation_id: Conversation ID
             from_state: Previous state
             to_state: New state
             trigger: What triggered the transition
             metadata: Additional context
+            flush: Write the row immediately
 
         Returns:
             Created StateTransition record
@@ -38,15 +45,49 @@ class StateLogger:
             from_state=from_state,
             to_state=to_state,
             trigger=trigger,
-            metadata=metadata,
+            extra_metadata=metadata,
             transitioned_at=datetime.utcnow()
         )
 
         self.session.add(transition)
-        await self.session.flush()
+        if flush:
+            await self.session.flush()
 
         return transition
 
+    async def log_transitions_bulk(
+        self, transitions: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert several state transitions in one executemany INSERT.
+
+        Skips the unit of work: no StateTransition objects are created and
+        the rows are written immediately.
+
+        Args:
+            transitions: Dicts with conversation_id, from_state, to_state and
+                optional trigger, metadata and transitioned_at
+
+        Returns:
+            Number of transitions inserted
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "conversation_id": item["conversation_id"],
+                "from_state": item["from_state"],
+                "to_state": item["to_state"],
+                "trigger": item.get("trigger"),
+                "extra_metadata": item.get("metadata"),
+                "transitioned_at": item.get("transitioned_at", now),
+            }
+            for item in transitions
+        ]
+        if rows:
+            await self.session.execute(insert(StateTransition), rows)
+
+        return len(rows)
+
     async def get_transition_history(
         self,
         conversation_id: UUID,
@@ -15,6 +15,7 @@ celery_app = Celery(
     backend=CELERY_RESULT_BACKEND,
     include=[
         "src.workers.follow_up_worker",
+        "src.workers.metrics_worker",
     ]
 )
 
@@ -43,4 +44,8 @@ celery_app.conf.beat_schedule = {
         "task": "src.workers.follow_up_worker.check_scheduled_follow_ups",
         "schedule": 60.0,  # Every minute
     },
+    "refresh-metrics-rollup": {
+        "task": "src.workers.metrics_worker.refresh_metrics_rollup",
+        "schedule": 300.0,  # Every 5 minutes
+    },
 }
@@ -9,17 +9,16 @@ GDPR Compliance:
 
 from celery import Celery
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_
+from sqlalchemy import delete, select, and_
 from typing import Dict, Any
 
 from src.workers.celery_app import celery_app
 from src.db.connection import get_async_session
-from src.repositories.lead_repository import LeadRepository
 from src.repositories.conversation_repository import ConversationRepository
-from src.repositories.message_repository import MessageRepository
-from src.repositories.follow_up_repository import FollowUpRepository
 from src.models.lead import Lead
 from src.models.conversation import Conversation
+from src.models.message import Message
+from src.models.follow_up import FollowUp
 from src.models.enums import State
 from src.utils.logger import get_logger
 
@@ -102,36 +101,26 @@ async def _cleanup_inactive_leads(session) -> int:
         days=RETENTION_POLICY["inactive_leads_days"]
     )
 
-    lead_repo = LeadRepository(session)
-
-    # Find inactive leads in EXIT or PARK state
+    # One server-side DELETE; conversations, messages, scores and follow-ups
+    # go with it through the ON DELETE CASCADE foreign keys
     result = await session.execute(
-        select(Lead).where(
+        delete(Lead)
+        .where(
             and_(
                 Lead.current_state.in_([State.EXIT, State.PARK]),
                 Lead.updated_at < cutoff_date
             )
         )
+        .returning(Lead.id)
+        .execution_options(synchronize_session=False)
     )
+    count = len(result.all())
 
-    inactive_leads = result.scalars().all()
-    count = 0
-
-    for lead in inactive_leads:
-        try:
-            await lead_repo.delete(lead.id)
-            count += 1
-            logger.info(
-                "Deleted inactive lead",
-                lead_id=str(lead.id),
-                last_updated=lead.updated_at.isoformat()
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to delete lead",
-                lead_id=str(lead.id),
-                error=str(e)
-            )
+    logger.info(
+        "Deleted inactive leads",
+        count=count,
+        cutoff=cutoff_date.isoformat()
+    )
 
     return count
 
@@ -202,14 +191,18 @@ async def _cleanup_old_messages(session) -> int:
         days=RETENTION_POLICY["old_messages_days"]
     )
 
-    message_repo = MessageRepository(session)
-
-    # TODO: Implement bulk message deletion
-    # For now, this is a placeholder
-    # In production, you'd use bulk delete queries for efficiency
+    result = await session.execute(
+        delete(Message)
+        .where(Message.timestamp < cutoff_date)
+        .execution_options(synchronize_session=False)
+    )
+    count = result.rowcount
 
-    count = 0
-    logger.info("Message cleanup placeholder - implement bulk deletion")
+    logger.info(
+        "Deleted old messages",
+        count=count,
+        cutoff=cutoff_date.isoformat()
+    )
 
     return count
 
@@ -228,13 +221,24 @@ async def _cleanup_cancelled_followups(session) -> int:
         days=RETENTION_POLICY["cancelled_followups_days"]
     )
 
-    followup_repo = FollowUpRepository(session)
-
-    # TODO: Implement cancelled follow-up cleanup
-    # Query for cancelled follow-ups older than cutoff date
+    # No cancellation timestamp is stored, so age is taken from scheduled_at
+    result = await session.execute(
+        delete(FollowUp)
+        .where(
+            and_(
+                FollowUp.cancelled == True,
+                FollowUp.scheduled_at < cutoff_date
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    count = result.rowcount
 
-    count = 0
-    logger.info("Follow-up cleanup placeholder - implement deletion")
+    logger.info(
+        "Deleted cancelled follow-ups",
+        count=count,
+        cutoff=cutoff_date.isoformat()
+    )
 
     return count
 
@@ -266,16 +270,26 @@ async def purge_redis_cache() -> Dict[str, Any]:
             cursor, keys = await redis.scan(
                 cursor=cursor,
                 match="session:*",
-                count=100
+                count=500
             )
 
             stats["keys_scanned"] += len(keys)
 
-            for key in keys:
-                ttl = await redis.ttl(key)
-                if ttl == -1:  # No expiration set
-                    # Set expiration to 24 hours
-                    await redis.expire(key, 86400)
+            if keys:
+                # One round-trip for the page's TTLs, one for the EXPIREs
+                async with redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.ttl(key)
+                    ttls = await pipe.execute()
+
+                # -1: no expiration set
+                to_expire = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+                if to_expire:
+                    async with redis.pipeline(transaction=False) as pipe:
+                        for key in to_expire:
+                            # Set expiration to 24 hours
+                            pipe.expire(key, 86400)
+                        await pipe.execute()
 
             if cursor == 0:
                 break
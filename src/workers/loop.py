@@ -0,0 +1,19 @@
+from typing import Any, Coroutine, Optional
+import asyncio
+
+# One event loop per worker process, reused by every task. The pooled
+# asyncpg connections of the module-level engine are bound to the loop that
+# opened them; asyncio.run() per task would strand them and reconnect on
+# every beat tick. Created lazily so forked pool processes each get their own.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on the worker's persistent event loop."""
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+
+    return _loop.run_until_complete(coro)
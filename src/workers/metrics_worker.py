@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+import os
+
+from src.workers.celery_app import celery_app
+from src.workers.loop import run_in_worker_loop
+from src.db.connection import get_db_session
+from src.services.analytics_service import AnalyticsService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Hours recomputed on each run, counting the current one. Two covers the hour
+# that just closed; a larger value backfills after beat downtime.
+METRICS_ROLLUP_LOOKBACK_HOURS = int(os.getenv("METRICS_ROLLUP_LOOKBACK_HOURS", "2"))
+
+
+@celery_app.task(name="src.workers.metrics_worker.refresh_metrics_rollup")
+def refresh_metrics_rollup():
+    """
+    Periodic task to recompute the recent hourly metrics rollup buckets.
+    Runs every five minutes via Celery Beat.
+    """
+    run_in_worker_loop(_refresh_metrics_rollup())
+
+
+async def _refresh_metrics_rollup():
+    """Recompute rollup buckets for the lookback window."""
+    current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    since = current_hour - timedelta(hours=METRICS_ROLLUP_LOOKBACK_HOURS - 1)
+
+    try:
+        async with get_db_session() as session:
+            await AnalyticsService(session).refresh_rollup(since)
+
+        logger.info("Refreshed metrics rollup", since=since.isoformat())
+
+    except Exception as e:
+        logger.error("Metrics rollup refresh failed", error=str(e))
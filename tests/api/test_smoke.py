@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    "method, path, allowed_status",
+    [
+        ("GET", "/v1/health", {200}),
+        ("GET", "/v1/metrics", {200}),
+        # Root endpoint may not exist, which is fine
+        ("GET", "/", {200, 404}),
+        # Webhook verification without the hub parameters
+        ("GET", "/v1/webhook", {400, 403, 404, 405}),
+        # Webhook delivery without a WhatsApp signature
+        ("POST", "/v1/webhook", {400, 401, 403, 404, 405, 422}),
+    ],
+)
+async def test_endpoint_status(client, method, path, allowed_status):
+    """Test each public endpoint answers with an expected status code."""
+    response = await client.request(
+        method, path, json={} if method == "POST" else None
+    )
+    assert response.status_code in allowed_status
@@ -1,10 +1,18 @@
 import pytest
-import sys
-from pathlib import Path
+import pytest_asyncio
+
+# Test directories that double as markers, so one suite can run alone
+# (pytest -m unit) without importing the API stack
+SUITE_MARKERS = frozenset({"unit", "api", "integration"})
+
+
+def pytest_collection_modifyitems(items):
+    """Mark each test with the suite directory it lives in."""
+    for item in items:
+        suite = item.path.parent.name
+        if suite in SUITE_MARKERS:
+            item.add_marker(suite)
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
 
 @pytest.fixture
 def mock_env(monkeypatch):
@@ -18,3 +26,21 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("LLM_PROVIDER", "openai")
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
     monkeypatch.setenv("SECRET_KEY", "test-secret-key")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application, imported once per test session."""
+    from api.main import app as _app
+    return _app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(app):
+    """Async client calling the app in-process through ASGITransport."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as async_client:
+        yield async_client
@@ -0,0 +1,138 @@
+import pytest
+import pytest_asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+import os
+
+from sqlalchemy import event
+
+# Needs a disposable PostgreSQL database; tables are created and dropped
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+)
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect every SQL statement sent to the database while active."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Session factory on a freshly created schema, dropped afterwards."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from models import Lead
+
+    # The models register on src.models.Base; take its metadata off a model
+    metadata = Lead.metadata
+    engine = create_async_engine(TEST_DATABASE_URL)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+
+async def test_handover_context_query_count(session_factory):
+    """Test handover context loads in a fixed number of queries (no N+1)."""
+    from models import Lead, Conversation, Message, LeadScore
+    from models.enums import Sender, ScoreCategory
+    from services.handover_service import HandoverService
+
+    async with session_factory() as session:
+        lead = Lead(phone_number="+15550001111", project_type="e-commerce")
+        session.add(lead)
+        await session.flush()
+
+        conversation = Conversation(lead_id=lead.id)
+        session.add(conversation)
+        await session.flush()
+
+        for i in range(3):
+            session.add(LeadScore(
+                lead_id=lead.id, total_score=50 + i, budget_score=10,
+                timeline_score=10, clarity_score=10, country_score=10,
+                behavior_score=10 + i, score_category=ScoreCategory.MEDIUM,
+                calculated_at=datetime.utcnow() + timedelta(minutes=i),
+            ))
+        for i in range(10):
+            session.add(Message(
+                conversation_id=conversation.id,
+                sender=Sender.LEAD if i % 2 == 0 else Sender.BOT,
+                content=f"message {i}",
+            ))
+        await session.commit()
+        conversation_id = conversation.id
+
+    # Fresh session: nothing in the identity map
+    async with session_factory() as session:
+        service = HandoverService(session, llm_client=Mock())
+
+        with count_queries(session.bind) as statements:
+            context = await service.get_handover_context(conversation_id)
+
+    # conversation+lead+latest score (joined), message projection
+    assert len(statements) <= 2, statements
+    assert len(context["messages"]) == 10
+    assert context["score"]["total"] == 52
+
+
+async def test_handover_context_keeps_newest_messages(session_factory, monkeypatch):
+    """Test a history longer than the cap keeps its newest messages."""
+    from models import Lead, Conversation, Message
+    from models.enums import Sender
+    from services import handover_service
+    from services.handover_service import HandoverService
+
+    monkeypatch.setattr(handover_service, "MAX_HISTORY_MESSAGES", 6)
+    monkeypatch.setattr(handover_service, "SUMMARY_THRESHOLD", 3)
+
+    async with session_factory() as session:
+        lead = Lead(phone_number="+15550002222", project_type="e-commerce")
+        session.add(lead)
+        await session.flush()
+
+        conversation = Conversation(lead_id=lead.id)
+        session.add(conversation)
+        await session.flush()
+
+        started = datetime.utcnow()
+        for i in range(10):
+            session.add(Message(
+                conversation_id=conversation.id,
+                sender=Sender.LEAD if i % 2 == 0 else Sender.BOT,
+                content=f"message {i}",
+                timestamp=started + timedelta(seconds=i),
+            ))
+        await session.commit()
+        conversation_id = conversation.id
+
+    llm_client = Mock()
+    llm_client.generate_response = AsyncMock(
+        return_value={"response": "notes", "success": True}
+    )
+    async with session_factory() as session:
+        service = HandoverService(session, llm_client=llm_client)
+        context = await service.get_handover_context(conversation_id)
+
+    contents = [msg["content"] for msg in context["messages"]]
+    assert contents == ["message 7", "message 8", "message 9"]
+    assert context["summary"] == "notes"
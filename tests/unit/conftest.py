@@ -0,0 +1,18 @@
+import pytest
+
+
+# Stateless services, built once per test module and shared by its tests.
+# ContentFilter is not shared: tests mutate its blacklist.
+
+@pytest.fixture(scope="module")
+def state_machine():
+    """Shared StateMachine instance."""
+    from services.state_machine import StateMachine
+    return StateMachine()
+
+
+@pytest.fixture(scope="module")
+def lead_scorer():
+    """Shared LeadScorer instance."""
+    from services.lead_scorer import LeadScorer
+    return LeadScorer()
@@ -1,10 +1,4 @@
-import pytest
-from unittest.mock import Mock, patch
-import sys
-from pathlib import Path
-
-src_path = Path(__file__).parent.parent.parent / "src"
-sys.path.insert(0, str(src_path))
+from unittest.mock import patch
 
 
 def test_content_filter_initialization():
@@ -19,13 +13,41 @@ def test_content_filter_initialization():
     assert hasattr(filter, 'remove_from_blacklist')
 
 
+def test_content_filter_sanitizes_in_one_pass():
+    """Test blacklisted phrases are masked case-insensitively, longest first."""
+    from utils.content_filter import ContentFilter
+
+    filter = ContentFilter()
+    filter.add_to_blacklist("bad")
+    filter.add_to_blacklist("bad word")
+
+    assert filter.sanitize_response("A BAD word, a bad day") == "A ********, a *** day"
+    assert filter.contains_blacklisted_content("so Bad")
+    assert not filter.contains_blacklisted_content("all good")
+
+
+def test_content_filter_canned_memo_follows_blacklist():
+    """Test memoized canned replies are refiltered after blacklist changes."""
+    from utils.content_filter import ContentFilter
+
+    filter = ContentFilter()
+    text = "Thank you for your message."
+
+    assert filter.filter_canned(text) == text
+
+    filter.add_to_blacklist("message")
+    assert filter.filter_canned(text) == "Thank you for your *******."
+
+    filter.remove_from_blacklist("message")
+    assert filter.filter_canned(text) == text
+
+
 def test_rate_limiter_initialization():
     """Test rate limiter can be initialized."""
     from utils.rate_limiter import RateLimiter
-    from unittest.mock import Mock
 
-    mock_redis = Mock()
-    limiter = RateLimiter(redis_client=mock_redis)
+    # The constructor only stores the client; no Redis calls are made
+    limiter = RateLimiter(redis_client=object())
     assert limiter is not None
     assert hasattr(limiter, 'is_rate_limited')
 
@@ -41,10 +63,249 @@ def test_logger_initialization():
     assert hasattr(logger, 'warning')
 
 
-@pytest.mark.skip(reason="Prometheus metrics cause registry duplication in test environment")
+def test_logger_attaches_handlers_once():
+    """Test a second logger for the same name does not duplicate handlers."""
+    from utils.logger import get_logger
+
+    first = get_logger("test_logger_handlers")
+    handler_count = len(first.logger.handlers)
+    get_logger("test_logger_handlers")
+
+    assert len(first.logger.handlers) == handler_count
+
+
+def test_loggers_are_shared_by_name():
+    """Test get_logger reuses instances and file handlers across names."""
+    from utils.logger import get_logger
+
+    first = get_logger("test_logger_shared_a")
+    other = get_logger("test_logger_shared_b")
+
+    assert get_logger("test_logger_shared_a") is first
+    assert first.logger.handlers == other.logger.handlers
+
+
+def test_logger_timestamp_matches_isoformat():
+    """Test cached-prefix timestamps keep the ISO 8601 layout and clock."""
+    from datetime import datetime
+    from utils.logger import _utc_timestamp
+
+    before = datetime.utcnow()
+    stamp = _utc_timestamp()
+    after = datetime.utcnow()
+
+    assert len(stamp) == len("2024-01-01T00:00:00.000000")
+    assert before <= datetime.fromisoformat(stamp) <= after
+
+
+def test_logger_emits_json_lines():
+    """Test handlers write the structured payload as a bare JSON line."""
+    import json
+    from utils.logger import JSONLineFormatter, get_logger
+
+    logger = get_logger("test_logger_json")
+    records = []
+    logger.logger.handle = records.append
+    try:
+        logger.info("hello", lead_id="abc")
+    finally:
+        del logger.logger.handle
+
+    payload = json.loads(JSONLineFormatter().format(records[0]))
+    assert payload["message"] == "hello"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "test_logger_json"
+    assert payload["lead_id"] == "abc"
+
+
 def test_metrics_initialization():
-    """Test metrics module can be imported."""
-    # Skip this test as Prometheus metrics are registered globally
-    # and cause duplication errors when imported multiple times in tests
-    # The metrics work correctly in the actual application
-    pass
+    """Test metrics helpers record into the default registry."""
+    from prometheus_client import REGISTRY
+    # Metrics register globally at import, so import the module under the
+    # application's own name; a second copy as utils.metrics would register
+    # every metric again and fail
+    from src.utils import metrics
+
+    labels = {"sender_type": "TEST"}
+    before = REGISTRY.get_sample_value("bot_messages_received_total", labels) or 0.0
+
+    metrics.record_message_received("TEST")
+
+    assert REGISTRY.get_sample_value("bot_messages_received_total", labels) == before + 1
+    assert b"bot_messages_received_total" in metrics.get_metrics()
+
+
+def test_ttl_cache_expiry_and_eviction():
+    """Test TTL cache expires entries and evicts least recently used."""
+    from utils.cache import TTLCache
+
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is now least recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    expired = TTLCache(ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+async def test_async_ttl_cache_coalesces_loads():
+    """Test concurrent misses on one key share a single load."""
+    import asyncio
+    from utils.cache import AsyncTTLCache
+
+    cache = AsyncTTLCache(ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert not cache._locks
+
+
+async def test_async_ttl_cache_failed_load_keeps_coalescing():
+    """Test a caller arriving after a failed load queues behind existing waiters."""
+    import asyncio
+    from utils.cache import AsyncTTLCache
+
+    cache = AsyncTTLCache(ttl=60)
+    calls = 0
+    active = 0
+    peak = 0
+
+    async def loader():
+        nonlocal calls, active, peak
+        calls += 1
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0)
+            if calls == 1:
+                raise RuntimeError("backend down")
+            return "value"
+        finally:
+            active -= 1
+
+    async def first_caller():
+        try:
+            return await cache.get_or_load("k", loader)
+        except RuntimeError:
+            # Retry straight away, while the other callers are still queued
+            return await cache.get_or_load("k", loader)
+
+    results = await asyncio.gather(
+        first_caller(), *(cache.get_or_load("k", loader) for _ in range(3))
+    )
+
+    assert results == ["value"] * 4
+    assert calls == 2
+    assert peak == 1
+    assert not cache._locks
+
+
+def test_proof_asset_cache_tracks_usage():
+    """Test usage increments swap in updated snapshots, leaving the old ones intact."""
+    import uuid
+    from datetime import datetime
+    from repositories.proof_asset_repository import (
+        ProofAsset,
+        ProofAssetSnapshot,
+        _asset_list_cache,
+        _refresh_cached_usage,
+        invalidate_proof_asset_cache,
+    )
+
+    asset_id = uuid.uuid4()
+    cached = ProofAssetSnapshot.from_model(
+        ProofAsset(id=asset_id, project_type="Shop ", usage_count=3, last_used_at=None)
+    )
+    key = ("matching", "e-commerce")
+    _asset_list_cache.set(key, (cached,))
+
+    try:
+        used_at = datetime.utcnow()
+        _refresh_cached_usage(ProofAsset(id=asset_id, usage_count=4, last_used_at=used_at))
+
+        (fresh,) = _asset_list_cache.get(key)
+        assert (fresh.usage_count, fresh.last_used_at) == (4, used_at)
+        assert fresh.normalized_project_type == "shop"
+        assert cached.usage_count == 3
+    finally:
+        invalidate_proof_asset_cache()
+
+
+async def test_state_logger_bulk_insert_maps_columns():
+    """Test bulk transitions go out as one executemany with model column names."""
+    import uuid
+    from datetime import datetime
+    from unittest.mock import AsyncMock
+    from utils.state_logger import State, StateLogger, StateTransition
+
+    session = AsyncMock()
+    conversation_id = uuid.uuid4()
+    earlier = datetime(2024, 1, 1, 12, 0)
+    now = datetime(2024, 1, 2, 9, 30)
+
+    with patch("utils.state_logger.datetime") as mock_datetime:
+        mock_datetime.utcnow.return_value = now
+        count = await StateLogger(session).log_transitions_bulk([
+            {
+                "conversation_id": conversation_id,
+                "from_state": State.GREETING,
+                "to_state": State.INTENT_DETECTION,
+                "trigger": "message",
+                "metadata": {"intent": "greeting"},
+                "transitioned_at": earlier,
+            },
+            {
+                "conversation_id": conversation_id,
+                "from_state": State.INTENT_DETECTION,
+                "to_state": State.QUALIFICATION,
+            },
+        ])
+
+    assert count == 2
+    session.execute.assert_awaited_once()
+    stmt, rows = session.execute.await_args.args
+    assert stmt.table is StateTransition.__table__
+    assert rows == [
+        {
+            "conversation_id": conversation_id,
+            "from_state": State.GREETING,
+            "to_state": State.INTENT_DETECTION,
+            "trigger": "message",
+            "extra_metadata": {"intent": "greeting"},
+            "transitioned_at": earlier,
+        },
+        {
+            "conversation_id": conversation_id,
+            "from_state": State.INTENT_DETECTION,
+            "to_state": State.QUALIFICATION,
+            "trigger": None,
+            "extra_metadata": None,
+            "transitioned_at": now,
+        },
+    ]
+
+
+async def test_state_logger_bulk_insert_skips_empty():
+    """Test an empty batch issues no statement."""
+    from unittest.mock import AsyncMock
+    from utils.state_logger import StateLogger
+
+    session = AsyncMock()
+
+    assert await StateLogger(session).log_transitions_bulk([]) == 0
+    session.execute.assert_not_awaited()